@@ -0,0 +1,346 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint, cstr, flt, get_first_day, getdate, now
+
+from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
+	get_accounting_dimensions,
+)
+
+SNAPSHOT_KEY_FIELDS = (
+	"company",
+	"account",
+	"account_currency",
+	"party_type",
+	"party",
+	"cost_center",
+	"project",
+	"finance_book",
+)
+AMOUNT_FIELDS = ("debit", "credit", "debit_in_account_currency", "credit_in_account_currency")
+
+
+class AccountBalanceSnapshot(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		account: DF.Link | None
+		account_currency: DF.Link | None
+		company: DF.Link | None
+		cost_center: DF.Link | None
+		credit: DF.Currency
+		credit_in_account_currency: DF.Float
+		debit: DF.Currency
+		debit_in_account_currency: DF.Float
+		finance_book: DF.Link | None
+		is_opening: DF.Literal["No", "Yes"]
+		is_period_closing_voucher_entry: DF.Check
+		party: DF.DynamicLink | None
+		party_type: DF.Link | None
+		period_start_date: DF.Date | None
+		project: DF.Link | None
+	# end: auto-generated types
+
+	pass
+
+
+def is_snapshot_enabled():
+	"""Snapshots are maintained on posting as soon as they are enabled"""
+	return cint(frappe.db.get_single_value("Accounts Settings", "use_account_balance_snapshots"))
+
+
+def is_snapshot_ready():
+	"""Balances are read from the snapshots only once they are built from the General Ledger"""
+	return is_snapshot_enabled() and cint(
+		frappe.db.get_single_value("Accounts Settings", "account_balance_snapshots_ready")
+	)
+
+
+def get_snapshot_key_fields():
+	return SNAPSHOT_KEY_FIELDS + tuple(get_accounting_dimensions())
+
+
+def get_snapshot_key(entry, key_fields):
+	return tuple(cstr(entry.get(field)) for field in key_fields) + (
+		entry.get("is_opening") or "No",
+		cint(entry.get("voucher_type") == "Period Closing Voucher"),
+		get_first_day(entry.get("posting_date")),
+	)
+
+
+def update_account_balance_snapshots(gl_entries, cancel=False):
+	"""Add the GL Entries to (or remove them from, on cancel) the monthly balance snapshots"""
+
+	clear_balance_cache()
+
+	if not gl_entries or not is_snapshot_enabled():
+		return
+
+	sign = -1 if cancel else 1
+	key_fields = get_snapshot_key_fields()
+	totals = {}
+	for entry in gl_entries:
+		if not cancel and cint(entry.get("is_cancelled")):
+			continue
+
+		key = get_snapshot_key(entry, key_fields)
+
+		amounts = totals.setdefault(key, dict.fromkeys(AMOUNT_FIELDS, 0.0))
+		for field in AMOUNT_FIELDS:
+			amounts[field] += sign * flt(entry.get(field))
+
+	add_to_snapshots(key_fields, totals)
+
+
+def add_to_snapshots(key_fields, totals):
+	snapshot = frappe.qb.DocType("Account Balance Snapshot")
+	for key, amounts in totals.items():
+		name = get_or_make_snapshot(key_fields, key)
+
+		# increment in the database to not lose concurrent postings
+		query = frappe.qb.update(snapshot).where(snapshot.name == name)
+		for field, amount in amounts.items():
+			query = query.set(snapshot[field], snapshot[field] + amount)
+		query.run()
+
+
+def get_or_make_snapshot(key_fields, key):
+	*key_values, is_opening, is_period_closing_voucher_entry, period_start_date = key
+	filters = {
+		"is_opening": is_opening,
+		"is_period_closing_voucher_entry": is_period_closing_voucher_entry,
+		"period_start_date": period_start_date,
+	}
+	for field, value in zip(key_fields, key_values):
+		filters[field] = value or ("is", "not set")
+
+	if name := frappe.db.get_value("Account Balance Snapshot", filters):
+		return name
+
+	# no unique constraint, concurrent inserts may create more than one snapshot for a key,
+	# which is harmless since balances are always summed over the snapshots
+	snapshot = frappe.new_doc("Account Balance Snapshot")
+	snapshot.update({field: value or None for field, value in zip(key_fields, key_values)})
+	snapshot.is_opening = is_opening
+	snapshot.is_period_closing_voucher_entry = is_period_closing_voucher_entry
+	snapshot.period_start_date = period_start_date
+	snapshot.flags.ignore_permissions = True
+	snapshot.flags.ignore_links = True
+	snapshot.insert()
+
+	return snapshot.name
+
+
+def get_gl_entries_for_snapshot(voucher_type, voucher_no):
+	return frappe.get_all(
+		"GL Entry",
+		filters={"voucher_type": voucher_type, "voucher_no": voucher_no, "is_cancelled": 0},
+		fields=[
+			"posting_date",
+			"voucher_type",
+			"is_opening",
+			*get_snapshot_key_fields(),
+			*AMOUNT_FIELDS,
+		],
+	)
+
+
+def remove_voucher_from_snapshots(voucher_type, voucher_no):
+	"""To be called before the GL Entries of a voucher are cancelled or deleted"""
+	if is_snapshot_enabled():
+		update_account_balance_snapshots(
+			get_gl_entries_for_snapshot(voucher_type, voucher_no), cancel=True
+		)
+	else:
+		clear_balance_cache()
+
+
+def get_balance_from_snapshots(select_field, conditions, date=None):
+	"""Returns balance from the snapshots of closed months plus the GL Entries of the current month.
+
+	`conditions` are the sql conditions on the account, party, cost center and company
+	with `gle` as table alias, as built by `get_balance_on`."""
+
+	month_start = get_first_day(date) if date else None
+
+	snapshot_conditions = list(conditions)
+	if month_start:
+		snapshot_conditions.append("period_start_date < %s" % frappe.db.escape(cstr(month_start)))
+
+	balance = flt(
+		frappe.db.sql(
+			"""
+			SELECT {0}
+			FROM `tabAccount Balance Snapshot` gle
+			WHERE {1}""".format(
+				select_field, " and ".join(snapshot_conditions) or "1=1"
+			)
+		)[0][0]
+	)
+
+	if month_start:
+		gl_conditions = [
+			"is_cancelled=0",
+			"posting_date >= %s" % frappe.db.escape(cstr(month_start)),
+			"posting_date <= %s" % frappe.db.escape(cstr(getdate(date))),
+		] + list(conditions)
+
+		balance += flt(
+			frappe.db.sql(
+				"""
+				SELECT {0}
+				FROM `tabGL Entry` gle
+				WHERE {1}""".format(
+					select_field, " and ".join(gl_conditions)
+				)
+			)[0][0]
+		)
+
+	return balance
+
+
+def get_cached_balance(key):
+	return (frappe.flags.account_balance_cache or {}).get(key)
+
+
+def set_cached_balance(key, balance):
+	if frappe.flags.account_balance_cache is None:
+		frappe.flags.account_balance_cache = {}
+
+	frappe.flags.account_balance_cache[key] = balance
+
+
+def clear_balance_cache():
+	frappe.flags.account_balance_cache = None
+
+
+def build_account_balance_snapshots():
+	"""Background job run when the snapshots are enabled. Balances are read from the snapshots
+	only after it has committed them."""
+
+	if not is_snapshot_enabled():
+		return
+
+	rebuild_account_balance_snapshots()
+	frappe.db.commit()
+
+	if is_snapshot_enabled():
+		frappe.db.set_single_value("Accounts Settings", "account_balance_snapshots_ready", 1)
+		frappe.db.commit()
+
+
+def rebuild_account_balance_snapshots(company=None):
+	"""Reconcile the snapshots with the General Ledger.
+
+	The snapshots are not deleted, each one is corrected by the difference between the ledger
+	and the snapshot totals, read together in a single statement. A posting committed while
+	this runs is in neither of the totals and keeps the amounts it has added itself."""
+
+	key_fields = get_snapshot_key_fields()
+	differences = {}
+	existing_keys = set()
+	for d in get_ledger_and_snapshot_differences(key_fields, company):
+		key = tuple(cstr(d.get(field)) for field in key_fields) + (
+			d.is_opening or "No",
+			cint(d.is_period_closing_voucher_entry),
+			getdate(f"{cint(d.year)}-{cint(d.month):02d}-01"),
+		)
+
+		amounts = differences.setdefault(key, dict.fromkeys(AMOUNT_FIELDS, 0.0))
+		for field in AMOUNT_FIELDS:
+			amounts[field] += flt(d.get(field))
+
+		if cint(d.has_snapshot):
+			existing_keys.add(key)
+
+	differences = {
+		key: amounts
+		for key, amounts in differences.items()
+		if any(flt(amount, 9) for amount in amounts.values())
+	}
+
+	add_to_snapshots(
+		key_fields, {key: amounts for key, amounts in differences.items() if key in existing_keys}
+	)
+
+	fields = ["name", "creation", "modified", "owner", "modified_by", "period_start_date"]
+	fields += ["is_opening", "is_period_closing_voucher_entry"]
+	fields += list(key_fields) + list(AMOUNT_FIELDS)
+
+	timestamp = now()
+	user = frappe.session.user
+	values = []
+	for key, amounts in differences.items():
+		if key in existing_keys:
+			continue
+
+		*key_values, is_opening, is_period_closing_voucher_entry, period_start_date = key
+		row = [
+			frappe.generate_hash(length=10),
+			timestamp,
+			timestamp,
+			user,
+			user,
+			period_start_date,
+			is_opening,
+			is_period_closing_voucher_entry,
+		]
+		row += [value or None for value in key_values]
+		row += [amounts[field] for field in AMOUNT_FIELDS]
+		values.append(row)
+
+	frappe.db.bulk_insert("Account Balance Snapshot", fields=fields, values=values)
+	clear_balance_cache()
+
+
+def get_ledger_and_snapshot_differences(key_fields, company=None):
+	"""Returns the monthly ledger totals less the snapshot totals, as one statement so that
+	both are read at the same point in time"""
+
+	key_columns = ", ".join(f"`{field}`" for field in key_fields)
+	amount_columns = ", ".join(f"`{field}`" for field in AMOUNT_FIELDS)
+	negated_amount_columns = ", ".join(f"-`{field}` as `{field}`" for field in AMOUNT_FIELDS)
+	summed_amount_columns = ", ".join(f"sum(`{field}`) as `{field}`" for field in AMOUNT_FIELDS)
+	company_condition = "and company = %(company)s" if company else ""
+
+	return frappe.db.sql(
+		f"""
+		SELECT {key_columns}, is_opening, is_period_closing_voucher_entry, year, month,
+			{summed_amount_columns}, max(has_snapshot) as has_snapshot
+		FROM (
+			SELECT {key_columns},
+				coalesce(is_opening, 'No') as is_opening,
+				case when voucher_type = 'Period Closing Voucher' then 1 else 0 end
+					as is_period_closing_voucher_entry,
+				extract(year from posting_date) as year,
+				extract(month from posting_date) as month,
+				{amount_columns}, 0 as has_snapshot
+			FROM `tabGL Entry`
+			WHERE is_cancelled = 0 {company_condition}
+			UNION ALL
+			SELECT {key_columns},
+				is_opening,
+				is_period_closing_voucher_entry,
+				extract(year from period_start_date) as year,
+				extract(month from period_start_date) as month,
+				{negated_amount_columns}, 1 as has_snapshot
+			FROM `tabAccount Balance Snapshot`
+			WHERE 1 = 1 {company_condition}
+		) balances
+		GROUP BY {key_columns}, is_opening, is_period_closing_voucher_entry, year, month
+		""",
+		{"company": company},
+		as_dict=True,
+	)
+
+
+def on_doctype_update():
+	frappe.db.add_index("Account Balance Snapshot", ["company", "account", "period_start_date"])
+	frappe.db.add_index("Account Balance Snapshot", ["party_type", "party"])
@@ -0,0 +1,122 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase, change_settings
+from frappe.utils import add_days, add_months, get_first_day, nowdate
+
+from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+	clear_balance_cache,
+	rebuild_account_balance_snapshots,
+)
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
+from erpnext.accounts.utils import get_balance_on
+
+
+class TestAccountBalanceSnapshot(FrappeTestCase):
+	def get_balances(self, dates):
+		balances = {}
+		for account in ("_Test Bank - _TC", "_Test Account Cost for Goods Sold - _TC", "Current Assets - _TC"):
+			for date in dates:
+				clear_balance_cache()
+				balances[(account, date)] = get_balance_on(account, date, company="_Test Company")
+				balances[(account, date, "cost_center")] = get_balance_on(
+					account, date, company="_Test Company", cost_center="_Test Cost Center - _TC"
+				)
+
+		return balances
+
+	def test_balance_from_snapshots_matches_general_ledger(self):
+		month_start = get_first_day(nowdate())
+		dates = [
+			add_months(month_start, -2),
+			add_days(month_start, -1),
+			month_start,
+			nowdate(),
+			None,
+		]
+
+		make_journal_entry(
+			"_Test Bank - _TC",
+			"_Test Account Cost for Goods Sold - _TC",
+			-300,
+			posting_date=add_months(month_start, -1),
+			submit=True,
+		)
+		je = make_journal_entry(
+			"_Test Bank - _TC",
+			"_Test Account Cost for Goods Sold - _TC",
+			-200,
+			posting_date=nowdate(),
+			submit=True,
+		)
+
+		expected = self.get_balances(dates)
+
+		with change_settings("Accounts Settings", {"use_account_balance_snapshots": 1}):
+			rebuild_account_balance_snapshots("_Test Company")
+			set_snapshots_ready()
+			self.assertEqual(self.get_balances(dates), expected)
+
+			# snapshots are maintained on posting and cancellation
+			make_journal_entry(
+				"_Test Bank - _TC",
+				"_Test Account Cost for Goods Sold - _TC",
+				-100,
+				posting_date=add_months(month_start, -1),
+				submit=True,
+			)
+			je.cancel()
+			with_snapshots = self.get_balances(dates)
+
+		self.assertEqual(with_snapshots, self.get_balances(dates))
+		self.assertNotEqual(with_snapshots, expected)
+
+	def test_balance_from_general_ledger_until_snapshots_are_ready(self):
+		make_journal_entry(
+			"_Test Bank - _TC", "_Test Account Cost for Goods Sold - _TC", -300, submit=True
+		)
+		expected = self.get_balances([nowdate()])
+
+		with change_settings("Accounts Settings", {"use_account_balance_snapshots": 1}):
+			frappe.db.delete("Account Balance Snapshot", {"company": "_Test Company"})
+
+			self.assertFalse(
+				frappe.db.get_single_value("Accounts Settings", "account_balance_snapshots_ready")
+			)
+			self.assertEqual(self.get_balances([nowdate()]), expected)
+
+	def test_rebuild_corrects_snapshots_without_counting_twice(self):
+		make_journal_entry(
+			"_Test Bank - _TC", "_Test Account Cost for Goods Sold - _TC", -300, submit=True
+		)
+		expected = self.get_balances([nowdate()])
+
+		with change_settings("Accounts Settings", {"use_account_balance_snapshots": 1}):
+			rebuild_account_balance_snapshots("_Test Company")
+			set_snapshots_ready()
+
+			# a snapshot gone out of step with the ledger is corrected by the difference
+			snapshot = frappe.db.get_value(
+				"Account Balance Snapshot",
+				{"company": "_Test Company", "account": "_Test Bank - _TC"},
+				["name", "debit", "debit_in_account_currency"],
+				as_dict=True,
+			)
+			frappe.db.set_value(
+				"Account Balance Snapshot",
+				snapshot.name,
+				{
+					"debit": snapshot.debit + 50,
+					"debit_in_account_currency": snapshot.debit_in_account_currency + 50,
+				},
+			)
+			self.assertNotEqual(self.get_balances([nowdate()]), expected)
+
+			rebuild_account_balance_snapshots("_Test Company")
+			rebuild_account_balance_snapshots("_Test Company")
+			self.assertEqual(self.get_balances([nowdate()]), expected)
+
+
+def set_snapshots_ready():
+	frappe.db.set_single_value("Accounts Settings", "account_balance_snapshots_ready", 1)
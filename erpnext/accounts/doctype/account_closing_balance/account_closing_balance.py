@@ -3,7 +3,7 @@
 
 import frappe
 from frappe.model.document import Document
-from frappe.utils import cint, cstr
+from frappe.utils import cint, cstr, flt, now
 
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
@@ -49,19 +49,69 @@ def make_closing_entries(closing_entries, voucher_name, company, closing_date):
 		combined_entries, accounting_dimensions
 	)
 
-	for key, value in merged_entries.items():
-		cle = frappe.new_doc("Account Closing Balance")
-		cle.update(value)
-		cle.update(value["dimensions"])
-		cle.update(
-			{
-				"period_closing_voucher": voucher_name,
-				"closing_date": closing_date,
-			}
-		)
-		cle.flags.ignore_permissions = True
-		cle.flags.ignore_links = True
-		cle.submit()
+	insert_closing_balances(merged_entries, voucher_name, closing_date, accounting_dimensions)
+
+
+def insert_closing_balances(merged_entries, voucher_name, closing_date, accounting_dimensions):
+	"""Insert the merged closing balances with multi-row inserts.
+
+	A year-end closing can produce hundreds of thousands of rows (one per account and
+	dimension combination), inserting them as documents one by one is far too slow."""
+
+	fields = [
+		"name",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+		"docstatus",
+		"period_closing_voucher",
+		"closing_date",
+		"company",
+		"account",
+		"account_currency",
+		"cost_center",
+		"project",
+		"finance_book",
+		"is_period_closing_voucher_entry",
+		"debit",
+		"credit",
+		"debit_in_account_currency",
+		"credit_in_account_currency",
+	] + accounting_dimensions
+
+	timestamp = now()
+	user = frappe.session.user
+
+	values = []
+	for value in merged_entries.values():
+		dimensions = value["dimensions"]
+		row = [
+			frappe.generate_hash(length=10),
+			timestamp,
+			timestamp,
+			user,
+			user,
+			1,
+			voucher_name,
+			closing_date,
+			dimensions["company"],
+			dimensions["account"],
+			dimensions["account_currency"],
+			dimensions["cost_center"],
+			dimensions["project"],
+			dimensions["finance_book"],
+			dimensions["is_period_closing_voucher_entry"],
+			flt(value["debit"]),
+			flt(value["credit"]),
+			flt(value["debit_in_account_currency"]),
+			flt(value["credit_in_account_currency"]),
+		]
+
+		row.extend(dimensions.get(dimension) for dimension in accounting_dimensions)
+		values.append(row)
+
+	frappe.db.bulk_insert("Account Closing Balance", fields=fields, values=values)
 
 
 def aggregate_with_last_account_closing_balance(entries, accounting_dimensions):
@@ -23,6 +23,7 @@ class AccountsSettings(Document):
 		from frappe.types import DF
 
 		acc_frozen_upto: DF.Date | None
+		account_balance_snapshots_ready: DF.Check
 		add_taxes_from_item_tax_template: DF.Check
 		allow_multi_currency_invoices_against_single_party_account: DF.Check
 		allow_stale: DF.Check
@@ -58,6 +59,7 @@ class AccountsSettings(Document):
 		submit_journal_entries: DF.Check
 		unlink_advance_payment_on_cancelation_of_order: DF.Check
 		unlink_payment_on_cancellation_of_invoice: DF.Check
+		use_account_balance_snapshots: DF.Check
 	# end: auto-generated types
 
 	def validate(self):
@@ -84,6 +86,12 @@ class AccountsSettings(Document):
 		if old_doc.acc_frozen_upto != self.acc_frozen_upto:
 			self.validate_pending_reposts()
 
+		if old_doc.use_account_balance_snapshots != self.use_account_balance_snapshots:
+			# balances are read from the General Ledger until the snapshots are built
+			self.account_balance_snapshots_ready = 0
+			if self.use_account_balance_snapshots:
+				self.rebuild_account_balance_snapshots()
+
 		if clear_cache:
 			frappe.clear_cache()
 
@@ -108,6 +116,22 @@ class AccountsSettings(Document):
 				validate_fields_for_doctype=False,
 			)
 
+	def rebuild_account_balance_snapshots(self):
+		frappe.enqueue(
+			"erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot.build_account_balance_snapshots",
+			queue="long",
+			timeout=3600,
+			job_id="build_account_balance_snapshots",
+			deduplicate=True,
+			enqueue_after_commit=True,
+		)
+		frappe.msgprint(
+			_(
+				"Account Balance Snapshots will be built in the background, balances are computed from the General Ledger until then."
+			),
+			alert=True,
+		)
+
 	def validate_pending_reposts(self):
 		if self.acc_frozen_upto:
 			check_pending_reposting(self.acc_frozen_upto)
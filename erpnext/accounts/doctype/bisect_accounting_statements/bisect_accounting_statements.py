@@ -1,6 +1,7 @@
 # Copyright (c) 2023, Frappe Technologies Pvt. Ltd. and contributors
 # For license information, please see license.txt
 
+import bisect
 import datetime
 from collections import deque
 from math import floor
@@ -9,9 +10,13 @@ import frappe
 from dateutil.relativedelta import relativedelta
 from frappe import _
 from frappe.model.document import Document
-from frappe.utils import getdate
+from frappe.query_builder import Case
+from frappe.query_builder.functions import Sum
+from frappe.utils import add_days, flt, getdate
 from frappe.utils.data import guess_date_format
 
+ROOT_TYPES = ("Asset", "Liability", "Equity", "Income", "Expense")
+
 
 class BisectAccountingStatements(Document):
 	# begin: auto-generated types
@@ -34,6 +39,8 @@ class BisectAccountingStatements(Document):
 		to_date: DF.Datetime | None
 	# end: auto-generated types
 
+	balance_deltas = None
+
 	def validate(self):
 		self.validate_dates()
 
@@ -45,13 +52,26 @@ class BisectAccountingStatements(Document):
 				)
 			)
 
-	def bfs(self, from_date: datetime, to_date: datetime):
-		# Make Root node
+	def make_node(self, from_date: datetime, to_date: datetime, root=None):
 		node = frappe.new_doc("Bisect Nodes")
-		node.root = None
+		node.root = root
 		node.period_from_date = from_date
 		node.period_to_date = to_date
+		node.generated = False
+
+		if self.balance_deltas:
+			node.profit_loss_summary, node.balance_sheet_summary = self.balance_deltas.get_summary(
+				from_date, to_date
+			)
+			node.difference = abs(node.profit_loss_summary - node.balance_sheet_summary)
+			node.generated = True
+
 		node.insert()
+		return node
+
+	def bfs(self, from_date: datetime, to_date: datetime):
+		# Make Root node
+		node = self.make_node(from_date, to_date)
 
 		period_queue = deque([node])
 		while period_queue:
@@ -62,22 +82,12 @@ class BisectAccountingStatements(Document):
 			else:
 				cur_floor = floor(delta.days / 2)
 				next_to_date = cur_node.period_from_date + relativedelta(days=+cur_floor)
-				left_node = frappe.new_doc("Bisect Nodes")
-				left_node.period_from_date = cur_node.period_from_date
-				left_node.period_to_date = next_to_date
-				left_node.root = cur_node.name
-				left_node.generated = False
-				left_node.insert()
+				left_node = self.make_node(cur_node.period_from_date, next_to_date, cur_node.name)
 				cur_node.left_child = left_node.name
 				period_queue.append(left_node)
 
 				next_from_date = cur_node.period_from_date + relativedelta(days=+(cur_floor + 1))
-				right_node = frappe.new_doc("Bisect Nodes")
-				right_node.period_from_date = next_from_date
-				right_node.period_to_date = cur_node.period_to_date
-				right_node.root = cur_node.name
-				right_node.generated = False
-				right_node.insert()
+				right_node = self.make_node(next_from_date, cur_node.period_to_date, cur_node.name)
 				cur_node.right_child = right_node.name
 				period_queue.append(right_node)
 
@@ -85,11 +95,7 @@ class BisectAccountingStatements(Document):
 
 	def dfs(self, from_date: datetime, to_date: datetime):
 		# Make Root node
-		node = frappe.new_doc("Bisect Nodes")
-		node.root = None
-		node.period_from_date = from_date
-		node.period_to_date = to_date
-		node.insert()
+		node = self.make_node(from_date, to_date)
 
 		period_stack = [node]
 		while period_stack:
@@ -100,22 +106,12 @@ class BisectAccountingStatements(Document):
 			else:
 				cur_floor = floor(delta.days / 2)
 				next_to_date = cur_node.period_from_date + relativedelta(days=+cur_floor)
-				left_node = frappe.new_doc("Bisect Nodes")
-				left_node.period_from_date = cur_node.period_from_date
-				left_node.period_to_date = next_to_date
-				left_node.root = cur_node.name
-				left_node.generated = False
-				left_node.insert()
+				left_node = self.make_node(cur_node.period_from_date, next_to_date, cur_node.name)
 				cur_node.left_child = left_node.name
 				period_stack.append(left_node)
 
 				next_from_date = cur_node.period_from_date + relativedelta(days=+(cur_floor + 1))
-				right_node = frappe.new_doc("Bisect Nodes")
-				right_node.period_from_date = next_from_date
-				right_node.period_to_date = cur_node.period_to_date
-				right_node.root = cur_node.name
-				right_node.generated = False
-				right_node.insert()
+				right_node = self.make_node(next_from_date, cur_node.period_to_date, cur_node.name)
 				cur_node.right_child = right_node.name
 				period_stack.append(right_node)
 
@@ -130,6 +126,9 @@ class BisectAccountingStatements(Document):
 		from_date = datetime.datetime.strptime(self.from_date, dt_format)
 		to_date = datetime.datetime.strptime(self.to_date, dt_format)
 
+		# every node summary is a lookup into the same daily balance series
+		self.balance_deltas = DailyBalanceDeltas(self.company, to_date)
+
 		if self.algorithm == "BFS":
 			self.bfs(from_date, to_date)
 
@@ -138,24 +137,17 @@ class BisectAccountingStatements(Document):
 
 		# set root as current node
 		root = frappe.db.get_all("Bisect Nodes", filters={"root": ["is", "not set"]})[0]
-		self.get_report_summary()
 		self.current_node = root.name
 		self.current_from_date = self.from_date
 		self.current_to_date = self.to_date
+		self.fetch_summary_info_from_current_node()
 		self.save()
 
 	def get_report_summary(self):
-		filters = {
-			"company": self.company,
-			"filter_based_on": "Date Range",
-			"period_start_date": self.current_from_date,
-			"period_end_date": self.current_to_date,
-			"periodicity": "Yearly",
-		}
-		pl_summary = frappe.get_doc("Report", "Profit and Loss Statement")
-		self.p_l_summary = pl_summary.execute_script_report(filters=filters)[5]
-		bs_summary = frappe.get_doc("Report", "Balance Sheet")
-		self.b_s_summary = bs_summary.execute_script_report(filters=filters)[5]
+		balance_deltas = self.balance_deltas or DailyBalanceDeltas(self.company, self.to_date)
+		self.p_l_summary, self.b_s_summary = balance_deltas.get_summary(
+			self.current_from_date, self.current_to_date
+		)
 		self.difference = abs(self.p_l_summary - self.b_s_summary)
 
 	def update_node(self):
@@ -172,8 +164,8 @@ class BisectAccountingStatements(Document):
 
 	def fetch_summary_info_from_current_node(self):
 		current_node = frappe.get_doc("Bisect Nodes", self.current_node)
-		self.p_l_summary = current_node.balance_sheet_summary
-		self.b_s_summary = current_node.profit_loss_summary
+		self.p_l_summary = current_node.profit_loss_summary
+		self.b_s_summary = current_node.balance_sheet_summary
 		self.difference = abs(self.p_l_summary - self.b_s_summary)
 
 	def fetch_or_calculate(self):
@@ -224,3 +216,97 @@ class BisectAccountingStatements(Document):
 				self.save()
 			else:
 				frappe.msgprint(_("Reached Root"))
+
+
+class DailyBalanceDeltas:
+	"""Running balances per root type of a company, built from its GL Entries grouped by day.
+
+	Summaries match the Profit and Loss Statement and the Balance Sheet: net profit over
+	the period and the closing asset, liability and equity balances at its end."""
+
+	def __init__(self, company, to_date):
+		self.dates = []
+		# cumulative debit - credit, all entries for balance sheet and
+		# without opening and period closing entries for profit and loss
+		self.balances = {root_type: [] for root_type in ROOT_TYPES}
+		self.pl_balances = {root_type: [] for root_type in ROOT_TYPES}
+
+		running_balance = dict.fromkeys(ROOT_TYPES, 0.0)
+		running_pl_balance = dict.fromkeys(ROOT_TYPES, 0.0)
+		for posting_date, deltas in self.get_daily_deltas(company, to_date):
+			for root_type, (balance, pl_balance) in deltas.items():
+				running_balance[root_type] += balance
+				running_pl_balance[root_type] += pl_balance
+
+			self.dates.append(posting_date)
+			for root_type in ROOT_TYPES:
+				self.balances[root_type].append(running_balance[root_type])
+				self.pl_balances[root_type].append(running_pl_balance[root_type])
+
+	def get_daily_deltas(self, company, to_date):
+		gle = frappe.qb.DocType("GL Entry")
+		account = frappe.qb.DocType("Account")
+		balance = gle.debit - gle.credit
+
+		data = (
+			frappe.qb.from_(gle)
+			.inner_join(account)
+			.on(gle.account == account.name)
+			.select(
+				gle.posting_date,
+				account.root_type,
+				Sum(balance).as_("balance"),
+				Sum(
+					Case()
+					.when(
+						(gle.voucher_type == "Period Closing Voucher") | (gle.is_opening == "Yes"),
+						0,
+					)
+					.else_(balance)
+				).as_("pl_balance"),
+			)
+			.where(
+				(gle.company == company)
+				& (gle.is_cancelled == 0)
+				& (gle.posting_date <= getdate(to_date))
+				& (account.root_type.isin(ROOT_TYPES))
+			)
+			.groupby(gle.posting_date, account.root_type)
+			.orderby(gle.posting_date)
+			.run(as_dict=True)
+		)
+
+		daily_deltas = {}
+		for d in data:
+			daily_deltas.setdefault(d.posting_date, {})[d.root_type] = (
+				flt(d.balance),
+				flt(d.pl_balance),
+			)
+
+		return daily_deltas.items()
+
+	def get_balance(self, root_type, date, profit_loss=False):
+		"""Cumulative debit - credit of the root type up to and including date"""
+		idx = bisect.bisect_right(self.dates, getdate(date))
+		if not idx:
+			return 0.0
+
+		balances = self.pl_balances if profit_loss else self.balances
+		return balances[root_type][idx - 1]
+
+	def get_summary(self, from_date, to_date):
+		"""Returns (profit and loss summary, balance sheet summary) for the period"""
+		day_before = add_days(getdate(from_date), -1)
+
+		def get_movement(root_type):
+			return self.get_balance(root_type, to_date, True) - self.get_balance(
+				root_type, day_before, True
+			)
+
+		net_profit = -get_movement("Income") - get_movement("Expense")
+
+		asset = self.get_balance("Asset", to_date)
+		liability = -self.get_balance("Liability", to_date)
+		equity = -self.get_balance("Equity", to_date)
+
+		return flt(net_profit, 2), flt(asset - liability + equity, 2)
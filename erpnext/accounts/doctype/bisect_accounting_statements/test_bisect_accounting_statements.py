@@ -1,9 +1,36 @@
 # Copyright (c) 2023, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, today
+
+from erpnext.accounts.doctype.bisect_accounting_statements.bisect_accounting_statements import (
+	DailyBalanceDeltas,
+)
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
 
 
 class TestBisectAccountingStatements(FrappeTestCase):
-	pass
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_daily_balance_summary(self):
+		company = "_Test Company"
+		posting_date = today()
+
+		def get_summaries():
+			balance_deltas = DailyBalanceDeltas(company, posting_date)
+			return (
+				balance_deltas.get_summary(posting_date, posting_date),
+				balance_deltas.get_summary(add_days(posting_date, -1), add_days(posting_date, -1)),
+			)
+
+		before, previous_day_before = get_summaries()
+		make_journal_entry("_Test Bank - _TC", "Sales - _TC", 100, posting_date=posting_date, submit=True)
+		after, previous_day_after = get_summaries()
+
+		# net profit of the day and closing assets both go up
+		self.assertEqual(after[0] - before[0], 100)
+		self.assertEqual(after[1] - before[1], 100)
+		self.assertEqual(previous_day_after, previous_day_before)
@@ -15,6 +15,8 @@ from erpnext.accounts.doctype.journal_entry.journal_entry import get_balance_on
 from erpnext.accounts.utils import get_currency_precision
 from erpnext.setup.utils import get_exchange_rate
 
+REVALUATION_JV_CHUNK_SIZE = 500
+
 
 class ExchangeRateRevaluation(Document):
 	# begin: auto-generated types
@@ -115,23 +117,32 @@ class ExchangeRateRevaluation(Document):
 
 		return True
 
-	def fetch_and_calculate_accounts_data(self):
-		accounts = self.get_accounts_data()
+	def fetch_and_calculate_accounts_data(self, incremental=False):
+		accounts = self.get_accounts_data(incremental=incremental)
 		if accounts:
 			for acc in accounts:
 				self.append("accounts", acc)
 
 	@frappe.whitelist()
-	def get_accounts_data(self):
+	def get_accounts_data(self, incremental=False):
 		self.validate_mandatory()
-		account_details = self.get_account_balance_from_gle(
-			company=self.company,
-			posting_date=self.posting_date,
-			account=None,
-			party_type=None,
-			party=None,
-			rounding_loss_allowance=self.rounding_loss_allowance,
-		)
+
+		changes = self.get_changes_since_last_revaluation() if incremental else None
+		if changes:
+			account_details = self.get_changed_account_balances(changes)
+			if not account_details:
+				# nothing to revalue since the last revaluation
+				return []
+		else:
+			account_details = self.get_account_balance_from_gle(
+				company=self.company,
+				posting_date=self.posting_date,
+				account=None,
+				party_type=None,
+				party=None,
+				rounding_loss_allowance=self.rounding_loss_allowance,
+			)
+
 		accounts_with_new_balance = self.calculate_new_account_balance(
 			self.company, self.posting_date, account_details
 		)
@@ -141,34 +152,186 @@ class ExchangeRateRevaluation(Document):
 
 		return accounts_with_new_balance
 
+	def get_changes_since_last_revaluation(self):
+		"""Accounts and account-party pairs whose revaluation can differ from the last one.
+
+		Pairs without new ledger entries, in a currency whose rate did not change, were
+		brought to the same rate by the last revaluation. Returns None when everything has
+		to be revalued, e.g. when the last revaluation's gain or loss was not booked."""
+		last_revaluation = frappe.db.get_value(
+			"Exchange Rate Revaluation",
+			{
+				"company": self.company,
+				"docstatus": 1,
+				"posting_date": ("<=", self.posting_date),
+				"name": ("!=", self.name),
+			},
+			["name", "creation", "posting_date", "total_gain_loss"],
+			order_by="posting_date desc, creation desc",
+			as_dict=1,
+		)
+		if not last_revaluation:
+			return
+
+		journal_filters = {
+			"reference_type": "Exchange Rate Revaluation",
+			"reference_name": last_revaluation.name,
+		}
+		revaluation_journals = frappe.get_all(
+			"Journal Entry Account",
+			filters={**journal_filters, "docstatus": 1},
+			pluck="parent",
+			distinct=True,
+		)
+		if frappe.db.exists("Journal Entry Account", {**journal_filters, "docstatus": 0}) or (
+			last_revaluation.total_gain_loss and not revaluation_journals
+		):
+			return
+
+		company_currency = erpnext.get_company_currency(self.company)
+		last_rates = self.get_last_revaluation_rates(last_revaluation)
+
+		accounts_by_currency = {}
+		for account, account_currency in self.get_foreign_currency_accounts(
+			self.company, company_currency, with_currency=True
+		):
+			accounts_by_currency.setdefault(account_currency, []).append(account)
+
+		changes = frappe._dict({"accounts": [], "account_parties": set()})
+		unchanged_accounts = []
+		for account_currency, accounts in accounts_by_currency.items():
+			new_rate = flt(get_exchange_rate(account_currency, company_currency, self.posting_date), 9)
+			if last_rates.get(account_currency) == {new_rate}:
+				unchanged_accounts += accounts
+			else:
+				changes.accounts += accounts
+
+		if unchanged_accounts:
+			gle = qb.DocType("GL Entry")
+			query = (
+				qb.from_(gle)
+				.select(gle.account, gle.party_type, gle.party)
+				.distinct()
+				.where(
+					(gle.company == self.company)
+					& (gle.account.isin(unchanged_accounts))
+					& (gle.posting_date <= self.posting_date)
+					& (
+						(gle.creation > last_revaluation.creation)
+						| (gle.posting_date > last_revaluation.posting_date)
+					)
+				)
+			)
+			if revaluation_journals:
+				query = query.where(gle.voucher_no.notin(revaluation_journals))
+			changes.account_parties = set(query.run())
+
+		return changes
+
+	def get_last_revaluation_rates(self, last_revaluation):
+		"""Rates each currency was last revalued at. An incremental revaluation leaves out
+		currencies without changes, so older revaluations are looked up for those."""
+		err = qb.DocType("Exchange Rate Revaluation")
+		err_account = qb.DocType("Exchange Rate Revaluation Account")
+		rows = (
+			qb.from_(err_account)
+			.inner_join(err)
+			.on(err.name == err_account.parent)
+			.select(err.name, err_account.account_currency, err_account.new_exchange_rate)
+			.where(
+				(err.company == self.company)
+				& (err.docstatus == 1)
+				& (err.posting_date <= last_revaluation.posting_date)
+				& (err_account.zero_balance == 0)
+			)
+			.orderby(err.posting_date, order=Order.desc)
+			.orderby(err.creation, order=Order.desc)
+			.run(as_dict=True)
+		)
+
+		last_rates, revaluation_of_currency = {}, {}
+		for d in rows:
+			if revaluation_of_currency.setdefault(d.account_currency, d.name) == d.name:
+				last_rates.setdefault(d.account_currency, set()).add(flt(d.new_exchange_rate, 9))
+
+		return last_rates
+
+	def get_changed_account_balances(self, changes):
+		account_details = []
+		if changes.accounts:
+			account_details += self.get_account_balance_from_gle(
+				company=self.company,
+				posting_date=self.posting_date,
+				account=None,
+				party_type=None,
+				party=None,
+				rounding_loss_allowance=self.rounding_loss_allowance,
+				accounts=changes.accounts,
+			)
+
+		if changes.account_parties:
+			account_parties = {
+				(account, party_type or None, party or None)
+				for account, party_type, party in changes.account_parties
+			}
+			parties = {party for account, party_type, party in account_parties}
+
+			for d in self.get_account_balance_from_gle(
+				company=self.company,
+				posting_date=self.posting_date,
+				account=None,
+				party_type=None,
+				party=None,
+				rounding_loss_allowance=self.rounding_loss_allowance,
+				accounts=list({account for account, party_type, party in account_parties}),
+				parties=None if None in parties else list(parties),
+			):
+				if (d.account, d.party_type or None, d.party or None) in account_parties:
+					account_details.append(d)
+
+		return account_details
+
+	@staticmethod
+	def get_foreign_currency_accounts(company, company_currency, with_currency=False):
+		acc = qb.DocType("Account")
+		query = (
+			qb.from_(acc)
+			.select(acc.name)
+			.where(
+				(acc.is_group == 0)
+				& (acc.report_type == "Balance Sheet")
+				& (acc.root_type.isin(["Asset", "Liability", "Equity"]))
+				& (acc.account_type != "Stock")
+				& (acc.company == company)
+				& (acc.account_currency != company_currency)
+			)
+			.orderby(acc.name)
+		)
+		if with_currency:
+			return query.select(acc.account_currency).run(as_list=True)
+
+		return [x[0] for x in query.run(as_list=True)]
+
 	@staticmethod
 	def get_account_balance_from_gle(
-		company, posting_date, account, party_type, party, rounding_loss_allowance
+		company,
+		posting_date,
+		account,
+		party_type,
+		party,
+		rounding_loss_allowance,
+		accounts=None,
+		parties=None,
 	):
 		account_details = []
 
 		if company and posting_date:
 			company_currency = erpnext.get_company_currency(company)
 
-			acc = qb.DocType("Account")
 			if account:
 				accounts = [account]
-			else:
-				res = (
-					qb.from_(acc)
-					.select(acc.name)
-					.where(
-						(acc.is_group == 0)
-						& (acc.report_type == "Balance Sheet")
-						& (acc.root_type.isin(["Asset", "Liability", "Equity"]))
-						& (acc.account_type != "Stock")
-						& (acc.company == company)
-						& (acc.account_currency != company_currency)
-					)
-					.orderby(acc.name)
-					.run(as_list=True)
-				)
-				accounts = [x[0] for x in res]
+			elif not accounts:
+				accounts = ExchangeRateRevaluation.get_foreign_currency_accounts(company, company_currency)
 
 			if accounts:
 				having_clause = (qb.Field("balance") != qb.Field("balance_in_account_currency")) & (
@@ -187,6 +350,8 @@ class ExchangeRateRevaluation(Document):
 					conditions.append(gle.party_type == party_type)
 				if party:
 					conditions.append(gle.party == party)
+				if parties:
+					conditions.append(gle.party.isin(parties))
 
 				account_details = (
 					qb.from_(gle)
@@ -240,12 +405,18 @@ class ExchangeRateRevaluation(Document):
 		)
 
 		if account_details:
+			# closing rate is the same for all accounts in a currency
+			new_exchange_rates = {
+				account_currency: get_exchange_rate(account_currency, company_currency, posting_date)
+				for account_currency in {x.account_currency for x in account_details if not x.zero_balance}
+			}
+
 			# Handle Accounts with balance in both Account/Base Currency
 			for d in [x for x in account_details if not x.zero_balance]:
 				current_exchange_rate = (
 					d.balance / d.balance_in_account_currency if d.balance_in_account_currency else 0
 				)
-				new_exchange_rate = get_exchange_rate(d.account_currency, company_currency, posting_date)
+				new_exchange_rate = new_exchange_rates[d.account_currency]
 				new_balance_in_base_currency = flt(d.balance_in_account_currency * new_exchange_rate)
 				gain_loss = flt(new_balance_in_base_currency, precision) - flt(d.balance, precision)
 				if gain_loss:
@@ -333,14 +504,15 @@ class ExchangeRateRevaluation(Document):
 				f"Zero Balance Journal: {get_link_to_form('Journal Entry', zero_balance_jv.name)}"
 			)
 
-		revaluation_jv = self.make_jv_for_revaluation()
-		if revaluation_jv:
+		revaluation_jvs = self.make_jvs_for_revaluation()
+		for revaluation_jv in revaluation_jvs:
 			frappe.msgprint(
 				f"Revaluation Journal: {get_link_to_form('Journal Entry', revaluation_jv.name)}"
 			)
 
 		return {
-			"revaluation_jv": revaluation_jv.name if revaluation_jv else None,
+			"revaluation_jv": revaluation_jvs[0].name if revaluation_jvs else None,
+			"revaluation_jvs": [jv.name for jv in revaluation_jvs],
 			"zero_balance_jv": zero_balance_jv.name if zero_balance_jv else None,
 		}
 
@@ -354,6 +526,8 @@ class ExchangeRateRevaluation(Document):
 			return
 
 		unrealized_exchange_gain_loss_account = self.get_for_unrealized_gain_loss_account()
+		unrealized_exchange_gain_loss_balance = get_balance_on(unrealized_exchange_gain_loss_account)
+		cost_center = erpnext.get_default_cost_center(self.company)
 
 		journal_entry = frappe.new_doc("Journal Entry")
 		journal_entry.voucher_type = "Exchange Gain Or Loss"
@@ -373,7 +547,7 @@ class ExchangeRateRevaluation(Document):
 						d.get("balance_in_account_currency"), d.precision("balance_in_account_currency")
 					),
 					"exchange_rate": 0,
-					"cost_center": erpnext.get_default_cost_center(self.company),
+					"cost_center": cost_center,
 					"reference_type": "Exchange Rate Revaluation",
 					"reference_name": self.name,
 				}
@@ -407,12 +581,12 @@ class ExchangeRateRevaluation(Document):
 				journal_entry_accounts.append(
 					{
 						"account": unrealized_exchange_gain_loss_account,
-						"balance": get_balance_on(unrealized_exchange_gain_loss_account),
+						"balance": unrealized_exchange_gain_loss_balance,
 						"debit": 0,
 						"credit": 0,
 						"debit_in_account_currency": abs(d.gain_loss) if d.gain_loss < 0 else 0,
 						"credit_in_account_currency": abs(d.gain_loss) if d.gain_loss > 0 else 0,
-						"cost_center": erpnext.get_default_cost_center(self.company),
+						"cost_center": cost_center,
 						"exchange_rate": 1,
 						"reference_type": "Exchange Rate Revaluation",
 						"reference_name": self.name,
@@ -439,12 +613,12 @@ class ExchangeRateRevaluation(Document):
 				journal_entry_accounts.append(
 					{
 						"account": unrealized_exchange_gain_loss_account,
-						"balance": get_balance_on(unrealized_exchange_gain_loss_account),
+						"balance": unrealized_exchange_gain_loss_balance,
 						"debit": abs(d.gain_loss) if d.gain_loss < 0 else 0,
 						"credit": abs(d.gain_loss) if d.gain_loss > 0 else 0,
 						"debit_in_account_currency": 0,
 						"credit_in_account_currency": 0,
-						"cost_center": erpnext.get_default_cost_center(self.company),
+						"cost_center": cost_center,
 						"exchange_rate": 1,
 						"reference_type": "Exchange Rate Revaluation",
 						"reference_name": self.name,
@@ -456,15 +630,31 @@ class ExchangeRateRevaluation(Document):
 		journal_entry.save()
 		return journal_entry
 
-	def make_jv_for_revaluation(self):
+	def make_jvs_for_revaluation(self):
+		"""Revaluation journals with at most REVALUATION_JV_CHUNK_SIZE accounts each"""
 		if self.gain_loss_unbooked == 0:
-			return
+			return []
 
 		accounts = [x for x in self.accounts if not x.zero_balance]
+		journals = []
+		for i in range(0, len(accounts), REVALUATION_JV_CHUNK_SIZE):
+			journal_entry = self.make_jv_for_revaluation(accounts[i : i + REVALUATION_JV_CHUNK_SIZE])
+			if journal_entry:
+				journals.append(journal_entry)
+
+		return journals
+
+	def make_jv_for_revaluation(self, accounts=None):
+		if self.gain_loss_unbooked == 0:
+			return
+
+		if accounts is None:
+			accounts = [x for x in self.accounts if not x.zero_balance]
 		if not accounts:
 			return
 
 		unrealized_exchange_gain_loss_account = self.get_for_unrealized_gain_loss_account()
+		cost_center = erpnext.get_default_cost_center(self.company)
 
 		journal_entry = frappe.new_doc("Journal Entry")
 		journal_entry.voucher_type = "Exchange Rate Revaluation"
@@ -501,7 +691,7 @@ class ExchangeRateRevaluation(Document):
 					dr_or_cr: flt(
 						abs(d.get("balance_in_account_currency")), d.precision("balance_in_account_currency")
 					),
-					"cost_center": erpnext.get_default_cost_center(self.company),
+					"cost_center": cost_center,
 					"exchange_rate": flt(d.get("new_exchange_rate"), d.precision("new_exchange_rate")),
 					"reference_type": "Exchange Rate Revaluation",
 					"reference_name": self.name,
@@ -519,28 +709,30 @@ class ExchangeRateRevaluation(Document):
 					reverse_dr_or_cr: flt(
 						abs(d.get("balance_in_account_currency")), d.precision("balance_in_account_currency")
 					),
-					"cost_center": erpnext.get_default_cost_center(self.company),
+					"cost_center": cost_center,
 					"exchange_rate": flt(d.get("current_exchange_rate"), d.precision("current_exchange_rate")),
 					"reference_type": "Exchange Rate Revaluation",
 					"reference_name": self.name,
 				}
 			)
 
+		if not journal_entry_accounts:
+			return
+
 		journal_entry.set("accounts", journal_entry_accounts)
 		journal_entry.set_amounts_in_company_currency()
 		journal_entry.set_total_debit_credit()
 
-		self.gain_loss_unbooked += journal_entry.difference - self.gain_loss_unbooked
+		# gain or loss of the accounts in this journal
+		gain_loss = journal_entry.difference
 		journal_entry.append(
 			"accounts",
 			{
 				"account": unrealized_exchange_gain_loss_account,
 				"balance": get_balance_on(unrealized_exchange_gain_loss_account),
-				"debit_in_account_currency": abs(self.gain_loss_unbooked)
-				if self.gain_loss_unbooked < 0
-				else 0,
-				"credit_in_account_currency": self.gain_loss_unbooked if self.gain_loss_unbooked > 0 else 0,
-				"cost_center": erpnext.get_default_cost_center(self.company),
+				"debit_in_account_currency": abs(gain_loss) if gain_loss < 0 else 0,
+				"credit_in_account_currency": gain_loss if gain_loss > 0 else 0,
+				"cost_center": cost_center,
 				"exchange_rate": 1,
 				"reference_type": "Exchange Rate Revaluation",
 				"reference_name": self.name,
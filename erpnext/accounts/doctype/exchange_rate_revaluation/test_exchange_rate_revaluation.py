@@ -2,6 +2,7 @@
 # See license.txt
 
 import unittest
+from unittest.mock import patch
 
 import frappe
 from frappe import qb
@@ -296,3 +297,60 @@ class TestExchangeRateRevaluation(AccountsTestMixin, FrappeTestCase):
 
 		for key, val in expected_data.items():
 			self.assertEqual(expected_data.get(key), account_details.get(key))
+
+	@change_settings(
+		"Accounts Settings",
+		{"allow_multi_currency_invoices_against_single_party_account": 1, "allow_stale": 0},
+	)
+	def test_05_incremental_revaluation(self):
+		def make_usd_invoice():
+			si = create_sales_invoice(
+				item=self.item,
+				company=self.company,
+				customer=self.customer,
+				debit_to=self.debtors_usd,
+				posting_date=today(),
+				parent_cost_center=self.cost_center,
+				cost_center=self.cost_center,
+				rate=100,
+				price_list_rate=100,
+				do_not_submit=1,
+			)
+			si.currency = "USD"
+			si.conversion_rate = 80
+			return si.save().submit()
+
+		def revalue(rate):
+			err = frappe.new_doc("Exchange Rate Revaluation")
+			err.company = self.company
+			err.posting_date = today()
+			with patch(
+				"erpnext.accounts.doctype.exchange_rate_revaluation.exchange_rate_revaluation.get_exchange_rate",
+				return_value=rate,
+			):
+				err.fetch_and_calculate_accounts_data(incremental=True)
+			return err
+
+		make_usd_invoice()
+
+		# first revaluation covers everything
+		err = revalue(85)
+		self.assertEqual(len(err.accounts), 1)
+		err = err.save().submit()
+		for jv in err.make_jv_entries().get("revaluation_jvs"):
+			frappe.get_doc("Journal Entry", jv).submit()
+
+		# same rate and no new entries
+		self.assertEqual(revalue(85).accounts, [])
+
+		# a new invoice brings its party back
+		make_usd_invoice()
+		err = revalue(85)
+		self.assertEqual(len(err.accounts), 1)
+		self.assertEqual(err.accounts[0].balance_in_account_currency, 200)
+		self.assertEqual(err.accounts[0].new_balance_in_base_currency, 17000)
+
+		# a new rate revalues all accounts of the currency
+		err = revalue(86)
+		self.assertEqual(len(err.accounts), 1)
+		self.assertEqual(err.accounts[0].new_balance_in_base_currency, 17200)
@@ -0,0 +1,166 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import json
+
+import frappe
+from frappe.model.document import Document
+from frappe.model.meta import get_field_precision
+from frappe.utils import flt, now
+from frappe.utils.xlsxutils import handle_html
+
+LEDGER_FIELDS = (
+	"company",
+	"posting_date",
+	"voucher_type",
+	"voucher_no",
+	"voucher_detail_no",
+	"item_code",
+	"tax_detail_no",
+	"account_head",
+	"description",
+	"charge_type",
+	"category",
+	"tax_rate",
+	"tax_amount",
+)
+TAX_DOCTYPES = {
+	"Sales Invoice": "Sales Taxes and Charges",
+	"Purchase Invoice": "Purchase Taxes and Charges",
+}
+
+
+class ItemTaxLedgerEntry(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		account_head: DF.Link | None
+		category: DF.Data | None
+		charge_type: DF.Data | None
+		company: DF.Link | None
+		description: DF.SmallText | None
+		item_code: DF.Link | None
+		posting_date: DF.Date | None
+		tax_amount: DF.Currency
+		tax_detail_no: DF.Data | None
+		tax_rate: DF.Float
+		voucher_detail_no: DF.Data | None
+		voucher_no: DF.DynamicLink | None
+		voucher_type: DF.Link | None
+	# end: auto-generated types
+
+	pass
+
+
+def make_item_tax_ledger_entries(doc):
+	"""Write the tax of every item row of a submitted invoice, split the same way the
+	item-wise registers split `item_wise_tax_detail`, so reports need not parse it."""
+
+	insert_item_tax_ledger_entries(get_item_tax_ledger_entries(doc))
+
+
+def delete_item_tax_ledger_entries(doc):
+	frappe.db.delete("Item Tax Ledger Entry", {"voucher_type": doc.doctype, "voucher_no": doc.name})
+
+
+def get_item_tax_ledger_entries(doc):
+	company_currency = frappe.get_cached_value("Company", doc.company, "default_currency")
+	tax_amount_precision = (
+		get_field_precision(
+			frappe.get_meta(TAX_DOCTYPES[doc.doctype]).get_field("tax_amount"), currency=company_currency
+		)
+		or 2
+	)
+
+	item_row_map = {}
+	for item in doc.get("items"):
+		item_row_map.setdefault(item.item_code or item.item_name, []).append(item)
+
+	entries = []
+	for tax in doc.get("taxes"):
+		if not tax.description:
+			continue
+
+		if tax.item_wise_tax_detail:
+			try:
+				item_wise_tax_detail = json.loads(tax.item_wise_tax_detail)
+			except ValueError:
+				continue
+
+			for item_code, tax_data in item_wise_tax_detail.items():
+				if isinstance(tax_data, list):
+					tax_rate, tax_amount = tax_data
+				else:
+					tax_rate, tax_amount = tax_data, 0
+
+				items = item_row_map.get(item_code, [])
+				item_net_amount = sum(flt(item.base_net_amount) for item in items)
+				for item in items:
+					item_tax_amount = (
+						flt((tax_amount * item.base_net_amount) / item_net_amount) if item_net_amount else 0
+					)
+					if item_tax_amount:
+						entries.append(
+							get_entry(doc, item, tax, tax_rate, flt(item_tax_amount, tax_amount_precision))
+						)
+
+		elif (
+			tax.charge_type == "Actual" and tax.base_tax_amount_after_discount_amount and doc.base_net_total
+		):
+			for item in doc.get("items"):
+				tax_amount = flt(
+					(tax.base_tax_amount_after_discount_amount * item.base_net_amount) / doc.base_net_total,
+					tax_amount_precision,
+				)
+				entries.append(get_entry(doc, item, tax, 0, tax_amount))
+
+	return entries
+
+
+def get_entry(doc, item, tax, tax_rate, tax_amount):
+	if doc.doctype == "Purchase Invoice" and tax.add_deduct_tax == "Deduct":
+		tax_amount *= -1
+
+	return frappe._dict(
+		company=doc.company,
+		posting_date=doc.posting_date,
+		voucher_type=doc.doctype,
+		voucher_no=doc.name,
+		voucher_detail_no=item.name,
+		item_code=item.item_code,
+		tax_detail_no=tax.name,
+		account_head=tax.account_head,
+		description=handle_html(tax.description),
+		charge_type=tax.charge_type,
+		category=tax.get("category"),
+		tax_rate=flt(tax_rate),
+		tax_amount=tax_amount,
+	)
+
+
+def insert_item_tax_ledger_entries(entries):
+	if not entries:
+		return
+
+	timestamp = now()
+	user = frappe.session.user
+	values = [
+		[frappe.generate_hash(length=10), timestamp, timestamp, user, user]
+		+ [entry.get(field) for field in LEDGER_FIELDS]
+		for entry in entries
+	]
+
+	frappe.db.bulk_insert(
+		"Item Tax Ledger Entry",
+		fields=["name", "creation", "modified", "owner", "modified_by"] + list(LEDGER_FIELDS),
+		values=values,
+	)
+
+
+def on_doctype_update():
+	frappe.db.add_index("Item Tax Ledger Entry", ["voucher_type", "voucher_no"])
@@ -0,0 +1,45 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+
+class TestItemTaxLedgerEntry(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_item_tax_ledger_entries_on_submit_and_cancel(self):
+		si = create_sales_invoice(qty=10, rate=100, do_not_save=True)
+		si.append("items", {**si.items[0].as_dict(), "name": None, "idx": None, "qty": 5})
+		si.append(
+			"taxes",
+			{
+				"charge_type": "On Net Total",
+				"account_head": "_Test Account Service Tax - _TC",
+				"cost_center": "_Test Cost Center - _TC",
+				"description": "Service Tax",
+				"rate": 10,
+			},
+		)
+		si.insert()
+		si.submit()
+
+		entries = frappe.get_all(
+			"Item Tax Ledger Entry",
+			filters={"voucher_type": si.doctype, "voucher_no": si.name},
+			fields=["voucher_detail_no", "tax_rate", "tax_amount"],
+		)
+		tax_by_row = {d.voucher_detail_no: d.tax_amount for d in entries}
+
+		self.assertEqual(len(entries), 2)
+		self.assertEqual({d.tax_rate for d in entries}, {10})
+		self.assertEqual(tax_by_row[si.items[0].name], 100)
+		self.assertEqual(tax_by_row[si.items[1].name], 50)
+
+		si.cancel()
+		self.assertFalse(
+			frappe.db.exists("Item Tax Ledger Entry", {"voucher_type": si.doctype, "voucher_no": si.name})
+		)
@@ -13,6 +13,9 @@ from erpnext.accounts.deferred_revenue import get_deferred_booking_accounts
 from erpnext.accounts.doctype.invoice_discounting.invoice_discounting import (
 	get_party_account_based_on_invoice_discounting,
 )
+from erpnext.accounts.doctype.tax_withholding_balance.tax_withholding_balance import (
+	update_tax_withholding_balance,
+)
 from erpnext.accounts.doctype.tax_withholding_category.tax_withholding_category import (
 	get_party_tax_withholding_details,
 )
@@ -154,6 +157,7 @@ class JournalEntry(AccountsController):
 		self.validate_cheque_info()
 		self.check_credit_limit()
 		self.make_gl_entries()
+		update_tax_withholding_balance(self)
 		self.update_advance_paid()
 		self.update_asset_value()
 		self.update_inter_company_jv()
@@ -174,6 +178,7 @@ class JournalEntry(AccountsController):
 			"Unreconcile Payment Entries",
 		)
 		self.make_gl_entries(1)
+		update_tax_withholding_balance(self, cancel=True)
 		self.update_advance_paid()
 		self.unlink_advance_entry_reference()
 		self.unlink_asset_reference()
@@ -0,0 +1,169 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_to_date, flt, get_datetime, now
+
+import erpnext
+from erpnext.accounts.report.general_and_payment_ledger_comparison.general_and_payment_ledger_comparison import (
+	General_Payment_Ledger_Comparison,
+)
+from erpnext.stock.report.stock_and_account_value_comparison.stock_and_account_value_comparison import (
+	get_data as get_stock_and_account_value_mismatches,
+)
+
+LEDGER_DOCTYPES = ("GL Entry", "Payment Ledger Entry", "Stock Ledger Entry")
+CHECKED_UPTO_KEY = "ledger_integrity_checked_upto"
+CHUNK_SIZE = 1000
+# entries modified in the last minutes may belong to transactions that are not committed yet
+LEDGER_SETTLE_SECONDS = 600
+
+
+class LedgerIntegrityMismatch(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		account: DF.Link | None
+		company: DF.Link | None
+		compared_balance: DF.Currency
+		integrity_check: DF.Literal["General and Payment Ledger", "Stock and Account Value"]
+		ledger_balance: DF.Currency
+		party: DF.DynamicLink | None
+		party_type: DF.Link | None
+		voucher_no: DF.DynamicLink | None
+		voucher_type: DF.Link | None
+	# end: auto-generated types
+
+	pass
+
+
+def check_ledger_integrity():
+	"""Compare the ledgers of the vouchers changed since the last check.
+
+	A voucher's ledger entries are created, cancelled and delinked with the `modified`
+	timestamp set, so only vouchers with entries modified since the last check are compared.
+	The mismatches of a compared voucher replace the ones found for it earlier.
+
+	The check stops `LEDGER_SETTLE_SECONDS` before now, so that entries of transactions
+	still open while it runs are compared by a later check instead of being skipped."""
+
+	checked_upto = frappe.db.get_default(CHECKED_UPTO_KEY)
+	check_upto = add_to_date(now(), seconds=-LEDGER_SETTLE_SECONDS)
+	if checked_upto and get_datetime(check_upto) <= get_datetime(checked_upto):
+		return
+
+	vouchers_by_company = get_changed_vouchers(checked_upto, check_upto)
+	for company, vouchers in vouchers_by_company.items():
+		for i in range(0, len(vouchers), CHUNK_SIZE):
+			check_vouchers(company, vouchers[i : i + CHUNK_SIZE])
+
+	frappe.db.set_default(CHECKED_UPTO_KEY, check_upto)
+
+
+def get_changed_vouchers(from_datetime, to_datetime):
+	filters = [["modified", "<=", to_datetime]]
+	if from_datetime:
+		filters.append(["modified", ">", from_datetime])
+
+	vouchers_by_company = {}
+	for doctype in LEDGER_DOCTYPES:
+		for d in frappe.get_all(
+			doctype,
+			filters=filters,
+			fields=["company", "voucher_type", "voucher_no"],
+			distinct=True,
+		):
+			vouchers_by_company.setdefault(d.company, set()).add((d.voucher_type, d.voucher_no))
+
+	return {company: sorted(vouchers) for company, vouchers in vouchers_by_company.items()}
+
+
+def check_vouchers(company, vouchers):
+	voucher_nos = list({voucher_no for voucher_type, voucher_no in vouchers})
+
+	mismatches = get_payment_ledger_mismatches(company, voucher_nos)
+	if erpnext.is_perpetual_inventory_enabled(company):
+		mismatches += get_stock_value_mismatches(company, voucher_nos)
+
+	mismatch = frappe.qb.DocType("Ledger Integrity Mismatch")
+	frappe.qb.from_(mismatch).delete().where(
+		(mismatch.company == company) & (mismatch.voucher_no.isin(voucher_nos))
+	).run()
+
+	if mismatches:
+		insert_mismatches(company, mismatches)
+
+
+def get_payment_ledger_mismatches(company, voucher_nos):
+	comparison = General_Payment_Ledger_Comparison(
+		frappe._dict({"company": company, "voucher_nos": voucher_nos})
+	)
+	comparison.get_accounts()
+	comparison.generate_filters()
+	comparison.get_gle()
+	comparison.get_ple()
+	comparison.compare()
+	comparison.generate_data()
+
+	return [
+		frappe._dict(
+			{
+				"integrity_check": "General and Payment Ledger",
+				"voucher_type": d.voucher_type,
+				"voucher_no": d.voucher_no,
+				"account": d.account,
+				"party_type": d.party_type,
+				"party": d.party,
+				"ledger_balance": flt(d.gl_balance),
+				"compared_balance": flt(d.pl_balance),
+			}
+		)
+		for d in comparison.data
+	]
+
+
+def get_stock_value_mismatches(company, voucher_nos):
+	return [
+		frappe._dict(
+			{
+				"integrity_check": "Stock and Account Value",
+				"voucher_type": d.voucher_type,
+				"voucher_no": d.voucher_no,
+				"ledger_balance": flt(d.account_value),
+				"compared_balance": flt(d.stock_value),
+			}
+		)
+		for d in get_stock_and_account_value_mismatches(
+			frappe._dict({"company": company, "voucher_nos": voucher_nos})
+		)
+	]
+
+
+def insert_mismatches(company, mismatches):
+	value_fields = [
+		"integrity_check",
+		"voucher_type",
+		"voucher_no",
+		"account",
+		"party_type",
+		"party",
+		"ledger_balance",
+		"compared_balance",
+	]
+	fields = ["name", "creation", "modified", "owner", "modified_by", "company", *value_fields]
+
+	timestamp = now()
+	user = frappe.session.user
+	values = [
+		[frappe.generate_hash(length=10), timestamp, timestamp, user, user, company]
+		+ [d.get(field) for field in value_fields]
+		for d in mismatches
+	]
+
+	frappe.db.bulk_insert("Ledger Integrity Mismatch", fields=fields, values=values)
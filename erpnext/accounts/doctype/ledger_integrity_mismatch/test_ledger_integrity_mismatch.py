@@ -0,0 +1,71 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_to_date, get_datetime, now
+
+from erpnext.accounts.doctype.ledger_integrity_mismatch import ledger_integrity_mismatch
+from erpnext.accounts.doctype.ledger_integrity_mismatch.ledger_integrity_mismatch import (
+	CHECKED_UPTO_KEY,
+	check_ledger_integrity,
+)
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+
+class TestLedgerIntegrityMismatch(FrappeTestCase):
+	def get_mismatches(self, voucher_no):
+		return frappe.get_all(
+			"Ledger Integrity Mismatch",
+			filters={"voucher_no": voucher_no},
+			fields=["integrity_check", "account", "ledger_balance", "compared_balance"],
+		)
+
+	@patch.object(ledger_integrity_mismatch, "LEDGER_SETTLE_SECONDS", 0)
+	def test_only_changed_vouchers_are_compared(self):
+		frappe.db.set_default(CHECKED_UPTO_KEY, add_to_date(now(), seconds=-1))
+
+		si = create_sales_invoice()
+		check_ledger_integrity()
+		self.assertEqual(self.get_mismatches(si.name), [])
+
+		# corrupt the payment ledger without touching `modified`, it is not picked up
+		ple = frappe.qb.DocType("Payment Ledger Entry")
+		frappe.qb.update(ple).set(ple.amount, ple.amount + 10).where(ple.voucher_no == si.name).run()
+		check_ledger_integrity()
+		self.assertEqual(self.get_mismatches(si.name), [])
+
+		# a change to the voucher's ledger entries gets it compared again
+		frappe.qb.update(ple).set(ple.modified, now()).where(ple.voucher_no == si.name).run()
+		check_ledger_integrity()
+		mismatches = self.get_mismatches(si.name)
+		self.assertEqual(len(mismatches), 1)
+		self.assertEqual(mismatches[0].integrity_check, "General and Payment Ledger")
+		self.assertEqual(mismatches[0].account, si.debit_to)
+		self.assertEqual(mismatches[0].compared_balance, mismatches[0].ledger_balance + 10)
+
+		# a fixed voucher no longer reports a mismatch
+		frappe.qb.update(ple).set(ple.amount, ple.amount - 10).set(ple.modified, now()).where(
+			ple.voucher_no == si.name
+		).run()
+		check_ledger_integrity()
+		self.assertEqual(self.get_mismatches(si.name), [])
+
+	def test_recent_entries_are_left_for_a_later_check(self):
+		frappe.db.set_default(CHECKED_UPTO_KEY, add_to_date(now(), days=-1))
+
+		si = create_sales_invoice()
+		ple = frappe.qb.DocType("Payment Ledger Entry")
+		frappe.qb.update(ple).set(ple.amount, ple.amount + 10).where(ple.voucher_no == si.name).run()
+
+		# entries that may still be uncommitted are neither compared nor passed by the watermark
+		check_ledger_integrity()
+		self.assertEqual(self.get_mismatches(si.name), [])
+		modified = frappe.db.get_value("Payment Ledger Entry", {"voucher_no": si.name}, "modified")
+		self.assertLess(get_datetime(frappe.db.get_default(CHECKED_UPTO_KEY)), get_datetime(modified))
+
+		with patch.object(ledger_integrity_mismatch, "LEDGER_SETTLE_SECONDS", 0):
+			check_ledger_integrity()
+		self.assertEqual(len(self.get_mismatches(si.name)), 1)
@@ -300,18 +300,21 @@ class PeriodClosingVoucher(AccountsController):
 		if group_by_account:
 			qb_dimension_fields.append("account")
 
-		account_filters = {
-			"company": self.company,
-			"is_group": 0,
-		}
+		gl_entry = frappe.qb.DocType("GL Entry")
+		account = frappe.qb.DocType("Account")
+
+		# join on account instead of filtering by the list of all the ledgers of the company,
+		# so that the aggregation stays within a single index scan of the company's entries
+		query = (
+			frappe.qb.from_(gl_entry)
+			.inner_join(account)
+			.on(gl_entry.account == account.name)
+			.select(gl_entry.account, gl_entry.account_currency)
+			.where((account.company == self.company) & (account.is_group == 0))
+		)
 
 		if report_type:
-			account_filters.update({"report_type": report_type})
-
-		accounts = frappe.get_all("Account", filters=account_filters, pluck="name")
-
-		gl_entry = frappe.qb.DocType("GL Entry")
-		query = frappe.qb.from_(gl_entry).select(gl_entry.account, gl_entry.account_currency)
+			query = query.where(account.report_type == report_type)
 
 		if not for_aggregation:
 			query = query.select(
@@ -331,11 +334,7 @@ class PeriodClosingVoucher(AccountsController):
 		for dimension in qb_dimension_fields:
 			query = query.select(gl_entry[dimension])
 
-		query = query.where(
-			(gl_entry.company == self.company)
-			& (gl_entry.is_cancelled == 0)
-			& (gl_entry.account.isin(accounts))
-		)
+		query = query.where((gl_entry.company == self.company) & (gl_entry.is_cancelled == 0))
 
 		if get_opening_entries:
 			query = query.where(
@@ -2,6 +2,7 @@
 # See license.txt
 
 import unittest
+from unittest.mock import patch
 
 import frappe
 
@@ -14,6 +15,7 @@ from erpnext.accounts.doctype.pos_closing_entry.pos_closing_entry import (
 )
 from erpnext.accounts.doctype.pos_invoice.pos_invoice import make_sales_return
 from erpnext.accounts.doctype.pos_invoice.test_pos_invoice import create_pos_invoice
+from erpnext.accounts.doctype.pos_invoice_merge_log import pos_invoice_merge_log
 from erpnext.accounts.doctype.pos_opening_entry.test_pos_opening_entry import create_opening_entry
 from erpnext.accounts.doctype.pos_profile.test_pos_profile import make_pos_profile
 from erpnext.selling.page.point_of_sale.point_of_sale import get_items
@@ -144,6 +146,63 @@ class TestPOSClosingEntry(unittest.TestCase):
 		pos_inv1.load_from_db()
 		self.assertEqual(pos_inv1.status, "Paid")
 
+	def test_pos_closing_in_chunks(self):
+		make_stock_entry(target="_Test Warehouse - _TC", qty=12, basic_rate=100)
+		test_user, pos_profile = init_user_and_profile()
+		opening_entry = create_opening_entry(pos_profile, test_user.name)
+
+		customers = ("_Test Customer", "_Test Customer 1", "_Test Customer 2")
+		invoices = {}
+		for customer in customers:
+			for _ in range(4):
+				pos_inv = create_pos_invoice(customer=customer, rate=100, do_not_submit=1)
+				pos_inv.append(
+					"payments", {"mode_of_payment": "Cash", "account": "Cash - _TC", "amount": 100}
+				)
+				pos_inv.submit()
+				invoices.setdefault(customer, []).append(pos_inv.name)
+
+		make_merge_logs = pos_invoice_merge_log.make_merge_logs
+
+		def fail_for_second_customer(invoice_by_customer, closing_entry=None):
+			if "_Test Customer 1" in invoice_by_customer:
+				frappe.throw("Consolidation failed")
+			make_merge_logs(invoice_by_customer, closing_entry)
+
+		def run_job(job, **kwargs):
+			# chunks are separate background jobs, a failing one does not stop the others
+			try:
+				job(**kwargs)
+			except frappe.ValidationError:
+				pass
+
+		pcv_doc = make_closing_entry_from_opening(opening_entry)
+		with patch.object(pos_invoice_merge_log, "POS_CONSOLIDATION_CHUNK_SIZE", 4), patch.object(
+			pos_invoice_merge_log, "make_merge_logs", side_effect=fail_for_second_customer
+		), patch.object(pos_invoice_merge_log, "enqueue_job", side_effect=run_job):
+			pcv_doc.submit()
+
+		def get_consolidated_invoices(customer):
+			return frappe.get_all(
+				"POS Invoice",
+				filters={"name": ("in", invoices[customer])},
+				pluck="consolidated_invoice",
+			)
+
+		self.assertTrue(all(get_consolidated_invoices("_Test Customer")))
+		self.assertTrue(all(get_consolidated_invoices("_Test Customer 2")))
+		self.assertFalse(any(get_consolidated_invoices("_Test Customer 1")))
+
+		pcv_doc.load_from_db()
+		self.assertEqual(pcv_doc.status, "Failed")
+		self.assertIn("Chunk 2", pcv_doc.error_message)
+
+		# only the invoices of the failed chunk are consolidated on retry
+		pcv_doc.retry()
+		pcv_doc.load_from_db()
+		self.assertEqual(pcv_doc.status, "Submitted")
+		self.assertTrue(all(get_consolidated_invoices("_Test Customer 1")))
+
 	def test_pos_closing_for_required_accounting_dimension_in_pos_profile(self):
 		"""
 		test case to check whether we can create POS Closing Entry without mandatory accounting dimension
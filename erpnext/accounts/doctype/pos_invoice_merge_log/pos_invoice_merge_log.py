@@ -8,13 +8,19 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 from frappe.model.mapper import map_child_doc, map_doc
-from frappe.utils import cint, flt, get_time, getdate, nowdate, nowtime
+from frappe.utils import cint, flt, get_time, getdate, now, nowdate, nowtime
 from frappe.utils.background_jobs import enqueue, is_job_enqueued
 from frappe.utils.scheduler import is_scheduler_inactive
 
 from erpnext.accounts.doctype.pos_profile.pos_profile import required_accounting_dimensions
 
 
+# number of POS Invoices consolidated by each background job of a closing entry
+POS_CONSOLIDATION_CHUNK_SIZE = 1000
+# child tables of POS Invoices that are merged into the consolidated invoices
+MERGED_CHILD_TABLES = ("items", "taxes", "payments")
+
+
 class POSInvoiceMergeLog(Document):
 	# begin: auto-generated types
 	# This code is auto-generated. Do not modify anything in this block.
@@ -106,9 +112,7 @@ class POSInvoiceMergeLog(Document):
 					frappe.throw(msg)
 
 	def on_submit(self):
-		pos_invoice_docs = [
-			frappe.get_cached_doc("POS Invoice", d.pos_invoice) for d in self.pos_invoices
-		]
+		pos_invoice_docs = get_pos_invoice_docs([d.pos_invoice for d in self.pos_invoices])
 
 		returns = [d for d in pos_invoice_docs if d.get("is_return") == 1]
 		sales = [d for d in pos_invoice_docs if d.get("is_return") == 0]
@@ -124,9 +128,7 @@ class POSInvoiceMergeLog(Document):
 		self.update_pos_invoices(pos_invoice_docs, sales_invoice, credit_note)
 
 	def on_cancel(self):
-		pos_invoice_docs = [
-			frappe.get_cached_doc("POS Invoice", d.pos_invoice) for d in self.pos_invoices
-		]
+		pos_invoice_docs = get_pos_invoice_docs([d.pos_invoice for d in self.pos_invoices])
 
 		self.update_pos_invoices(pos_invoice_docs)
 		self.cancel_linked_invoices()
@@ -175,6 +177,10 @@ class POSInvoiceMergeLog(Document):
 
 		loyalty_amount_sum, loyalty_points_sum, idx = 0, 0, 1
 
+		# consolidated rows keyed by their merge criteria, instead of scanning all rows for every row
+		item_map, tax_map, payment_map = {}, {}, {}
+		tax_detail_map = {}
+
 		for doc in data:
 			map_doc(doc, invoice, table_map={"doctype": invoice.doctype})
 
@@ -185,24 +191,14 @@ class POSInvoiceMergeLog(Document):
 				loyalty_amount_sum += doc.loyalty_amount
 
 			for item in doc.get("items"):
-				found = False
-				for i in items:
-					if (
-						i.item_code == item.item_code
-						and not i.serial_no
-						and not i.batch_no
-						and i.uom == item.uom
-						and i.net_rate == item.net_rate
-						and i.warehouse == item.warehouse
-					):
-						found = True
-						i.qty = i.qty + item.qty
-						i.amount = i.amount + item.net_amount
-						i.net_amount = i.amount
-						i.base_amount = i.base_amount + item.base_net_amount
-						i.base_net_amount = i.base_amount
-
-				if not found:
+				key = (item.item_code, item.uom, item.net_rate, item.warehouse)
+				if i := item_map.get(key):
+					i.qty = i.qty + item.qty
+					i.amount = i.amount + item.net_amount
+					i.net_amount = i.amount
+					i.base_amount = i.base_amount + item.base_net_amount
+					i.base_net_amount = i.base_amount
+				else:
 					item.rate = item.net_rate
 					item.amount = item.net_amount
 					item.base_amount = item.base_net_amount
@@ -212,15 +208,20 @@ class POSInvoiceMergeLog(Document):
 						si_item.serial_and_batch_bundle = item.serial_and_batch_bundle
 					items.append(si_item)
 
+					# rows with serial or batch numbers are never merged into
+					if not si_item.serial_no and not si_item.batch_no:
+						item_map[key] = si_item
+
 			for tax in doc.get("taxes"):
-				found = False
-				for t in taxes:
-					if t.account_head == tax.account_head and t.cost_center == tax.cost_center:
-						t.tax_amount = flt(t.tax_amount) + flt(tax.tax_amount_after_discount_amount)
-						t.base_tax_amount = flt(t.base_tax_amount) + flt(tax.base_tax_amount_after_discount_amount)
-						update_item_wise_tax_detail(t, tax)
-						found = True
-				if not found:
+				key = (tax.account_head, tax.cost_center)
+				if t := tax_map.get(key):
+					t.tax_amount = flt(t.tax_amount) + flt(tax.tax_amount_after_discount_amount)
+					t.base_tax_amount = flt(t.base_tax_amount) + flt(tax.base_tax_amount_after_discount_amount)
+					merge_item_wise_tax_detail(
+						tax_detail_map.setdefault(key, json.loads(t.item_wise_tax_detail or "{}") or {}),
+						json.loads(tax.item_wise_tax_detail),
+					)
+				else:
 					tax.charge_type = "Actual"
 					tax.idx = idx
 					idx += 1
@@ -229,22 +230,26 @@ class POSInvoiceMergeLog(Document):
 					tax.base_tax_amount = tax.base_tax_amount_after_discount_amount
 					tax.item_wise_tax_detail = tax.item_wise_tax_detail
 					taxes.append(tax)
+					tax_map[key] = tax
 
 			for payment in doc.get("payments"):
-				found = False
-				for pay in payments:
-					if pay.account == payment.account and pay.mode_of_payment == payment.mode_of_payment:
-						pay.amount = flt(pay.amount) + flt(payment.amount)
-						pay.base_amount = flt(pay.base_amount) + flt(payment.base_amount)
-						found = True
-				if not found:
+				key = (payment.account, payment.mode_of_payment)
+				if pay := payment_map.get(key):
+					pay.amount = flt(pay.amount) + flt(payment.amount)
+					pay.base_amount = flt(pay.base_amount) + flt(payment.base_amount)
+				else:
 					payments.append(payment)
+					payment_map[key] = payment
 
 			rounding_adjustment += doc.rounding_adjustment
 			rounded_total += doc.rounded_total
 			base_rounding_adjustment += doc.base_rounding_adjustment
 			base_rounded_total += doc.base_rounded_total
 
+		# serialize the merged item wise tax details once per tax row
+		for key, tax_detail in tax_detail_map.items():
+			tax_map[key].item_wise_tax_detail = json.dumps(tax_detail, separators=(",", ":"))
+
 		if loyalty_points_sum:
 			invoice.redeem_loyalty_points = 1
 			invoice.loyalty_points = loyalty_points_sum
@@ -296,17 +301,24 @@ class POSInvoiceMergeLog(Document):
 		return sales_invoice
 
 	def update_pos_invoices(self, invoice_docs, sales_invoice="", credit_note=""):
+		if self.docstatus == 2:
+			self.unlink_pos_invoices(invoice_docs)
+			return
+
+		# all merged invoices end up consolidated, update them with one statement per target
+		for is_return, consolidated_invoice in ((0, sales_invoice), (1, credit_note)):
+			invoices = [d.name for d in invoice_docs if cint(d.is_return) == is_return]
+			if not invoices:
+				continue
+
+			set_consolidated_invoice(invoices, consolidated_invoice, "Consolidated")
+
+	def unlink_pos_invoices(self, invoice_docs):
+		set_consolidated_invoice([d.name for d in invoice_docs], None)
+
 		for doc in invoice_docs:
 			doc.load_from_db()
-			doc.update(
-				{
-					"consolidated_invoice": None
-					if self.docstatus == 2
-					else (credit_note if doc.is_return else sales_invoice)
-				}
-			)
 			doc.set_status(update=True)
-			doc.save()
 
 	def cancel_linked_invoices(self):
 		for si_name in [self.consolidated_invoice, self.consolidated_credit_note]:
@@ -317,21 +329,67 @@ class POSInvoiceMergeLog(Document):
 			si.cancel()
 
 
-def update_item_wise_tax_detail(consolidate_tax_row, tax_row):
-	consolidated_tax_detail = json.loads(consolidate_tax_row.item_wise_tax_detail)
-	tax_row_detail = json.loads(tax_row.item_wise_tax_detail)
+def get_pos_invoice_docs(pos_invoices):
+	"""POS Invoices with their merged child rows, fetched with one query per table"""
+	invoices = {
+		d.name: d
+		for d in frappe.get_all("POS Invoice", filters={"name": ("in", pos_invoices)}, fields=["*"])
+	}
+
+	meta = frappe.get_meta("POS Invoice")
+	for fieldname in MERGED_CHILD_TABLES:
+		for row in frappe.get_all(
+			meta.get_field(fieldname).options,
+			filters={
+				"parenttype": "POS Invoice",
+				"parentfield": fieldname,
+				"parent": ("in", pos_invoices),
+			},
+			fields=["*"],
+			order_by="idx",
+		):
+			invoices[row.parent].setdefault(fieldname, []).append(row)
+
+	return [
+		frappe.get_doc({"doctype": "POS Invoice", **invoices[name]})
+		for name in pos_invoices
+		if name in invoices
+	]
+
+
+def set_consolidated_invoice(pos_invoices, consolidated_invoice, status=None):
+	pos_invoice = frappe.qb.DocType("POS Invoice")
+	query = (
+		frappe.qb.update(pos_invoice)
+		.set(pos_invoice.consolidated_invoice, consolidated_invoice)
+		.set(pos_invoice.modified, now())
+		.set(pos_invoice.modified_by, frappe.session.user)
+		.where(pos_invoice.name.isin(pos_invoices))
+	)
+
+	if status:
+		query = query.set(pos_invoice.status, status)
+
+	query.run()
+
+	for name in pos_invoices:
+		frappe.clear_document_cache("POS Invoice", name)
 
-	if not consolidated_tax_detail:
-		consolidated_tax_detail = {}
 
+def merge_item_wise_tax_detail(consolidated_tax_detail, tax_row_detail):
 	for item_code, tax_data in tax_row_detail.items():
-		if consolidated_tax_detail.get(item_code):
-			consolidated_tax_data = consolidated_tax_detail.get(item_code)
-			consolidated_tax_detail.update(
-				{item_code: [consolidated_tax_data[0], consolidated_tax_data[1] + tax_data[1]]}
-			)
+		if consolidated_tax_data := consolidated_tax_detail.get(item_code):
+			consolidated_tax_detail[item_code] = [
+				consolidated_tax_data[0],
+				consolidated_tax_data[1] + tax_data[1],
+			]
 		else:
-			consolidated_tax_detail.update({item_code: [tax_data[0], tax_data[1]]})
+			consolidated_tax_detail[item_code] = [tax_data[0], tax_data[1]]
+
+
+def update_item_wise_tax_detail(consolidate_tax_row, tax_row):
+	consolidated_tax_detail = json.loads(consolidate_tax_row.item_wise_tax_detail) or {}
+	merge_item_wise_tax_detail(consolidated_tax_detail, json.loads(tax_row.item_wise_tax_detail))
 
 	consolidate_tax_row.item_wise_tax_detail = json.dumps(
 		consolidated_tax_detail, separators=(",", ":")
@@ -376,17 +434,72 @@ def consolidate_pos_invoices(pos_invoices=None, closing_entry=None):
 	if frappe.flags.in_test and not invoices:
 		invoices = get_all_unconsolidated_invoices()
 
+	if closing_entry:
+		# on retry, only the invoices of the chunks which failed are left to be consolidated
+		invoices = get_unconsolidated_invoices(invoices)
+
 	invoice_by_customer = get_invoice_customer_map(invoices)
 
 	if len(invoices) >= 10 and closing_entry:
 		closing_entry.set_status(update=True, status="Queued")
-		enqueue_job(
-			create_merge_logs, invoice_by_customer=invoice_by_customer, closing_entry=closing_entry
-		)
+		closing_entry.db_set("error_message", "")
+
+		chunks = get_customer_chunks(invoice_by_customer)
+		if len(chunks) == 1:
+			enqueue_job(
+				create_merge_logs, invoice_by_customer=invoice_by_customer, closing_entry=closing_entry
+			)
+			return
+
+		for chunk_idx, chunk in enumerate(chunks):
+			enqueue_job(
+				create_merge_logs_for_chunk,
+				invoice_by_customer=chunk,
+				closing_entry=closing_entry,
+				chunk_idx=chunk_idx,
+			)
 	else:
 		create_merge_logs(invoice_by_customer, closing_entry)
 
 
+def get_unconsolidated_invoices(invoices):
+	if not invoices:
+		return invoices
+
+	unconsolidated = frappe.get_all(
+		"POS Invoice",
+		filters={
+			"name": ("in", [d.get("pos_invoice") for d in invoices]),
+			"consolidated_invoice": ("is", "not set"),
+		},
+		pluck="name",
+	)
+
+	return [d for d in invoices if d.get("pos_invoice") in unconsolidated]
+
+
+def get_customer_chunks(invoice_by_customer, chunk_size=None):
+	"""Split customer wise invoices into chunks of roughly `chunk_size` invoices.
+
+	The invoices of a customer are never split across chunks, as they are merged together."""
+
+	chunk_size = chunk_size or POS_CONSOLIDATION_CHUNK_SIZE
+	chunks, current_chunk, current_size = [], {}, 0
+
+	for customer, invoices in invoice_by_customer.items():
+		if current_chunk and current_size + len(invoices) > chunk_size:
+			chunks.append(current_chunk)
+			current_chunk, current_size = {}, 0
+
+		current_chunk[customer] = invoices
+		current_size += len(invoices)
+
+	if current_chunk:
+		chunks.append(current_chunk)
+
+	return chunks
+
+
 def unconsolidate_pos_invoices(closing_entry):
 	merge_logs = frappe.get_all(
 		"POS Invoice Merge Log", filters={"pos_closing_entry": closing_entry.name}, pluck="name"
@@ -454,22 +567,60 @@ def split_invoices(invoices):
 	return _invoices
 
 
+def make_merge_logs(invoice_by_customer, closing_entry=None):
+	for customer, invoices in invoice_by_customer.items():
+		for _invoices in split_invoices(invoices):
+			merge_log = frappe.new_doc("POS Invoice Merge Log")
+			merge_log.posting_date = (
+				getdate(closing_entry.get("posting_date")) if closing_entry else nowdate()
+			)
+			merge_log.posting_time = (
+				get_time(closing_entry.get("posting_time")) if closing_entry else nowtime()
+			)
+			merge_log.customer = customer
+			merge_log.pos_closing_entry = closing_entry.get("name") if closing_entry else None
+			merge_log.set("pos_invoices", _invoices)
+			merge_log.save(ignore_permissions=True)
+			merge_log.submit()
+
+
+def create_merge_logs_for_chunk(invoice_by_customer, closing_entry, chunk_idx=0):
+	"""Consolidate one chunk of customers of a closing entry, committed independently of other chunks.
+
+	The last chunk to finish marks the closing entry as submitted, a failed chunk marks it as failed
+	and can be retried from the closing entry."""
+
+	try:
+		make_merge_logs(invoice_by_customer, closing_entry)
+		frappe.db.commit()
+
+	except Exception as e:
+		frappe.db.rollback()
+		message_log = frappe.message_log.pop() if frappe.message_log else str(e)
+		error_message = _("Chunk {0}: {1}").format(chunk_idx + 1, get_error_message(message_log))
+
+		# lock the closing entry so that errors of concurrently failing chunks are not lost
+		frappe.db.get_value("POS Closing Entry", closing_entry.name, "name", for_update=True)
+		previous_error = frappe.db.get_value("POS Closing Entry", closing_entry.name, "error_message")
+		closing_entry.set_status(update=True, status="Failed")
+		closing_entry.db_set("error_message", "\n".join(filter(None, [previous_error, error_message])))
+		frappe.db.commit()
+		frappe.publish_realtime("closing_process_complete", user=frappe.session.user)
+		raise
+
+	frappe.db.get_value("POS Closing Entry", closing_entry.name, "name", for_update=True)
+	if not get_unconsolidated_invoices(closing_entry.get("pos_transactions")):
+		if frappe.db.get_value("POS Closing Entry", closing_entry.name, "status") != "Failed":
+			closing_entry.set_status(update=True, status="Submitted")
+			closing_entry.update_opening_entry()
+
+	frappe.db.commit()
+	frappe.publish_realtime("closing_process_complete", user=frappe.session.user)
+
+
 def create_merge_logs(invoice_by_customer, closing_entry=None):
 	try:
-		for customer, invoices in invoice_by_customer.items():
-			for _invoices in split_invoices(invoices):
-				merge_log = frappe.new_doc("POS Invoice Merge Log")
-				merge_log.posting_date = (
-					getdate(closing_entry.get("posting_date")) if closing_entry else nowdate()
-				)
-				merge_log.posting_time = (
-					get_time(closing_entry.get("posting_time")) if closing_entry else nowtime()
-				)
-				merge_log.customer = customer
-				merge_log.pos_closing_entry = closing_entry.get("name") if closing_entry else None
-				merge_log.set("pos_invoices", _invoices)
-				merge_log.save(ignore_permissions=True)
-				merge_log.submit()
+		make_merge_logs(invoice_by_customer, closing_entry)
 		if closing_entry:
 			closing_entry.set_status(update=True, status="Submitted")
 			closing_entry.db_set("error_message", "")
@@ -525,6 +676,8 @@ def enqueue_job(job, **kwargs):
 	closing_entry = kwargs.get("closing_entry") or {}
 
 	job_id = "pos_invoice_merge::" + str(closing_entry.get("name"))
+	if kwargs.get("chunk_idx") is not None:
+		job_id += "::" + str(kwargs.get("chunk_idx"))
 	if not is_job_enqueued(job_id):
 		enqueue(
 			job,
@@ -536,12 +689,13 @@ def enqueue_job(job, **kwargs):
 			now=frappe.conf.developer_mode or frappe.flags.in_test
 		)
 
-		if job == create_merge_logs:
+		if job in (create_merge_logs, create_merge_logs_for_chunk):
 			msg = _("POS Invoices will be consolidated in a background process")
 		else:
 			msg = _("POS Invoices will be unconsolidated in a background process")
 
-		frappe.msgprint(msg, alert=1)
+		if not kwargs.get("chunk_idx"):
+			frappe.msgprint(msg, alert=1)
 
 
 def check_scheduler_status():
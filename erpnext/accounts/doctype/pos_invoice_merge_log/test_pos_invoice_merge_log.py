@@ -12,6 +12,8 @@ from erpnext.accounts.doctype.pos_invoice.pos_invoice import make_sales_return
 from erpnext.accounts.doctype.pos_invoice.test_pos_invoice import create_pos_invoice
 from erpnext.accounts.doctype.pos_invoice_merge_log.pos_invoice_merge_log import (
 	consolidate_pos_invoices,
+	get_customer_chunks,
+	get_pos_invoice_docs,
 )
 from erpnext.stock.doctype.serial_and_batch_bundle.test_serial_and_batch_bundle import (
 	get_serial_nos_from_bundle,
@@ -20,6 +22,14 @@ from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
 
 
 class TestPOSInvoiceMergeLog(unittest.TestCase):
+	def test_customer_chunks(self):
+		invoice_by_customer = {"A": [1, 2, 3], "B": [4], "C": [5, 6], "D": [7, 8, 9, 10]}
+
+		chunks = get_customer_chunks(invoice_by_customer, chunk_size=3)
+
+		# invoices of a customer are never split across chunks
+		self.assertEqual([list(chunk) for chunk in chunks], [["A"], ["B", "C"], ["D"]])
+
 	def test_consolidated_invoice_creation(self):
 		frappe.db.sql("delete from `tabPOS Invoice`")
 
@@ -46,6 +56,7 @@ class TestPOSInvoiceMergeLog(unittest.TestCase):
 
 			pos_inv.load_from_db()
 			self.assertTrue(frappe.db.exists("Sales Invoice", pos_inv.consolidated_invoice))
+			self.assertEqual(pos_inv.status, "Consolidated")
 
 			pos_inv3.load_from_db()
 			self.assertTrue(frappe.db.exists("Sales Invoice", pos_inv3.consolidated_invoice))
@@ -166,6 +177,49 @@ class TestPOSInvoiceMergeLog(unittest.TestCase):
 			frappe.db.sql("delete from `tabPOS Profile`")
 			frappe.db.sql("delete from `tabPOS Invoice`")
 
+	def test_pos_invoice_docs_with_merged_rows(self):
+		frappe.db.sql("delete from `tabPOS Invoice`")
+
+		try:
+			init_user_and_profile()
+
+			invoices = []
+			for rate in (100, 250):
+				inv = create_pos_invoice(qty=2, rate=rate, do_not_save=True)
+				inv.append(
+					"items", {**inv.items[0].as_dict(), "name": None, "idx": None, "item_code": "_Test Item 2"}
+				)
+				inv.append(
+					"taxes",
+					{
+						"account_head": "_Test Account VAT - _TC",
+						"charge_type": "On Net Total",
+						"cost_center": "_Test Cost Center - _TC",
+						"description": "VAT",
+						"rate": 9,
+					},
+				)
+				inv.append(
+					"payments", {"mode_of_payment": "Cash", "account": "Cash - _TC", "amount": 4 * rate}
+				)
+				inv.insert()
+				inv.submit()
+				invoices.append(inv.name)
+
+			# rows fetched for all invoices at once are the rows of each invoice
+			for doc in get_pos_invoice_docs(invoices):
+				expected = frappe.get_doc("POS Invoice", doc.name)
+				self.assertEqual(doc.grand_total, expected.grand_total)
+				for fieldname in ("items", "taxes", "payments"):
+					self.assertEqual(
+						[d.as_dict() for d in doc.get(fieldname)],
+						[d.as_dict() for d in expected.get(fieldname)],
+					)
+		finally:
+			frappe.set_user("Administrator")
+			frappe.db.sql("delete from `tabPOS Profile`")
+			frappe.db.sql("delete from `tabPOS Invoice`")
+
 	def test_consolidation_round_off_error_1(self):
 		"""
 		Test round off error in consolidated invoice creation if POS Invoice has inclusive tax
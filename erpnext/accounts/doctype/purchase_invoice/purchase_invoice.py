@@ -11,6 +11,10 @@ from frappe.utils import cint, cstr, flt, formatdate, get_link_to_form, getdate,
 import erpnext
 from erpnext.accounts.deferred_revenue import validate_service_stop_date
 from erpnext.accounts.doctype.gl_entry.gl_entry import update_outstanding_amt
+from erpnext.accounts.doctype.item_tax_ledger_entry.item_tax_ledger_entry import (
+	delete_item_tax_ledger_entries,
+	make_item_tax_ledger_entries,
+)
 from erpnext.accounts.doctype.repost_accounting_ledger.repost_accounting_ledger import (
 	validate_docs_for_deferred_accounting,
 	validate_docs_for_voucher_types,
@@ -23,6 +27,9 @@ from erpnext.accounts.doctype.sales_invoice.sales_invoice import (
 	update_linked_doc,
 	validate_inter_company_party,
 )
+from erpnext.accounts.doctype.tax_withholding_balance.tax_withholding_balance import (
+	update_tax_withholding_balance,
+)
 from erpnext.accounts.doctype.tax_withholding_category.tax_withholding_category import (
 	get_party_tax_withholding_details,
 )
@@ -703,6 +710,8 @@ class PurchaseInvoice(BuyingController):
 
 		# this sequence because outstanding may get -negative
 		self.make_gl_entries()
+		make_item_tax_ledger_entries(self)
+		update_tax_withholding_balance(self)
 
 		if self.update_stock == 1:
 			self.repost_future_sle_and_gle()
@@ -1485,6 +1494,8 @@ class PurchaseInvoice(BuyingController):
 				self.set_consumed_qty_in_subcontract_order()
 
 		self.make_gl_entries_on_cancel()
+		delete_item_tax_ledger_entries(self)
+		update_tax_withholding_balance(self, cancel=True)
 
 		if self.update_stock == 1:
 			self.repost_future_sle_and_gle()
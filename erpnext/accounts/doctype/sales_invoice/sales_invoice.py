@@ -11,6 +11,10 @@ from frappe.utils import add_days, cint, flt, formatdate, get_link_to_form, getd
 
 import erpnext
 from erpnext.accounts.deferred_revenue import validate_service_stop_date
+from erpnext.accounts.doctype.item_tax_ledger_entry.item_tax_ledger_entry import (
+	delete_item_tax_ledger_entries,
+	make_item_tax_ledger_entries,
+)
 from erpnext.accounts.doctype.loyalty_program.loyalty_program import (
 	get_loyalty_program_details_with_points,
 	validate_loyalty_points,
@@ -19,6 +23,9 @@ from erpnext.accounts.doctype.repost_accounting_ledger.repost_accounting_ledger
 	validate_docs_for_deferred_accounting,
 	validate_docs_for_voucher_types,
 )
+from erpnext.accounts.doctype.tax_withholding_balance.tax_withholding_balance import (
+	update_tax_withholding_balance,
+)
 from erpnext.accounts.doctype.tax_withholding_category.tax_withholding_category import (
 	get_party_tax_withholding_details,
 )
@@ -37,7 +44,6 @@ from erpnext.assets.doctype.asset_activity.asset_activity import add_asset_activ
 from erpnext.controllers.accounts_controller import validate_account_head
 from erpnext.controllers.selling_controller import SellingController
 from erpnext.projects.doctype.timesheet.timesheet import get_projectwise_timesheet_data
-from erpnext.setup.doctype.company.company import update_company_current_month_sales
 from erpnext.stock.doctype.delivery_note.delivery_note import update_billed_amount_based_on_so
 from erpnext.stock.doctype.serial_no.serial_no import get_delivery_note_serial_no, get_serial_nos
 
@@ -201,6 +207,7 @@ class SalesInvoice(SellingController):
 		subscription: DF.Link | None
 		tax_category: DF.Link | None
 		tax_id: DF.Data | None
+		tax_withholding_category: DF.Link | None
 		taxes: DF.Table[SalesTaxesandCharges]
 		taxes_and_charges: DF.Link | None
 		tc_name: DF.Link | None
@@ -391,6 +398,10 @@ class SalesInvoice(SellingController):
 			validate_account_head(item.idx, item.income_account, self.company, "Income")
 
 	def set_tax_withholding(self):
+		# kept on the invoice, so that cancelling it reverses the balance it was submitted to
+		self.tax_withholding_category = frappe.get_cached_value(
+			"Customer", self.customer, "tax_withholding_category"
+		)
 		tax_withholding_details = get_party_tax_withholding_details(self)
 
 		if not tax_withholding_details:
@@ -449,6 +460,8 @@ class SalesInvoice(SellingController):
 
 		# this sequence because outstanding may get -ve
 		self.make_gl_entries()
+		make_item_tax_ledger_entries(self)
+		update_tax_withholding_balance(self)
 
 		if self.update_stock == 1:
 			self.repost_future_sle_and_gle()
@@ -466,7 +479,6 @@ class SalesInvoice(SellingController):
 		if (
 			frappe.db.get_single_value("Selling Settings", "sales_update_frequency") == "Each Transaction"
 		):
-			update_company_current_month_sales(self.company)
 			self.update_project()
 		update_linked_doc(self.doctype, self.name, self.inter_company_invoice_reference)
 
@@ -553,6 +565,8 @@ class SalesInvoice(SellingController):
 			self.update_stock_ledger()
 
 		self.make_gl_entries_on_cancel()
+		delete_item_tax_ledger_entries(self)
+		update_tax_withholding_balance(self, cancel=True)
 
 		if self.update_stock == 1:
 			self.repost_future_sle_and_gle()
@@ -563,7 +577,6 @@ class SalesInvoice(SellingController):
 		if (
 			frappe.db.get_single_value("Selling Settings", "sales_update_frequency") == "Each Transaction"
 		):
-			update_company_current_month_sales(self.company)
 			self.update_project()
 		if not self.is_return and not self.is_consolidated and self.loyalty_program:
 			self.delete_loyalty_point_entry()
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Union
 import frappe
 from frappe import _
 from frappe.model.document import Document
+from frappe.query_builder.functions import Max
 from frappe.utils.data import (
 	add_days,
 	add_months,
@@ -38,6 +39,9 @@ class InvoiceNotCancelled(frappe.ValidationError):
 
 DateTimeLikeObject = Union[str, datetime.date]
 
+SUBSCRIPTION_CHUNK_SIZE = 500
+SUBSCRIPTION_PROCESS_RETRIES = 3
+
 
 class Subscription(Document):
 	# begin: auto-generated types
@@ -491,8 +495,10 @@ class Subscription(Document):
 
 		items = []
 		party = self.party
+		accounting_dimensions = get_accounting_dimensions()
+
 		for plan in plans:
-			plan_doc = frappe.get_doc("Subscription Plan", plan.plan)
+			plan_doc = frappe.get_cached_doc("Subscription Plan", plan.plan)
 
 			item_code = plan_doc.item
 
@@ -501,7 +507,7 @@ class Subscription(Document):
 			else:
 				deferred_field = "enable_deferred_expense"
 
-			deferred = frappe.db.get_value("Item", item_code, deferred_field)
+			deferred = frappe.get_cached_value("Item", item_code, deferred_field)
 
 			if not prorate:
 				item = {
@@ -540,8 +546,6 @@ class Subscription(Document):
 					}
 				)
 
-			accounting_dimensions = get_accounting_dimensions()
-
 			for dimension in accounting_dimensions:
 				if plan_doc.get(dimension):
 					item.update({dimension: plan_doc.get(dimension)})
@@ -729,18 +733,117 @@ def process_all(
 	subscription: str | None = None, posting_date: Optional["DateTimeLikeObject"] = None
 ) -> None:
 	"""
-	Task to updates the status of all `Subscription` apart from those that are cancelled
+	Task to updates the status of all `Subscription` apart from those that are cancelled.
+	Large runs are split into chunks that are processed by parallel background jobs.
 	"""
-	filters = {"status": ("!=", "Cancelled")}
-
 	if subscription:
-		filters["name"] = subscription
-
-	for subscription in frappe.get_all("Subscription", filters, pluck="name"):
-		try:
-			subscription = frappe.get_doc("Subscription", subscription)
-			subscription.process(posting_date)
-			frappe.db.commit()
-		except frappe.ValidationError:
-			frappe.db.rollback()
-			subscription.log_error("Subscription failed")
+		subscriptions = frappe.get_all(
+			"Subscription", {"status": ("!=", "Cancelled"), "name": subscription}, pluck="name"
+		)
+	else:
+		subscriptions = get_subscriptions_to_process(posting_date)
+
+	chunks = [
+		subscriptions[i : i + SUBSCRIPTION_CHUNK_SIZE]
+		for i in range(0, len(subscriptions), SUBSCRIPTION_CHUNK_SIZE)
+	]
+
+	if len(chunks) <= 1:
+		process_subscriptions(subscriptions, posting_date)
+		return
+
+	for idx, chunk in enumerate(chunks):
+		frappe.enqueue(
+			process_subscriptions,
+			queue="long",
+			timeout=3600,
+			job_id=f"process_subscriptions::{getdate(posting_date)}::{idx}",
+			deduplicate=True,
+			enqueue_after_commit=True,
+			subscriptions=chunk,
+			posting_date=posting_date,
+		)
+
+
+def get_subscriptions_to_process(posting_date: Optional["DateTimeLikeObject"] = None) -> List[str]:
+	"""
+	Returns the `Subscription`s which can change on `posting_date`: a billing period boundary,
+	the end date or a trial is due, or an invoice is outstanding past its due date.
+	The rest have nothing to do and are not loaded at all.
+	"""
+	posting_date = getdate(posting_date)
+	subscription = frappe.qb.DocType("Subscription")
+
+	max_days_before = (
+		frappe.qb.from_(subscription)
+		.select(Max(subscription.number_of_days))
+		.where(subscription.generate_invoice_at == "Days before the current subscription period")
+		.run()
+	)
+	max_days_before = cint(max_days_before[0][0]) if max_days_before else 0
+
+	due_subscriptions = set(
+		frappe.qb.from_(subscription)
+		.select(subscription.name)
+		.where(subscription.status != "Cancelled")
+		.where(
+			(subscription.current_invoice_end <= posting_date)
+			| (
+				(subscription.generate_invoice_at != "End of the current subscription period")
+				& (subscription.current_invoice_start <= add_days(posting_date, max_days_before))
+			)
+			| (subscription.end_date <= posting_date)
+			| (subscription.status.isin(["Trialling", "Past Due Date", "Unpaid"]))
+		)
+		.run(pluck=True)
+	)
+
+	# past due date and grace period boundaries are on the invoices
+	for invoice_doctype in ("Sales Invoice", "Purchase Invoice"):
+		invoice = frappe.qb.DocType(invoice_doctype)
+		due_subscriptions.update(
+			frappe.qb.from_(invoice)
+			.inner_join(subscription)
+			.on(subscription.name == invoice.subscription)
+			.select(invoice.subscription)
+			.distinct()
+			.where(
+				(subscription.status != "Cancelled")
+				& (invoice.docstatus < 2)
+				& (invoice.status != "Paid")
+				& (invoice.due_date <= posting_date)
+			)
+			.run(pluck=True)
+		)
+
+	return sorted(due_subscriptions)
+
+
+def process_subscriptions(
+	subscriptions: List[str], posting_date: Optional["DateTimeLikeObject"] = None
+) -> None:
+	"""
+	Processes a chunk of `Subscription`s. Each one is committed on its own so that a failure,
+	or a lock lost to another worker (which is retried), does not undo the rest of the chunk.
+	"""
+	for subscription in subscriptions:
+		for attempt in range(1, SUBSCRIPTION_PROCESS_RETRIES + 1):
+			try:
+				frappe.get_doc("Subscription", subscription).process(posting_date)
+				frappe.db.commit()
+				break
+			except (frappe.QueryDeadlockError, frappe.QueryTimeoutError):
+				frappe.db.rollback()
+				if attempt == SUBSCRIPTION_PROCESS_RETRIES:
+					log_subscription_error(subscription)
+			except frappe.ValidationError:
+				frappe.db.rollback()
+				log_subscription_error(subscription)
+				break
+
+
+def log_subscription_error(subscription: str) -> None:
+	frappe.log_error(
+		"Subscription failed", reference_doctype="Subscription", reference_name=subscription
+	)
+	frappe.db.commit()
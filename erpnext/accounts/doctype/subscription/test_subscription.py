@@ -17,7 +17,10 @@ from frappe.utils.data import (
 	nowdate,
 )
 
-from erpnext.accounts.doctype.subscription.subscription import get_prorata_factor
+from erpnext.accounts.doctype.subscription.subscription import (
+	get_prorata_factor,
+	get_subscriptions_to_process,
+)
 
 test_dependencies = ("UOM", "Item Group", "Item")
 
@@ -526,6 +529,22 @@ class TestSubscription(FrappeTestCase):
 		subscription.process(posting_date="2023-01-22")
 		self.assertEqual(len(subscription.invoices), 2)
 
+	def test_subscriptions_to_process(self):
+		end_of_period = create_subscription(start_date="2021-01-01")
+		days_before = create_subscription(
+			start_date="2021-02-01",
+			generate_invoice_at="Days before the current subscription period",
+			number_of_days=5,
+		)
+
+		# nothing falls due in the middle of the billing period
+		due = get_subscriptions_to_process("2021-01-15")
+		self.assertNotIn(end_of_period.name, due)
+		self.assertNotIn(days_before.name, due)
+
+		self.assertIn(days_before.name, get_subscriptions_to_process("2021-01-27"))
+		self.assertIn(end_of_period.name, get_subscriptions_to_process("2021-01-31"))
+
 
 def make_plans():
 	create_plan(plan_name="_Test Plan Name", cost=900)
@@ -45,13 +45,13 @@ class SubscriptionPlan(Document):
 def get_plan_rate(
 	plan, quantity=1, customer=None, start_date=None, end_date=None, prorate_factor=1, party=None
 ):
-	plan = frappe.get_doc("Subscription Plan", plan)
+	plan = frappe.get_cached_doc("Subscription Plan", plan)
 	if plan.price_determination == "Fixed Rate":
 		return plan.cost * prorate_factor
 
 	elif plan.price_determination == "Based On Price List":
 		if customer:
-			customer_group = frappe.db.get_value("Customer", customer, "customer_group")
+			customer_group = frappe.get_cached_value("Customer", customer, "customer_group")
 		else:
 			customer_group = None
 
@@ -0,0 +1,355 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import flt, getdate
+
+BALANCE_FIELDS = ("taxable_amount", "total_amount", "tax_amount")
+
+
+class TaxWithholdingBalance(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		company: DF.Link | None
+		from_date: DF.Date | None
+		party: DF.DynamicLink | None
+		party_type: DF.Link | None
+		tax_amount: DF.Currency
+		tax_withholding_category: DF.Link | None
+		taxable_amount: DF.Currency
+		to_date: DF.Date | None
+		total_amount: DF.Currency
+	# end: auto-generated types
+
+	pass
+
+
+def get_withholding_period(tax_withholding_category, posting_date, company):
+	"""Account head and rate period of the category for the posting date"""
+	tax_withholding = frappe.get_cached_doc("Tax Withholding Category", tax_withholding_category)
+
+	account_head = next((d.account for d in tax_withholding.accounts if d.company == company), None)
+	rate = next(
+		(
+			d
+			for d in tax_withholding.rates
+			if getdate(d.from_date) <= getdate(posting_date) <= getdate(d.to_date)
+		),
+		None,
+	)
+
+	if account_head and rate:
+		return frappe._dict(
+			{"account_head": account_head, "from_date": rate.from_date, "to_date": rate.to_date}
+		)
+
+
+def get_voucher_tax_withholding(doc):
+	"""Amounts a submitted voucher adds to the tax withholding balances of its parties"""
+	if doc.get("is_opening") == "Yes":
+		return []
+
+	party_amounts = {}
+	if doc.doctype == "Purchase Invoice":
+		if not (doc.apply_tds and doc.tax_withholding_category):
+			return []
+
+		tax_withholding_category, party_type = doc.tax_withholding_category, "Supplier"
+		party_amounts[doc.supplier] = flt(doc.base_tax_withholding_net_total)
+
+	elif doc.doctype == "Sales Invoice":
+		# the Customer's category when the invoice was submitted, it may have changed since
+		tax_withholding_category = doc.get("tax_withholding_category")
+		if not tax_withholding_category:
+			return []
+
+		party_type = "Customer"
+		party_amounts[doc.customer] = flt(doc.base_net_total)
+
+	elif doc.doctype == "Payment Entry":
+		if not (
+			doc.party_type == "Supplier"
+			and doc.apply_tax_withholding_amount
+			and doc.tax_withholding_category
+		):
+			return []
+
+		tax_withholding_category, party_type = doc.tax_withholding_category, "Supplier"
+		party_amounts[doc.party] = flt(doc.base_paid_amount)
+
+	elif doc.doctype == "Journal Entry":
+		if not (doc.apply_tds and doc.tax_withholding_category):
+			return []
+
+		tax_withholding_category, party_type = doc.tax_withholding_category, None
+		for d in doc.accounts:
+			if d.party_type in ("Supplier", "Customer") and d.party:
+				party_type = party_type or d.party_type
+				if d.party_type == party_type:
+					party_amounts.setdefault(d.party, 0.0)
+					party_amounts[d.party] += flt(d.credit) - flt(d.debit)
+	else:
+		return []
+
+	period = get_withholding_period(tax_withholding_category, doc.posting_date, doc.company)
+	if not period or not party_amounts:
+		return []
+
+	tax_amount = get_voucher_tax_amount(doc, period.account_head)
+
+	entries = []
+	for idx, (party, amount) in enumerate(party_amounts.items()):
+		# tax of a journal entry is booked against its first party, like the TDS reports do
+		party_tax_amount = tax_amount if idx == 0 else 0.0
+		total_amount = 0.0
+		if party_tax_amount:
+			total_amount = flt(doc.total_amount) if doc.doctype == "Journal Entry" else amount
+
+		entries.append(
+			frappe._dict(
+				{
+					"company": doc.company,
+					"tax_withholding_category": tax_withholding_category,
+					"party_type": party_type,
+					"party": party,
+					"from_date": period.from_date,
+					"to_date": period.to_date,
+					"taxable_amount": amount,
+					"total_amount": total_amount,
+					"tax_amount": party_tax_amount,
+				}
+			)
+		)
+
+	return entries
+
+
+def get_voucher_tax_amount(doc, account_head):
+	"""Tax credited to the withholding account by the voucher"""
+	tax_amount = 0.0
+	if doc.doctype == "Journal Entry":
+		for d in doc.accounts:
+			if d.account == account_head:
+				tax_amount += flt(d.credit) - flt(d.debit)
+
+		return tax_amount
+
+	for d in doc.get("taxes"):
+		if d.account_head != account_head:
+			continue
+
+		amount = flt(d.get("base_tax_amount_after_discount_amount") or d.get("base_tax_amount"))
+		if doc.doctype == "Sales Invoice":
+			tax_amount += amount
+		else:
+			# TDS is deducted from the payable, so it is a credit to the withholding account
+			tax_amount += amount if d.get("add_deduct_tax") == "Deduct" else -amount
+
+	return tax_amount
+
+
+def update_tax_withholding_balance(doc, cancel=False):
+	"""Add the voucher to its parties' running balances on submit and remove it on cancel"""
+	twb = frappe.qb.DocType("Tax Withholding Balance")
+	sign = -1 if cancel else 1
+
+	for entry in get_voucher_tax_withholding(doc):
+		name = get_balance_name(entry)
+		if not name:
+			# built from submitted vouchers, which already reflect this submit or cancel
+			name, is_new = get_or_make_tax_withholding_balance(entry)
+			if is_new:
+				continue
+
+		query = frappe.qb.update(twb).where(twb.name == name)
+		for field in BALANCE_FIELDS:
+			query = query.set(twb[field], twb[field] + sign * flt(entry.get(field)))
+		query.run()
+
+
+def get_balance_name(key):
+	return frappe.db.get_value(
+		"Tax Withholding Balance",
+		{
+			"company": key.company,
+			"tax_withholding_category": key.tax_withholding_category,
+			"party_type": key.party_type,
+			"party": key.party,
+			"from_date": key.from_date,
+			"to_date": key.to_date,
+		},
+		"name",
+		for_update=True,
+	)
+
+
+def get_tax_withholding_balance(company, tax_withholding_category, party_type, parties, period):
+	"""Running totals of the parties (e.g. all suppliers with the same PAN) for the rate period"""
+	twb = frappe.qb.DocType("Tax Withholding Balance")
+	balances = (
+		frappe.qb.from_(twb)
+		.select(twb.party, *[twb[field] for field in BALANCE_FIELDS])
+		.where(
+			(twb.company == company)
+			& (twb.tax_withholding_category == tax_withholding_category)
+			& (twb.party_type == party_type)
+			& (twb.party.isin(parties))
+			& (twb.from_date == period.from_date)
+			& (twb.to_date == period.to_date)
+		)
+		.run(as_dict=True)
+	)
+
+	# balances are only saved on submit, so validating a draft does not write them
+	for party in set(parties) - {d.party for d in balances}:
+		balances.append(
+			build_tax_withholding_balance(
+				frappe._dict(
+					{
+						"company": company,
+						"tax_withholding_category": tax_withholding_category,
+						"party_type": party_type,
+						"party": party,
+						"from_date": period.from_date,
+						"to_date": period.to_date,
+					}
+				)
+			)
+		)
+
+	return frappe._dict({field: sum(flt(d.get(field)) for d in balances) for field in BALANCE_FIELDS})
+
+
+def get_or_make_tax_withholding_balance(key):
+	"""Returns the name of the party's balance for the rate period and whether it was made now.
+
+	A balance made by a concurrent submit, which could not see this voucher, is returned
+	as existing so that the voucher is added to it."""
+	savepoint = "make_tax_withholding_balance"
+	try:
+		frappe.db.savepoint(savepoint)
+		balance = build_tax_withholding_balance(key)
+		balance.flags.ignore_permissions = True
+		balance.insert()
+		return balance.name, True
+	except (frappe.DuplicateEntryError, frappe.UniqueValidationError):
+		frappe.db.rollback(save_point=savepoint)  # preserve transaction in postgres
+		return get_balance_name(key), False
+
+
+def build_tax_withholding_balance(key):
+	"""Balance of a party for a rate period from its submitted vouchers, not saved"""
+	balance = frappe.new_doc("Tax Withholding Balance")
+	balance.update(
+		{
+			"company": key.company,
+			"tax_withholding_category": key.tax_withholding_category,
+			"party_type": key.party_type,
+			"party": key.party,
+			"from_date": key.from_date,
+			"to_date": key.to_date,
+		}
+	)
+
+	for doctype, name in get_party_vouchers(key):
+		for entry in get_voucher_tax_withholding(frappe.get_doc(doctype, name)):
+			if (
+				entry.party == key.party
+				and entry.tax_withholding_category == key.tax_withholding_category
+				and getdate(entry.from_date) == getdate(key.from_date)
+			):
+				for field in BALANCE_FIELDS:
+					balance.set(field, flt(balance.get(field)) + flt(entry.get(field)))
+
+	return balance
+
+
+def get_party_vouchers(key):
+	filters = {
+		"company": key.company,
+		"docstatus": 1,
+		"posting_date": ["between", (key.from_date, key.to_date)],
+	}
+
+	vouchers = []
+	if key.party_type == "Customer":
+		vouchers += [
+			("Sales Invoice", name)
+			for name in frappe.get_all(
+				"Sales Invoice",
+				filters={
+					**filters,
+					"customer": key.party,
+					"tax_withholding_category": key.tax_withholding_category,
+				},
+				pluck="name",
+			)
+		]
+	else:
+		vouchers += [
+			("Purchase Invoice", name)
+			for name in frappe.get_all(
+				"Purchase Invoice",
+				filters={
+					**filters,
+					"supplier": key.party,
+					"apply_tds": 1,
+					"tax_withholding_category": key.tax_withholding_category,
+				},
+				pluck="name",
+			)
+		]
+		vouchers += [
+			("Payment Entry", name)
+			for name in frappe.get_all(
+				"Payment Entry",
+				filters={
+					**filters,
+					"party_type": key.party_type,
+					"party": key.party,
+					"apply_tax_withholding_amount": 1,
+					"tax_withholding_category": key.tax_withholding_category,
+				},
+				pluck="name",
+			)
+		]
+
+	je = frappe.qb.DocType("Journal Entry")
+	jea = frappe.qb.DocType("Journal Entry Account")
+	vouchers += [
+		("Journal Entry", name)
+		for name in (
+			frappe.qb.from_(je)
+			.inner_join(jea)
+			.on(je.name == jea.parent)
+			.select(je.name)
+			.distinct()
+			.where(
+				(je.company == key.company)
+				& (je.docstatus == 1)
+				& (je.posting_date[key.from_date : key.to_date])
+				& (je.apply_tds == 1)
+				& (je.tax_withholding_category == key.tax_withholding_category)
+				& (jea.party_type == key.party_type)
+				& (jea.party == key.party)
+			)
+			.run(pluck=True)
+		)
+	]
+
+	return vouchers
+
+
+def on_doctype_update():
+	frappe.db.add_unique(
+		"Tax Withholding Balance",
+		["party", "tax_withholding_category", "from_date", "to_date", "party_type", "company"],
+		constraint_name="unique_party_period",
+	)
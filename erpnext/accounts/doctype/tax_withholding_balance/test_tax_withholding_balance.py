@@ -0,0 +1,121 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import nowdate
+
+from erpnext.accounts.doctype.tax_withholding_balance.tax_withholding_balance import (
+	get_or_make_tax_withholding_balance,
+	get_withholding_period,
+)
+from erpnext.accounts.doctype.tax_withholding_category.test_tax_withholding_category import (
+	create_purchase_invoice,
+	create_records,
+	create_sales_invoice,
+	create_tax_withholding_category_records,
+)
+
+
+class TestTaxWithholdingBalance(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		create_records()
+		create_tax_withholding_category_records()
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def get_balance(self, party, party_type="Supplier"):
+		balance = frappe.db.get_value(
+			"Tax Withholding Balance",
+			{"party_type": party_type, "party": party, "company": "_Test Company"},
+			["taxable_amount", "total_amount", "tax_amount"],
+			as_dict=1,
+		)
+		return balance or frappe._dict(taxable_amount=0, total_amount=0, tax_amount=0)
+
+	def test_balance_on_submit_and_cancel(self):
+		supplier = "Test TDS Supplier"
+		frappe.db.set_value(
+			"Supplier", supplier, "tax_withholding_category", "Cumulative Threshold TDS"
+		)
+		opening = self.get_balance(supplier)
+
+		invoices = []
+		for _ in range(3):
+			pi = create_purchase_invoice(supplier=supplier)
+			pi.submit()
+			invoices.append(pi)
+
+		# third invoice crosses the cumulative threshold and deducts tax on all of them
+		balance = self.get_balance(supplier)
+		self.assertEqual(balance.taxable_amount - opening.taxable_amount, 30000)
+		self.assertEqual(balance.tax_amount - opening.tax_amount, 3000)
+		self.assertEqual(balance.total_amount - opening.total_amount, 10000)
+
+		# tax is deducted on the full amount once the balance has tax deducted
+		pi = create_purchase_invoice(supplier=supplier, rate=5000)
+		pi.submit()
+		self.assertEqual(pi.taxes_and_charges_deducted, 500)
+
+		pi.cancel()
+		invoices[-1].cancel()
+		balance = self.get_balance(supplier)
+		self.assertEqual(balance.taxable_amount - opening.taxable_amount, 20000)
+		self.assertEqual(balance.tax_amount - opening.tax_amount, 0)
+		self.assertEqual(balance.total_amount - opening.total_amount, 0)
+
+	def test_balance_is_saved_on_submit_only(self):
+		supplier = "Test TDS Supplier1"
+		frappe.db.set_value("Supplier", supplier, "tax_withholding_category", "Single Threshold TDS")
+		frappe.db.delete("Tax Withholding Balance", {"party_type": "Supplier", "party": supplier})
+
+		pi = create_purchase_invoice(supplier=supplier, rate=20000)
+		self.assertEqual(pi.taxes_and_charges_deducted, 2000)
+		self.assertFalse(frappe.db.exists("Tax Withholding Balance", {"party": supplier}))
+
+		pi.submit()
+		self.assertEqual(self.get_balance(supplier).tax_amount, 2000)
+
+	def test_balance_is_made_once(self):
+		supplier = "Test TDS Supplier1"
+		frappe.db.delete("Tax Withholding Balance", {"party_type": "Supplier", "party": supplier})
+
+		period = get_withholding_period("Single Threshold TDS", nowdate(), "_Test Company")
+		key = frappe._dict(
+			{
+				"company": "_Test Company",
+				"tax_withholding_category": "Single Threshold TDS",
+				"party_type": "Supplier",
+				"party": supplier,
+				"from_date": period.from_date,
+				"to_date": period.to_date,
+			}
+		)
+
+		name, is_new = get_or_make_tax_withholding_balance(key)
+		self.assertTrue(is_new)
+
+		# a balance made concurrently is not made again
+		self.assertEqual(get_or_make_tax_withholding_balance(key), (name, False))
+		self.assertEqual(frappe.db.count("Tax Withholding Balance", {"party": supplier}), 1)
+
+	def test_cancel_reverses_balance_of_category_on_submit(self):
+		customer = "Test TCS Customer"
+		frappe.db.set_value(
+			"Customer", customer, "tax_withholding_category", "Cumulative Threshold TCS"
+		)
+		opening = self.get_balance(customer, "Customer")
+
+		si = create_sales_invoice(customer=customer)
+		si.submit()
+		self.assertEqual(si.tax_withholding_category, "Cumulative Threshold TCS")
+		self.assertEqual(
+			self.get_balance(customer, "Customer").taxable_amount - opening.taxable_amount, 10000
+		)
+
+		frappe.db.set_value("Customer", customer, "tax_withholding_category", None)
+		si.cancel()
+		self.assertEqual(self.get_balance(customer, "Customer"), opening)
@@ -9,6 +9,10 @@ from frappe.query_builder import Criterion
 from frappe.query_builder.functions import Abs, Sum
 from frappe.utils import cint, flt, getdate
 
+from erpnext.accounts.doctype.tax_withholding_balance.tax_withholding_balance import (
+	get_tax_withholding_balance,
+)
+
 
 class TaxWithholdingCategory(Document):
 	# begin: auto-generated types
@@ -259,25 +263,31 @@ def get_lower_deduction_certificate(company, tax_details, pan_no):
 
 
 def get_tax_amount(party_type, parties, inv, tax_details, posting_date, pan_no=None):
-	vouchers, voucher_wise_amount = get_invoice_vouchers(
-		parties, tax_details, inv.company, party_type=party_type
-	)
-	advance_vouchers = get_advance_vouchers(
-		parties,
-		company=inv.company,
-		from_date=tax_details.from_date,
-		to_date=tax_details.to_date,
-		party_type=party_type,
-	)
-	taxable_vouchers = vouchers + advance_vouchers
 	tax_deducted_on_advances = 0
 
 	if inv.doctype == "Purchase Invoice":
 		tax_deducted_on_advances = get_taxes_deducted_on_advances_allocated(inv, tax_details)
 
-	tax_deducted = 0
-	if taxable_vouchers:
-		tax_deducted = get_deducted_tax(taxable_vouchers, tax_details)
+	# vouchers of the period are only needed until tax is deducted for the first time,
+	# after that the running balance of the parties is enough
+	vouchers, voucher_wise_amount, advance_vouchers = [], {}, []
+	tax_deducted = get_tax_deducted(party_type, parties, inv.company, tax_details)
+
+	if not tax_deducted:
+		vouchers, voucher_wise_amount = get_invoice_vouchers(
+			parties, tax_details, inv.company, party_type=party_type
+		)
+		advance_vouchers = get_advance_vouchers(
+			parties,
+			company=inv.company,
+			from_date=tax_details.from_date,
+			to_date=tax_details.to_date,
+			party_type=party_type,
+		)
+
+		taxable_vouchers = vouchers + advance_vouchers
+		if taxable_vouchers:
+			tax_deducted = get_deducted_tax(taxable_vouchers, tax_details)
 
 	tax_amount = 0
 
@@ -431,6 +441,14 @@ def get_taxes_deducted_on_advances_allocated(inv, tax_details):
 	return tax_info
 
 
+def get_tax_deducted(party_type, parties, company, tax_details):
+	balance = get_tax_withholding_balance(
+		company, tax_details.tax_withholding_category, party_type, parties, tax_details
+	)
+
+	return balance.tax_amount if flt(balance.tax_amount) > 0 else 0
+
+
 def get_deducted_tax(taxable_vouchers, tax_details):
 	# check if TDS / TCS account is already charged on taxable vouchers
 	filters = {
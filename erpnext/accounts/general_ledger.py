@@ -10,14 +10,20 @@ from frappe.model.meta import get_field_precision
 from frappe.utils import cint, cstr, flt, formatdate, getdate, now
 
 import erpnext
+from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+	remove_voucher_from_snapshots,
+	update_account_balance_snapshots,
+)
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 )
 from erpnext.accounts.doctype.accounting_period.accounting_period import ClosedAccountingPeriod
 from erpnext.accounts.doctype.budget.budget import validate_expense_against_budget
 from erpnext.accounts.utils import create_payment_ledger_entry
+from erpnext.utilities.submit_profiler import profile_stage
 
 
+@profile_stage("make_gl_entries")
 def make_gl_entries(
 	gl_map,
 	cancel=False,
@@ -365,6 +371,8 @@ def save_entries(gl_map, adv_adj, update_outstanding, from_repost=False):
 	for entry in gl_map:
 		make_entry(entry, adv_adj, update_outstanding, from_repost)
 
+	update_account_balance_snapshots(gl_map)
+
 
 def make_entry(args, adv_adj, update_outstanding, from_repost=False):
 	gle = frappe.new_doc("GL Entry")
@@ -621,7 +629,10 @@ def make_reverse_gl_entries(
 					)
 				)
 				query.run()
+
+			update_account_balance_snapshots(gl_entries, cancel=True)
 		else:
+			remove_voucher_from_snapshots(gl_entries[0]["voucher_type"], gl_entries[0]["voucher_no"])
 			set_as_cancel(gl_entries[0]["voucher_type"], gl_entries[0]["voucher_no"])
 
 		for entry in gl_entries:
@@ -6,7 +6,8 @@ from collections import defaultdict
 
 import frappe
 from frappe import _
-from frappe.query_builder import Criterion
+from frappe.query_builder import Case, Criterion
+from frappe.query_builder.functions import Sum
 from frappe.utils import flt, getdate
 
 import erpnext
@@ -343,25 +344,17 @@ def get_data(
 	filters.end_date = end_date
 
 	gl_entries_by_account = {}
-	for root in frappe.db.sql(
-		"""select lft, rgt from tabAccount
-			where root_type=%s and ifnull(parent_account, '') = ''""",
-		root_type,
-		as_dict=1,
-	):
-
-		set_gl_entries_by_account(
-			start_date,
-			end_date,
-			root.lft,
-			root.rgt,
-			filters,
-			gl_entries_by_account,
-			accounts_by_name,
-			accounts,
-			ignore_closing_entries=False,
-			root_type=root_type,
-		)
+	set_gl_entries_by_account(
+		start_date,
+		end_date,
+		get_opening_date(filters, fiscal_year),
+		filters,
+		gl_entries_by_account,
+		accounts_by_name,
+		accounts,
+		ignore_closing_entries=False,
+		root_type=root_type,
+	)
 
 	calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year)
 	accumulate_values_into_parents(accounts, accounts_by_name, companies)
@@ -386,13 +379,18 @@ def get_company_currency(filters=None):
 	)
 
 
-def calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year):
-	start_date = (
+def get_opening_date(filters, fiscal_year):
+	return getdate(
 		fiscal_year.year_start_date
 		if filters.filter_based_on == "Fiscal Year"
 		else filters.period_start_date
 	)
 
+
+def calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year):
+	companies_by_child = get_companies_by_child(companies, filters)
+	currency_factors = {}
+
 	for entries in gl_entries_by_account.values():
 		for entry in entries:
 			if entry.account_number:
@@ -404,34 +402,51 @@ def calculate_values(accounts_by_name, gl_entries_by_account, companies, filters
 
 			if d:
 				debit, credit = 0, 0
-				for company in companies:
-					# check if posting date is within the period
+				for company in companies_by_child.get(entry.company, []):
+					debit, credit = flt(entry.debit), flt(entry.credit)
+
 					if (
-						entry.company == company
-						or (filters.get("accumulated_in_group_company"))
-						and entry.company in companies.get(company)
+						not filters.get("presentation_currency")
+						and entry.company != company
+						and filters.get("accumulated_in_group_company")
 					):
-						parent_company_currency = erpnext.get_company_currency(d.company)
-						child_company_currency = erpnext.get_company_currency(entry.company)
+						factor = get_currency_factor(d.company, entry.company, filters, currency_factors)
+						debit, credit = debit * factor, credit * factor
 
-						debit, credit = flt(entry.debit), flt(entry.credit)
+					d[company] = d.get(company, 0.0) + flt(debit) - flt(credit)
 
-						if (
-							not filters.get("presentation_currency")
-							and entry.company != company
-							and parent_company_currency != child_company_currency
-							and filters.get("accumulated_in_group_company")
-						):
-							debit = convert(debit, parent_company_currency, child_company_currency, filters.end_date)
-							credit = convert(credit, parent_company_currency, child_company_currency, filters.end_date)
+					if entry.is_before_opening_date:
+						d["company_wise_opening_bal"][company] += flt(debit) - flt(credit)
 
-						d[company] = d.get(company, 0.0) + flt(debit) - flt(credit)
+				if entry.is_before_opening_date:
+					d["opening_balance"] = d.get("opening_balance", 0.0) + flt(debit) - flt(credit)
 
-						if entry.posting_date < getdate(start_date):
-							d["company_wise_opening_bal"][company] += flt(debit) - flt(credit)
 
-				if entry.posting_date < getdate(start_date):
-					d["opening_balance"] = d.get("opening_balance", 0.0) + flt(debit) - flt(credit)
+def get_companies_by_child(companies, filters):
+	"""Returns the report columns each company's ledger is added to"""
+	companies_by_child = {}
+	for company, subsidiaries in companies.items():
+		for child in {company, *subsidiaries}:
+			if child == company or filters.get("accumulated_in_group_company"):
+				companies_by_child.setdefault(child, []).append(company)
+
+	return companies_by_child
+
+
+def get_currency_factor(parent_company, child_company, filters, currency_factors):
+	"""Returns the factor translating amounts of the child company into the parent's currency"""
+	key = (parent_company, child_company)
+	if key not in currency_factors:
+		parent_company_currency = erpnext.get_company_currency(parent_company)
+		child_company_currency = erpnext.get_company_currency(child_company)
+
+		currency_factors[key] = 1.0
+		if parent_company_currency != child_company_currency:
+			currency_factors[key] = convert(
+				1.0, parent_company_currency, child_company_currency, filters.end_date
+			)
+
+	return currency_factors[key]
 
 
 def accumulate_values_into_parents(accounts, accounts_by_name, companies):
@@ -598,8 +613,7 @@ def prepare_data(
 def set_gl_entries_by_account(
 	from_date,
 	to_date,
-	root_lft,
-	root_rgt,
+	opening_date,
 	filters,
 	gl_entries_by_account,
 	accounts_by_name,
@@ -607,14 +621,17 @@ def set_gl_entries_by_account(
 	ignore_closing_entries=False,
 	root_type=None,
 ):
-	"""Returns a dict like { "account": [gl entries], ... }"""
+	"""Returns a dict like { "account": [account-wise totals of each company], ... }
+
+	The totals of all the companies in the group are aggregated in one query, split into
+	the entries posted before and from `opening_date`."""
 
 	company_lft, company_rgt = frappe.get_cached_value(
 		"Company", filters.get("company"), ["lft", "rgt"]
 	)
 
 	companies = frappe.db.sql(
-		""" select name, default_currency from `tabCompany`
+		""" select name, default_currency, default_finance_book from `tabCompany`
 		where lft >= %(company_lft)s and rgt <= %(company_rgt)s""",
 		{
 			"company_lft": company_lft,
@@ -627,43 +644,48 @@ def set_gl_entries_by_account(
 		{"report_date": to_date, "presentation_currency": filters.get("presentation_currency")}
 	)
 
-	for d in companies:
-		gle = frappe.qb.DocType("GL Entry")
-		account = frappe.qb.DocType("Account")
-		query = (
-			frappe.qb.from_(gle)
-			.inner_join(account)
-			.on(account.name == gle.account)
-			.select(
-				gle.posting_date,
-				gle.account,
-				gle.debit,
-				gle.credit,
-				gle.is_opening,
-				gle.company,
-				gle.fiscal_year,
-				gle.debit_in_account_currency,
-				gle.credit_in_account_currency,
-				gle.account_currency,
-				account.account_name,
-				account.account_number,
-			)
-			.where(
-				(gle.company == d.name)
-				& (gle.is_cancelled == 0)
-				& (gle.posting_date <= to_date)
-				& (account.lft >= root_lft)
-				& (account.rgt <= root_rgt)
-			)
-			.orderby(gle.account, gle.posting_date)
+	gle = frappe.qb.DocType("GL Entry")
+	account = frappe.qb.DocType("Account")
+	is_before_opening_date = Case().when(gle.posting_date < opening_date, 1).else_(0)
+	query = (
+		frappe.qb.from_(gle)
+		.inner_join(account)
+		.on(account.name == gle.account)
+		.select(
+			gle.account,
+			gle.company,
+			gle.account_currency,
+			account.account_name,
+			account.account_number,
+			is_before_opening_date.as_("is_before_opening_date"),
+			Sum(gle.debit).as_("debit"),
+			Sum(gle.credit).as_("credit"),
+			Sum(gle.debit_in_account_currency).as_("debit_in_account_currency"),
+			Sum(gle.credit_in_account_currency).as_("credit_in_account_currency"),
+		)
+		.where(
+			(gle.company.isin([d.name for d in companies]))
+			& (gle.is_cancelled == 0)
+			& (gle.posting_date <= to_date)
 		)
+		.groupby(gle.company, gle.account, is_before_opening_date)
+		.orderby(gle.account)
+	)
+
+	if root_type:
+		query = query.where(account.root_type == root_type)
+	additional_conditions = get_additional_conditions(
+		from_date, ignore_closing_entries, filters, companies
+	)
+	if additional_conditions:
+		query = query.where(Criterion.all(additional_conditions))
+
+	gl_entries_by_company = {}
+	for entry in query.run(as_dict=True):
+		gl_entries_by_company.setdefault(entry.company, []).append(entry)
 
-		if root_type:
-			query = query.where(account.root_type == root_type)
-		additional_conditions = get_additional_conditions(from_date, ignore_closing_entries, filters, d)
-		if additional_conditions:
-			query = query.where(Criterion.all(additional_conditions))
-		gl_entries = query.run(as_dict=True)
+	for d in companies:
+		gl_entries = gl_entries_by_company.get(d.name, [])
 
 		if filters and filters.get("presentation_currency") != d.default_currency:
 			currency_info["company"] = d.name
@@ -734,7 +756,7 @@ def validate_entries(key, entry, accounts_by_name, accounts):
 		accounts.insert(idx + 1, args)
 
 
-def get_additional_conditions(from_date, ignore_closing_entries, filters, d):
+def get_additional_conditions(from_date, ignore_closing_entries, filters, companies):
 	gle = frappe.qb.DocType("GL Entry")
 	additional_conditions = []
 
@@ -749,13 +771,16 @@ def get_additional_conditions(from_date, ignore_closing_entries, filters, d):
 	if filter_fb := filters.get("finance_book"):
 		finance_books.append(filter_fb)
 
+	finance_book_condition = (gle.finance_book.isin(finance_books)) | gle.finance_book.isnull()
+
 	if filters.get("include_default_book_entries"):
-		if company_fb := frappe.get_cached_value("Company", d.name, "default_finance_book"):
-			finance_books.append(company_fb)
+		for d in companies:
+			if d.default_finance_book:
+				finance_book_condition |= (gle.company == d.name) & (
+					gle.finance_book == d.default_finance_book
+				)
 
-		additional_conditions.append((gle.finance_book.isin(finance_books)) | gle.finance_book.isnull())
-	else:
-		additional_conditions.append((gle.finance_book.isin(finance_books)) | gle.finance_book.isnull())
+	additional_conditions.append(finance_book_condition)
 
 	return additional_conditions
 
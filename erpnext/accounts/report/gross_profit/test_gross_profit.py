@@ -460,3 +460,34 @@ class TestGrossProfit(FrappeTestCase):
 		}
 		gp_entry = [x for x in data if x.parent_invoice == sinv.name]
 		self.assertDictContainsSubset(expected_entry, gp_entry[0])
+
+	def test_buying_amount_from_stock_ledger_of_period_vouchers(self):
+		"""
+		Buying amount of stock updating invoices is taken from their own stock ledger entries
+		"""
+		make_stock_entry(
+			company=self.company, item_code=self.item, target=self.warehouse, qty=2, basic_rate=100
+		)
+		make_stock_entry(
+			company=self.company, item_code=self.item, target=self.warehouse, qty=2, basic_rate=200
+		)
+
+		invoices = []
+		for _ in range(3):
+			sinv = self.create_sales_invoice(qty=1, rate=300, do_not_save=True, do_not_submit=True)
+			sinv.update_stock = 1
+			invoices.append(sinv.save().submit())
+
+		filters = frappe._dict(
+			company=self.company, from_date=nowdate(), to_date=nowdate(), group_by="Invoice"
+		)
+		columns, data = execute(filters=filters)
+
+		for sinv in invoices:
+			stock_value_difference = frappe.db.get_value(
+				"Stock Ledger Entry",
+				{"voucher_no": sinv.name, "voucher_detail_no": sinv.items[0].name, "is_cancelled": 0},
+				"stock_value_difference",
+			)
+			gp_entry = [x for x in data if x.parent_invoice == sinv.name]
+			self.assertEqual(gp_entry[0].buying_amount, abs(flt(stock_value_difference)))
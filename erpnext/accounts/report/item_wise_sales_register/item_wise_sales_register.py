@@ -4,9 +4,7 @@
 
 import frappe
 from frappe import _
-from frappe.model.meta import get_field_precision
 from frappe.utils import cstr, flt
-from frappe.utils.xlsxutils import handle_html
 
 from erpnext.accounts.report.sales_register.sales_register import get_mode_of_payments
 from erpnext.accounts.report.utils import get_query_columns, get_values_for_columns
@@ -462,124 +460,47 @@ def get_tax_accounts(
 	doctype="Sales Invoice",
 	tax_doctype="Sales Taxes and Charges",
 ):
-	import json
+	"""Return the tax of every invoice item row by tax description, read from the
+	Item Tax Ledger Entries written on submit."""
 
-	item_row_map = {}
 	tax_columns = []
-	invoice_item_row = {}
 	itemised_tax = {}
-	add_deduct_tax = "charge_type"
 
-	tax_amount_precision = (
-		get_field_precision(
-			frappe.get_meta(tax_doctype).get_field("tax_amount"), currency=company_currency
-		)
-		or 2
-	)
-
-	for d in item_list:
-		invoice_item_row.setdefault(d.parent, []).append(d)
-		item_row_map.setdefault(d.parent, {}).setdefault(d.item_code or d.item_name, []).append(d)
-
-	conditions = ""
-	if doctype == "Purchase Invoice":
-		conditions = " and category in ('Total', 'Valuation and Total') and base_tax_amount_after_discount_amount != 0"
-		add_deduct_tax = "add_deduct_tax"
-
-	tax_details = frappe.db.sql(
-		"""
-		select
-			name, parent, description, item_wise_tax_detail, account_head,
-			charge_type, {add_deduct_tax}, base_tax_amount_after_discount_amount
-		from `tab%s`
-		where
-			parenttype = %s and docstatus = 1
-			and (description is not null and description != '')
-			and parent in (%s)
-			%s
-		order by description
-	""".format(
-			add_deduct_tax=add_deduct_tax
+	ledger = frappe.qb.DocType("Item Tax Ledger Entry")
+	account = frappe.qb.DocType("Account")
+	invoices = list(set(d.parent for d in item_list))
+
+	for i in range(0, len(invoices), 1000):
+		query = (
+			frappe.qb.from_(ledger)
+			.left_join(account)
+			.on(ledger.account_head == account.name)
+			.select(
+				ledger.voucher_detail_no,
+				ledger.description,
+				ledger.charge_type,
+				ledger.tax_rate,
+				ledger.tax_amount,
+				account.account_type,
+			)
+			.where((ledger.voucher_type == doctype) & (ledger.voucher_no.isin(invoices[i : i + 1000])))
+			.orderby(ledger.description)
 		)
-		% (tax_doctype, "%s", ", ".join(["%s"] * len(invoice_item_row)), conditions),
-		tuple([doctype] + list(invoice_item_row)),
-	)
 
-	account_doctype = frappe.qb.DocType("Account")
+		if doctype == "Purchase Invoice":
+			query = query.where(ledger.category.isin(["Total", "Valuation and Total"]))
 
-	query = (
-		frappe.qb.from_(account_doctype)
-		.select(account_doctype.name)
-		.where((account_doctype.account_type == "Tax"))
-	)
+		for d in query.run(as_dict=True):
+			if d.description not in tax_columns:
+				tax_columns.append(d.description)
 
-	tax_accounts = query.run()
-
-	for (
-		name,
-		parent,
-		description,
-		item_wise_tax_detail,
-		account_head,
-		charge_type,
-		add_deduct_tax,
-		tax_amount,
-	) in tax_details:
-		description = handle_html(description)
-		if description not in tax_columns and tax_amount:
-			# as description is text editor earlier and markup can break the column convention in reports
-			tax_columns.append(description)
-
-		if item_wise_tax_detail:
-			try:
-				item_wise_tax_detail = json.loads(item_wise_tax_detail)
-
-				for item_code, tax_data in item_wise_tax_detail.items():
-					itemised_tax.setdefault(item_code, frappe._dict())
-
-					if isinstance(tax_data, list):
-						tax_rate, tax_amount = tax_data
-					else:
-						tax_rate = tax_data
-						tax_amount = 0
-
-					if charge_type == "Actual" and not tax_rate:
-						tax_rate = "NA"
-
-					item_net_amount = sum(
-						[flt(d.base_net_amount) for d in item_row_map.get(parent, {}).get(item_code, [])]
-					)
-
-					for d in item_row_map.get(parent, {}).get(item_code, []):
-						item_tax_amount = (
-							flt((tax_amount * d.base_net_amount) / item_net_amount) if item_net_amount else 0
-						)
-						if item_tax_amount:
-							tax_value = flt(item_tax_amount, tax_amount_precision)
-							tax_value = (
-								tax_value * -1
-								if (doctype == "Purchase Invoice" and add_deduct_tax == "Deduct")
-								else tax_value
-							)
-
-							itemised_tax.setdefault(d.name, {})[description] = frappe._dict(
-								{
-									"tax_rate": tax_rate,
-									"tax_amount": tax_value,
-									"is_other_charges": 0 if tuple([account_head]) in tax_accounts else 1,
-								}
-							)
-
-			except ValueError:
-				continue
-		elif charge_type == "Actual" and tax_amount:
-			for d in invoice_item_row.get(parent, []):
-				itemised_tax.setdefault(d.name, {})[description] = frappe._dict(
-					{
-						"tax_rate": "NA",
-						"tax_amount": flt((tax_amount * d.base_net_amount) / d.base_net_total, tax_amount_precision),
-					}
-				)
+			itemised_tax.setdefault(d.voucher_detail_no, {})[d.description] = frappe._dict(
+				{
+					"tax_rate": "NA" if d.charge_type == "Actual" and not d.tax_rate else d.tax_rate,
+					"tax_amount": d.tax_amount,
+					"is_other_charges": 0 if d.account_type == "Tax" else 1,
+				}
+			)
 
 	tax_columns.sort()
 	for desc in tax_columns:
@@ -1,8 +1,11 @@
 import frappe
 from frappe import _
+from frappe.query_builder.functions import IfNull
 
 from erpnext.accounts.report.tax_withholding_details.tax_withholding_details import (
+	get_party_pan_map,
 	get_result,
+	get_tax_rate_map,
 	get_tds_docs,
 )
 from erpnext.accounts.utils import get_fiscal_year
@@ -19,6 +22,11 @@ def execute(filters=None):
 	validate_filters(filters)
 
 	columns = get_columns(filters)
+
+	# whole rate periods are read from the running balances of the parties
+	if is_withholding_period(filters):
+		return columns, get_result_from_balances(filters)
+
 	(
 		tds_docs,
 		tds_accounts,
@@ -35,6 +43,132 @@ def execute(filters=None):
 	return columns, final_result
 
 
+def is_withholding_period(filters):
+	"""Whether the balances hold all the report would show: every category of the company has a
+	rate for exactly these dates and all the tax was booked by vouchers that keep the balances"""
+	tds_accounts = frappe.get_all(
+		"Tax Withholding Account", {"company": filters.company}, ["parent", "account"]
+	)
+	categories = {d.parent for d in tds_accounts}
+	if not categories:
+		return False
+
+	period_categories = frappe.get_all(
+		"Tax Withholding Rate",
+		filters={
+			"parenttype": "Tax Withholding Category",
+			"parent": ("in", categories),
+			"from_date": filters.from_date,
+			"to_date": filters.to_date,
+		},
+		pluck="parent",
+	)
+	if categories != set(period_categories):
+		return False
+
+	return not has_tax_outside_balances(filters, {d.account for d in tds_accounts})
+
+
+def has_tax_outside_balances(filters, tds_accounts):
+	gle = frappe.qb.DocType("GL Entry")
+	pi = frappe.qb.DocType("Purchase Invoice")
+	si = frappe.qb.DocType("Sales Invoice")
+	pe = frappe.qb.DocType("Payment Entry")
+	je = frappe.qb.DocType("Journal Entry")
+
+	def is_not_set(field):
+		return IfNull(field, "") == ""
+
+	# vouchers of each type that do not add to the balances
+	outside_balances = {
+		"Purchase Invoice": (
+			pi,
+			(pi.apply_tds == 0) | is_not_set(pi.tax_withholding_category) | (pi.is_opening == "Yes"),
+		),
+		"Sales Invoice": (si, is_not_set(si.tax_withholding_category) | (si.is_opening == "Yes")),
+		"Payment Entry": (
+			pe,
+			(pe.apply_tax_withholding_amount == 0)
+			| is_not_set(pe.tax_withholding_category)
+			| (pe.party_type != "Supplier"),
+		),
+		"Journal Entry": (
+			je,
+			(je.apply_tds == 0) | is_not_set(je.tax_withholding_category) | (je.is_opening == "Yes"),
+		),
+	}
+
+	tax_entries = (
+		frappe.qb.from_(gle)
+		.select(gle.name)
+		.where(
+			(gle.company == filters.company)
+			& (gle.is_cancelled == 0)
+			& (gle.account.isin(tds_accounts))
+			& (gle.posting_date[filters.from_date : filters.to_date])
+		)
+		.limit(1)
+	)
+
+	if tax_entries.where(gle.voucher_type.notin(list(outside_balances))).run():
+		return True
+
+	for voucher_type, (voucher, condition) in outside_balances.items():
+		if (
+			tax_entries.inner_join(voucher)
+			.on(voucher.name == gle.voucher_no)
+			.where((gle.voucher_type == voucher_type) & condition)
+			.run()
+		):
+			return True
+
+	return False
+
+
+def get_result_from_balances(filters):
+	balance_filters = {
+		"company": filters.company,
+		"party_type": filters.party_type,
+		"from_date": filters.from_date,
+		"to_date": filters.to_date,
+		"tax_amount": ["!=", 0],
+	}
+	if filters.get("party"):
+		balance_filters["party"] = filters.party
+
+	balances = frappe.get_all(
+		"Tax Withholding Balance",
+		filters=balance_filters,
+		fields=["party", "tax_withholding_category", "total_amount", "tax_amount"],
+		order_by="tax_withholding_category",
+	)
+
+	party_map = get_party_pan_map(filters.party_type)
+	tax_rate_map = get_tax_rate_map(filters)
+	if filters.party_type == "Supplier":
+		party_name, entity_type = "supplier_name", "supplier_type"
+	else:
+		party_name, entity_type = "customer_name", "customer_type"
+
+	out = []
+	for d in balances:
+		party = party_map.get(d.party, {})
+		out.append(
+			{
+				"pan" if frappe.db.has_column(filters.party_type, "pan") else "tax_id": party.get("pan"),
+				"party": d.party,
+				"party_name": party.get(party_name),
+				"section_code": d.tax_withholding_category,
+				"entity_type": party.get(entity_type),
+				"rate": tax_rate_map.get(d.tax_withholding_category),
+				"total_amount": d.total_amount,
+				"tax_amount": d.tax_amount,
+			}
+		)
+
+	return out
+
+
 def validate_filters(filters):
 	"""Validate if dates are properly set and lie in the same fiscal year"""
 	if filters.from_date > filters.to_date:
@@ -0,0 +1,88 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# MIT License. See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, add_months, flt, today
+
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
+from erpnext.accounts.doctype.tax_withholding_category.test_tax_withholding_category import (
+	create_purchase_invoice,
+	create_records,
+	create_tax_withholding_category,
+	create_tax_withholding_category_records,
+)
+from erpnext.accounts.report.tds_computation_summary import tds_computation_summary
+from erpnext.accounts.report.tds_computation_summary.tds_computation_summary import (
+	execute,
+	get_result_from_balances,
+	has_tax_outside_balances,
+	is_withholding_period,
+)
+from erpnext.accounts.utils import get_fiscal_year
+
+
+class TestTDSComputationSummary(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		create_records()
+		create_tax_withholding_category_records()
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def get_filters(self, supplier=None):
+		fiscal_year = get_fiscal_year(today(), company="_Test Company")
+		return frappe._dict(
+			company="_Test Company",
+			party_type="Supplier",
+			party=supplier,
+			from_date=fiscal_year[1],
+			to_date=fiscal_year[2],
+		)
+
+	def test_balances_match_document_wise_summary(self):
+		supplier = "Test TDS Supplier"
+		frappe.db.set_value(
+			"Supplier", supplier, "tax_withholding_category", "Cumulative Threshold TDS"
+		)
+		for _ in range(3):
+			create_purchase_invoice(supplier=supplier).submit()
+
+		with patch.object(tds_computation_summary, "is_withholding_period", return_value=False):
+			document_wise = execute(self.get_filters(supplier))[1]
+
+		self.assertTrue(document_wise)
+		self.assertEqual(
+			get_totals(get_result_from_balances(self.get_filters(supplier))), get_totals(document_wise)
+		)
+
+	def test_document_wise_summary_for_categories_with_other_periods(self):
+		filters = self.get_filters()
+		create_tax_withholding_category(
+			category_name="Half Yearly TDS",
+			rate=10,
+			from_date=filters.from_date,
+			to_date=add_days(add_months(filters.from_date, 6), -1),
+			account="TDS - _TC",
+		)
+
+		self.assertFalse(is_withholding_period(filters))
+
+	def test_document_wise_summary_for_tax_outside_balances(self):
+		filters = self.get_filters()
+
+		# tax booked through a journal entry that does not apply TDS
+		make_journal_entry("_Test Bank - _TC", "TDS - _TC", 500, posting_date=today(), submit=True)
+
+		self.assertTrue(has_tax_outside_balances(filters, {"TDS - _TC"}))
+
+
+def get_totals(rows):
+	return sorted(
+		(row["party"], row["section_code"], flt(row["total_amount"]), flt(row["tax_amount"]))
+		for row in rows
+	)
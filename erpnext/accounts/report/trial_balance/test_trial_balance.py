@@ -2,8 +2,8 @@
 # MIT License. See license.txt
 
 import frappe
-from frappe.tests.utils import FrappeTestCase
-from frappe.utils import today
+from frappe.tests.utils import FrappeTestCase, change_settings
+from frappe.utils import add_days, add_months, today
 
 from erpnext.accounts.report.trial_balance.trial_balance import execute
 
@@ -62,6 +62,53 @@ class TestTrialBalance(FrappeTestCase):
 		total_row = execute(filters)[1][-1]
 		self.assertEqual(total_row["debit"], total_row["credit"])
 
+	def test_trial_balance_from_account_balance_snapshots(self):
+		from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+			rebuild_account_balance_snapshots,
+		)
+		from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+		frappe.db.sql("delete from `tabSales Invoice` where company='Trial Balance Company'")
+		frappe.db.sql("delete from `tabGL Entry` where company='Trial Balance Company'")
+
+		branch = frappe.new_doc("Branch")
+		branch.branch = "Location 1"
+		branch.insert(ignore_if_duplicate=True)
+
+		for posting_date in (add_months(today(), -13), add_months(today(), -2), add_days(today(), -1)):
+			si = create_sales_invoice(
+				company=self.company,
+				debit_to="Debtors - TBC",
+				cost_center="Test Cost Center - TBC",
+				income_account="Sales - TBC",
+				posting_date=posting_date,
+				set_posting_time=1,
+				do_not_save=1,
+			)
+			si.branch = "Location 1"
+			si.save()
+			si.submit()
+
+		filters_list = [
+			{"company": self.company, "fiscal_year": self.fiscal_year},
+			{"company": self.company, "fiscal_year": self.fiscal_year, "branch": ["Location 1"]},
+			{
+				"company": self.company,
+				"fiscal_year": self.fiscal_year,
+				"from_date": add_days(today(), -5),
+				"cost_center": "Test Cost Center - TBC",
+				"show_unclosed_fy_pl_balances": 1,
+			},
+		]
+
+		expected = [execute(frappe._dict(filters))[1] for filters in filters_list]
+
+		with change_settings("Accounts Settings", {"use_account_balance_snapshots": 1}):
+			rebuild_account_balance_snapshots(self.company)
+			frappe.db.set_single_value("Accounts Settings", "account_balance_snapshots_ready", 1)
+			for filters, data in zip(filters_list, expected):
+				self.assertEqual(execute(frappe._dict(filters))[1], data)
+
 	def tearDown(self):
 		clear_dimension_defaults("Branch")
 		disable_dimension()
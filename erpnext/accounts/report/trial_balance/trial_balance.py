@@ -5,9 +5,12 @@
 import frappe
 from frappe import _
 from frappe.query_builder.functions import Sum
-from frappe.utils import add_days, cstr, flt, formatdate, getdate
+from frappe.utils import add_days, add_months, cstr, flt, formatdate, get_first_day, getdate
 
 import erpnext
+from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+	is_snapshot_ready,
+)
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 	get_dimension_with_children,
@@ -15,7 +18,6 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 from erpnext.accounts.report.financial_statements import (
 	filter_accounts,
 	filter_out_zero_value_rows,
-	set_gl_entries_by_account,
 )
 from erpnext.accounts.report.utils import convert_to_presentation_currency, get_currency
 
@@ -94,31 +96,13 @@ def get_data(filters):
 
 	accounts, accounts_by_name, parent_children_map = filter_accounts(accounts)
 
-	min_lft, max_rgt = frappe.db.sql(
-		"""select min(lft), max(rgt) from `tabAccount`
-		where company=%s""",
-		(filters.company,),
-	)[0]
-
-	gl_entries_by_account = {}
-
 	opening_balances = get_opening_balances(filters)
 
-	# add filter inside list so that the query in financial_statements.py doesn't break
-	if filters.project:
-		filters.project = [filters.project]
-
-	set_gl_entries_by_account(
-		filters.company,
-		filters.from_date,
-		filters.to_date,
-		min_lft,
-		max_rgt,
-		filters,
-		gl_entries_by_account,
-		ignore_closing_entries=not flt(filters.with_period_closing_entry),
-		ignore_opening_entries=True,
-	)
+	# account-wise totals of the period, aggregated in the database
+	gl_entries_by_account = {}
+	for d in get_period_balances(filters, get_accounting_dimensions(as_list=False)):
+		d.is_opening = "No"
+		gl_entries_by_account.setdefault(d.account, []).append(d)
 
 	calculate_values(
 		accounts, gl_entries_by_account, opening_balances, filters.get("show_net_values")
@@ -174,11 +158,11 @@ def get_rootwise_opening_balances(filters, report_type):
 			add_days(filters.from_date, -1)
 		):
 			start_date = add_days(last_period_closing_voucher[0].posting_date, 1)
-			gle += get_opening_balance(
-				"GL Entry", filters, report_type, accounting_dimensions, start_date=start_date
+			gle += get_ledger_opening_balance(
+				filters, report_type, accounting_dimensions, start_date=start_date
 			)
 	else:
-		gle = get_opening_balance("GL Entry", filters, report_type, accounting_dimensions)
+		gle = get_ledger_opening_balance(filters, report_type, accounting_dimensions)
 
 	opening = frappe._dict()
 	for d in gle:
@@ -196,32 +180,22 @@ def get_rootwise_opening_balances(filters, report_type):
 	return opening
 
 
+def get_ledger_opening_balance(filters, report_type, accounting_dimensions, start_date=None):
+	if is_snapshot_ready():
+		return get_opening_balance_from_snapshots(
+			filters, report_type, accounting_dimensions, start_date=start_date
+		)
+
+	return get_opening_balance(
+		"GL Entry", filters, report_type, accounting_dimensions, start_date=start_date
+	)
+
+
 def get_opening_balance(
 	doctype, filters, report_type, accounting_dimensions, period_closing_voucher=None, start_date=None
 ):
 	closing_balance = frappe.qb.DocType(doctype)
-	account = frappe.qb.DocType("Account")
-
-	opening_balance = (
-		frappe.qb.from_(closing_balance)
-		.select(
-			closing_balance.account,
-			closing_balance.account_currency,
-			Sum(closing_balance.debit).as_("debit"),
-			Sum(closing_balance.credit).as_("credit"),
-			Sum(closing_balance.debit_in_account_currency).as_("debit_in_account_currency"),
-			Sum(closing_balance.credit_in_account_currency).as_("credit_in_account_currency"),
-		)
-		.where(
-			(closing_balance.company == filters.company)
-			& (
-				closing_balance.account.isin(
-					frappe.qb.from_(account).select("name").where(account.report_type == report_type)
-				)
-			)
-		)
-		.groupby(closing_balance.account)
-	)
+	opening_balance = get_balance_query(doctype, filters, report_type, accounting_dimensions)
 
 	if period_closing_voucher:
 		opening_balance = opening_balance.where(
@@ -239,9 +213,6 @@ def get_opening_balance(
 				(closing_balance.posting_date < filters.from_date) | (closing_balance.is_opening == "Yes")
 			)
 
-	if doctype == "GL Entry":
-		opening_balance = opening_balance.where(closing_balance.is_cancelled == 0)
-
 	if (
 		not filters.show_unclosed_fy_pl_balances
 		and report_type == "Profit and Loss"
@@ -249,13 +220,169 @@ def get_opening_balance(
 	):
 		opening_balance = opening_balance.where(closing_balance.posting_date >= filters.year_start_date)
 
+	gle = opening_balance.run(as_dict=1)
+
+	if filters and filters.get("presentation_currency"):
+		convert_to_presentation_currency(gle, get_currency(filters))
+
+	return gle
+
+
+def get_opening_balance_from_snapshots(filters, report_type, accounting_dimensions, start_date=None):
+	"""Returns the same balances as `get_opening_balance` for GL Entry, reading the full months
+	from the Account Balance Snapshots"""
+	ignore_opening_entries = bool(start_date)
+
+	if report_type == "Profit and Loss" and not filters.show_unclosed_fy_pl_balances:
+		start_date = max(getdate(start_date or filters.year_start_date), filters.year_start_date)
+
+	gle = get_balances_from_snapshots(
+		filters,
+		report_type,
+		accounting_dimensions,
+		start_date,
+		add_days(filters.from_date, -1),
+		is_opening="No" if ignore_opening_entries else None,
+	)
+
+	if not ignore_opening_entries:
+		# opening entries are part of the opening balance irrespective of their posting date
+		gl_entry = frappe.qb.DocType("GL Entry")
+		query = get_balance_query("GL Entry", filters, report_type, accounting_dimensions).where(
+			(gl_entry.is_opening == "Yes") & (gl_entry.posting_date >= filters.from_date)
+		)
+		if start_date:
+			query = query.where(gl_entry.posting_date >= start_date)
+
+		gle += query.run(as_dict=1)
+
+	if filters and filters.get("presentation_currency"):
+		convert_to_presentation_currency(gle, get_currency(filters))
+
+	return gle
+
+
+def get_period_balances(filters, accounting_dimensions):
+	"""Returns account-wise totals of the non opening entries posted between from and to date"""
+	if is_snapshot_ready():
+		gle = get_balances_from_snapshots(
+			filters, None, accounting_dimensions, filters.from_date, filters.to_date, is_opening="No"
+		)
+	else:
+		gle = get_gl_balances(
+			filters, None, accounting_dimensions, filters.from_date, filters.to_date, is_opening="No"
+		)
+
+	if filters and filters.get("presentation_currency"):
+		convert_to_presentation_currency(gle, get_currency(filters))
+
+	return gle
+
+
+def get_balances_from_snapshots(
+	filters, report_type, accounting_dimensions, from_date, to_date, is_opening=None
+):
+	"""Returns account-wise totals between from and to date (both inclusive), from the snapshots
+	of the months fully within the period and the GL Entries of the remaining days"""
+	to_date = getdate(to_date)
+	if from_date:
+		from_date = getdate(from_date)
+		if from_date > to_date:
+			return []
+
+	# snapshots cover the months from `months_from` up to (but excluding) `months_till`
+	months_till = get_first_day(add_days(to_date, 1))
+	months_from = None
+	if from_date:
+		months_from = from_date if from_date.day == 1 else get_first_day(add_months(from_date, 1))
+
+		if months_from >= months_till:
+			return get_gl_balances(
+				filters, report_type, accounting_dimensions, from_date, to_date, is_opening
+			)
+
+	snapshot = frappe.qb.DocType("Account Balance Snapshot")
+	query = get_balance_query(
+		"Account Balance Snapshot", filters, report_type, accounting_dimensions
+	).where(snapshot.period_start_date < months_till)
+
+	if months_from:
+		query = query.where(snapshot.period_start_date >= months_from)
+
+	if is_opening:
+		query = query.where(snapshot.is_opening == is_opening)
+
+	gle = query.run(as_dict=1)
+
+	if from_date and from_date < months_from:
+		gle += get_gl_balances(
+			filters,
+			report_type,
+			accounting_dimensions,
+			from_date,
+			add_days(months_from, -1),
+			is_opening,
+		)
+
+	if months_till <= to_date:
+		gle += get_gl_balances(
+			filters, report_type, accounting_dimensions, months_till, to_date, is_opening
+		)
+
+	return gle
+
+
+def get_gl_balances(filters, report_type, accounting_dimensions, from_date, to_date, is_opening=None):
+	gl_entry = frappe.qb.DocType("GL Entry")
+	query = get_balance_query("GL Entry", filters, report_type, accounting_dimensions).where(
+		gl_entry.posting_date <= to_date
+	)
+
+	if from_date:
+		query = query.where(gl_entry.posting_date >= from_date)
+
+	if is_opening:
+		query = query.where(gl_entry.is_opening == is_opening)
+
+	return query.run(as_dict=1)
+
+
+def get_balance_query(doctype, filters, report_type, accounting_dimensions):
+	"""Returns the account-wise totals query on `doctype` with the report filters applied"""
+	closing_balance = frappe.qb.DocType(doctype)
+	account = frappe.qb.DocType("Account")
+
+	opening_balance = (
+		frappe.qb.from_(closing_balance)
+		.select(
+			closing_balance.account,
+			closing_balance.account_currency,
+			Sum(closing_balance.debit).as_("debit"),
+			Sum(closing_balance.credit).as_("credit"),
+			Sum(closing_balance.debit_in_account_currency).as_("debit_in_account_currency"),
+			Sum(closing_balance.credit_in_account_currency).as_("credit_in_account_currency"),
+		)
+		.where(closing_balance.company == filters.company)
+		.groupby(closing_balance.account)
+	)
+
+	if report_type:
+		opening_balance = opening_balance.where(
+			closing_balance.account.isin(
+				frappe.qb.from_(account).select("name").where(account.report_type == report_type)
+			)
+		)
+
+	if doctype == "GL Entry":
+		opening_balance = opening_balance.where(closing_balance.is_cancelled == 0)
+
 	if not flt(filters.with_period_closing_entry):
-		if doctype == "Account Closing Balance":
-			opening_balance = opening_balance.where(closing_balance.is_period_closing_voucher_entry == 0)
-		else:
+		if doctype == "GL Entry":
 			opening_balance = opening_balance.where(
 				closing_balance.voucher_type != "Period Closing Voucher"
 			)
+		else:
+			opening_balance = opening_balance.where(closing_balance.is_period_closing_voucher_entry == 0)
 
 	if filters.cost_center:
 		lft, rgt = frappe.db.get_value("Cost Center", filters.cost_center, ["lft", "rgt"])
@@ -302,12 +429,7 @@ def get_opening_balance(
 						closing_balance[dimension.fieldname].isin(filters[dimension.fieldname])
 					)
 
-	gle = opening_balance.run(as_dict=1)
-
-	if filters and filters.get("presentation_currency"):
-		convert_to_presentation_currency(gle, get_currency(filters))
-
-	return gle
+	return opening_balance
 
 
 def calculate_values(accounts, gl_entries_by_account, opening_balances, show_net_values):
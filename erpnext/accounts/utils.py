@@ -30,6 +30,13 @@ import erpnext
 
 # imported to enable erpnext.accounts.utils.get_account_currency
 from erpnext.accounts.doctype.account.account import get_account_currency  # noqa
+from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+	get_balance_from_snapshots,
+	get_cached_balance,
+	is_snapshot_ready,
+	remove_voucher_from_snapshots,
+	set_cached_balance,
+)
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import get_dimensions
 from erpnext.stock import get_warehouse_account_map
 from erpnext.stock.utils import get_stock_value_on
@@ -196,15 +203,17 @@ def get_balance_on(
 	if not cost_center and frappe.form_dict.get("cost_center"):
 		cost_center = frappe.form_dict.get("cost_center")
 
-	cond = ["is_cancelled=0"]
+	balance_date = date
+	date_cond = ["is_cancelled=0"]
 	if start_date:
-		cond.append("posting_date >= %s" % frappe.db.escape(cstr(start_date)))
+		date_cond.append("posting_date >= %s" % frappe.db.escape(cstr(start_date)))
 	if date:
-		cond.append("posting_date <= %s" % frappe.db.escape(cstr(date)))
+		date_cond.append("posting_date <= %s" % frappe.db.escape(cstr(date)))
 	else:
 		# get balance of all entries that exist
 		date = nowdate()
 
+	cond = []
 	if account:
 		acc = frappe.get_doc("Account", account)
 
@@ -291,12 +300,32 @@ def get_balance_on(
 			select_field = "sum(debit_in_account_currency) - sum(credit_in_account_currency)"
 		else:
 			select_field = "sum(debit) - sum(credit)"
+
+		use_snapshots = not start_date and is_snapshot_ready()
+		if use_snapshots:
+			cache_key = (
+				account,
+				cstr(balance_date),
+				party_type,
+				party,
+				company,
+				in_account_currency,
+				cost_center,
+				account_type,
+			)
+			bal = get_cached_balance(cache_key)
+			if bal is None:
+				bal = get_balance_from_snapshots(select_field, cond, balance_date)
+				set_cached_balance(cache_key, bal)
+
+			return flt(bal)
+
 		bal = frappe.db.sql(
 			"""
 			SELECT {0}
 			FROM `tabGL Entry` gle
 			WHERE {1}""".format(
-				select_field, " and ".join(cond)
+				select_field, " and ".join(date_cond + cond)
 			)
 		)[0][0]
 		# if bal is None, return 0
@@ -1375,6 +1404,8 @@ def _delete_pl_entries(voucher_type, voucher_no):
 
 
 def _delete_gl_entries(voucher_type, voucher_no):
+	remove_voucher_from_snapshots(voucher_type, voucher_no)
+
 	gle = qb.DocType("GL Entry")
 	qb.from_(gle).delete().where(
 		(gle.voucher_type == voucher_type) & (gle.voucher_no == voucher_no)
@@ -1589,14 +1620,15 @@ def create_err_and_its_journals(companies: list = None) -> None:
 			err.posting_date = nowdate()
 			err.rounding_loss_allowance = 0.0
 
-			err.fetch_and_calculate_accounts_data()
+			# parties without new entries since the last revaluation are skipped
+			err.fetch_and_calculate_accounts_data(incremental=True)
 			if err.accounts:
 				err.save().submit()
 				response = err.make_jv_entries()
 
 				if company.submit_err_jv:
-					jv = response.get("revaluation_jv", None)
-					jv and frappe.get_doc("Journal Entry", jv).submit()
+					for jv in response.get("revaluation_jvs", []):
+						frappe.get_doc("Journal Entry", jv).submit()
 					jv = response.get("zero_balance_jv", None)
 					jv and frappe.get_doc("Journal Entry", jv).submit()
 
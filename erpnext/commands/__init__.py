@@ -1,11 +1,47 @@
 # Copyright (c) 2015, Frappe Technologies Pvt. Ltd. and Contributors
 # GPL v3 License. See license.txt
 
+import json
+
 import click
+from frappe.commands import get_site, pass_context
 
 
 def call_command(cmd, context):
 	return click.Context(cmd, obj=context).forward(cmd)
 
 
-commands = []
+@click.command("run-benchmarks")
+@click.option("--scale", default="small", help="tiny, small, medium or large")
+@click.option("--benchmark", "benchmarks", multiple=True, help="Run only these benchmarks")
+@click.option("--repeat", default=3, type=int, help="Number of timed runs of each benchmark")
+@click.option("--output", help="Write the results as JSON to this file")
+@click.option("--items", type=int, help="Override the number of items of the scale")
+@click.option("--warehouses", type=int, help="Override the number of warehouses of the scale")
+@click.option("--customers", type=int, help="Override the number of customers of the scale")
+@click.option("--suppliers", type=int, help="Override the number of suppliers of the scale")
+@click.option("--bom-depth", type=int, help="Override the BOM depth of the scale")
+@click.option("--years", type=int, help="Override the years of history of the scale")
+@click.option("--vouchers-per-month", type=int, help="Override the vouchers per month of the scale")
+@pass_context
+def run_benchmarks(context, scale, benchmarks, repeat, output, **overrides):
+	"Time core transaction flows on a synthetic company. Use a scratch site."
+	import frappe
+
+	from erpnext.tests.benchmarks import run
+
+	site = get_site(context)
+	frappe.init(site=site)
+	frappe.connect()
+	try:
+		results = run(
+			scale=scale, benchmarks=list(benchmarks), repeat=repeat, output=output, **overrides
+		)
+	finally:
+		frappe.destroy()
+
+	if not output:
+		click.echo(json.dumps(results, indent=1, default=str))
+
+
+commands = [run_benchmarks]
@@ -25,6 +25,9 @@ from frappe.utils import (
 )
 
 import erpnext
+from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+	remove_voucher_from_snapshots,
+)
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 )
@@ -64,6 +67,7 @@ from erpnext.stock.get_item_details import (
 	get_item_warehouse,
 )
 from erpnext.utilities.regional import temporary_flag
+from erpnext.utilities.submit_profiler import profile_stage
 from erpnext.utilities.transaction_base import TransactionBase
 
 
@@ -160,6 +164,7 @@ class AccountsController(TransactionBase):
 						raise_exception=1,
 					)
 
+	@profile_stage("AccountsController.validate")
 	def validate(self):
 		if not self.get("is_return") and not self.get("is_debit_note"):
 			self.validate_qty_is_not_zero()
@@ -330,6 +335,7 @@ class AccountsController(TransactionBase):
 			frappe.qb.from_(ple).delete().where(
 				(ple.voucher_type == self.doctype) & (ple.voucher_no == self.name)
 			).run()
+			remove_voucher_from_snapshots(self.doctype, self.name)
 			frappe.db.sql(
 				"delete from `tabGL Entry` where voucher_type=%s and voucher_no=%s", (self.doctype, self.name)
 			)
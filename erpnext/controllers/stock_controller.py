@@ -22,6 +22,7 @@ from erpnext.stock.doctype.inventory_dimension.inventory_dimension import (
 	get_evaluated_inventory_dimension,
 )
 from erpnext.stock.stock_ledger import get_items_to_be_repost
+from erpnext.utilities.submit_profiler import profile_stage
 
 
 class QualityInspectionRequiredError(frappe.ValidationError):
@@ -52,6 +53,7 @@ class StockController(AccountsController):
 		self.validate_internal_transfer()
 		self.validate_putaway_capacity()
 
+	@profile_stage("StockController.make_gl_entries")
 	def make_gl_entries(self, gl_entries=None, from_repost=False):
 		if self.docstatus == 2:
 			make_reverse_gl_entries(voucher_type=self.doctype, voucher_no=self.name)
@@ -804,6 +806,7 @@ class StockController(AccountsController):
 		message += _("Please adjust the qty or edit {0} to proceed.").format(rule_link)
 		return message
 
+	@profile_stage("repost_future_sle_and_gle")
 	def repost_future_sle_and_gle(self, force=False):
 		args = frappe._dict(
 			{
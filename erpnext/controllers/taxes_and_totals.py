@@ -8,6 +8,7 @@ import frappe
 from frappe import _, scrub
 from frappe.model.document import Document
 from frappe.utils import cint, flt, round_based_on_smallest_currency_fraction
+from frappe.utils.caching import request_cache
 
 import erpnext
 from erpnext.accounts.doctype.journal_entry.journal_entry import get_exchange_rate
@@ -19,6 +20,10 @@ from erpnext.controllers.accounts_controller import (
 )
 from erpnext.stock.get_item_details import _get_item_tax_template
 from erpnext.utilities.regional import temporary_flag
+from erpnext.utilities.submit_profiler import profile_stage
+
+# documents with at least these many items compute taxes one tax row at a time
+COLUMNAR_TAXES_MIN_ITEMS = 100
 
 
 class calculate_taxes_and_totals(object):
@@ -39,6 +44,7 @@ class calculate_taxes_and_totals(object):
 		items = list(filter(lambda item: not item.get("is_alternative"), self.doc.get("items")))
 		return items
 
+	@profile_stage("calculate_taxes_and_totals")
 	def calculate(self):
 		if not len(self._items):
 			return
@@ -286,7 +292,7 @@ class calculate_taxes_and_totals(object):
 				self._set_in_company_currency(item, ["net_rate", "net_amount"])
 
 	def _load_item_tax_rate(self, item_tax_rate):
-		return json.loads(item_tax_rate) if item_tax_rate else {}
+		return load_item_tax_rate(item_tax_rate) if item_tax_rate else {}
 
 	def get_current_tax_fraction(self, tax, item_tax_map):
 		"""
@@ -354,6 +360,9 @@ class calculate_taxes_and_totals(object):
 			self._calculate()
 
 	def calculate_taxes(self):
+		if len(self._items) >= COLUMNAR_TAXES_MIN_ITEMS:
+			return self.calculate_taxes_columnar()
+
 		rounding_adjustment_computed = self.doc.get("is_consolidated") and self.doc.get(
 			"rounding_adjustment"
 		)
@@ -430,6 +439,141 @@ class calculate_taxes_and_totals(object):
 							self.doc.precision("rounding_adjustment"),
 						)
 
+	def calculate_taxes_columnar(self):
+		"""Same as the row-wise loop of `calculate_taxes`, but for one tax row over all items
+		at a time.
+
+		An item's tax only depends on its own amounts of the previous tax rows, and every tax
+		row still adds up its items in item order, so the results are identical."""
+		rounding_adjustment_computed = self.doc.get("is_consolidated") and self.doc.get(
+			"rounding_adjustment"
+		)
+		if not rounding_adjustment_computed:
+			self.doc.rounding_adjustment = 0
+
+		items = self._items
+		if not items:
+			return
+
+		taxes = self.doc.get("taxes")
+		item_tax_maps = [self._load_item_tax_rate(item.item_tax_rate) for item in items]
+		net_amounts = [item.net_amount for item in items]
+		accumulate_tax_amount = not (
+			self.discount_amount_applied and self.doc.apply_discount_on == "Grand Total"
+		)
+
+		# amounts of each item for every tax row, used by "On Previous Row" charges
+		tax_amount_columns, grand_total_columns = [], []
+		for i, tax in enumerate(taxes):
+			tax_amount_precision = tax.precision("tax_amount")
+			tax_rates = self.get_tax_rate_column(tax, item_tax_maps)
+			tax_amounts = self.get_current_tax_amount_column(
+				tax, tax_rates, tax_amount_columns, grand_total_columns
+			)
+
+			if not (self.doc.get("is_consolidated") or tax.get("dont_recompute_tax")):
+				self.set_item_wise_tax_column(tax, tax_rates, tax_amounts)
+
+			if frappe.flags.round_row_wise_tax:
+				tax_amounts = [flt(amount, tax_amount_precision) for amount in tax_amounts]
+
+			# Adjust divisional loss to the last item
+			if tax.charge_type == "Actual":
+				actual_tax_amount = flt(tax.tax_amount, tax_amount_precision)
+				for amount in tax_amounts:
+					actual_tax_amount -= amount
+				tax_amounts[-1] += actual_tax_amount
+
+			for amount in tax_amounts:
+				if tax.charge_type != "Actual" and accumulate_tax_amount:
+					tax.tax_amount += amount
+				tax.tax_amount_after_discount_amount += amount
+
+			# 0 for valuation, -1 for deductions in purchase documents
+			factor = self.get_tax_amount_if_for_valuation_or_deduction(1.0, tax)
+			previous_totals = grand_total_columns[i - 1] if i else net_amounts
+			grand_totals = [
+				flt(previous_total + amount * factor)
+				for previous_total, amount in zip(previous_totals, tax_amounts)
+			]
+
+			tax_amount_columns.append(tax_amounts)
+			grand_total_columns.append(grand_totals)
+			tax.tax_amount_for_current_item = tax_amounts[-1]
+			tax.grand_total_for_current_item = grand_totals[-1]
+
+			self.round_off_totals(tax)
+			self._set_in_company_currency(tax, ["tax_amount", "tax_amount_after_discount_amount"])
+
+			self.round_off_base_values(tax)
+			self.set_cumulative_total(i, tax)
+
+			self._set_in_company_currency(tax, ["total"])
+
+			# adjust Discount Amount loss in last tax iteration
+			if (
+				i == (len(taxes) - 1)
+				and self.discount_amount_applied
+				and self.doc.discount_amount
+				and self.doc.apply_discount_on == "Grand Total"
+				and not rounding_adjustment_computed
+			):
+				self.doc.rounding_adjustment = flt(
+					self.doc.grand_total - flt(self.doc.discount_amount) - tax.total,
+					self.doc.precision("rounding_adjustment"),
+				)
+
+	def get_tax_rate_column(self, tax, item_tax_maps):
+		rate_precision = self.doc.precision("rate", tax)
+		return [
+			flt(item_tax_map.get(tax.account_head), rate_precision)
+			if tax.account_head in item_tax_map
+			else tax.rate
+			for item_tax_map in item_tax_maps
+		]
+
+	def get_current_tax_amount_column(self, tax, tax_rates, tax_amount_columns, grand_total_columns):
+		"""`get_current_tax_amount` of all items"""
+		if tax.charge_type == "Actual":
+			# distribute the tax amount proportionally to each item row
+			actual = flt(tax.tax_amount, tax.precision("tax_amount"))
+			net_total = self.doc.net_total
+			return [item.net_amount * actual / net_total if net_total else 0.0 for item in self._items]
+
+		if tax.charge_type == "On Net Total":
+			amounts = [item.net_amount for item in self._items]
+		elif tax.charge_type == "On Previous Row Amount":
+			amounts = tax_amount_columns[cint(tax.row_id) - 1]
+		elif tax.charge_type == "On Previous Row Total":
+			amounts = grand_total_columns[cint(tax.row_id) - 1]
+		elif tax.charge_type == "On Item Quantity":
+			return [tax_rate * item.qty for tax_rate, item in zip(tax_rates, self._items)]
+		else:
+			return [0.0] * len(self._items)
+
+		return [(tax_rate / 100.0) * amount for tax_rate, amount in zip(tax_rates, amounts)]
+
+	def set_item_wise_tax_column(self, tax, tax_rates, tax_amounts):
+		"""`set_item_wise_tax` of all items"""
+		item_wise_tax_detail = tax.item_wise_tax_detail
+		conversion_rate = self.doc.conversion_rate
+		round_row_wise_tax = frappe.flags.round_row_wise_tax
+		tax_amount_precision = tax.precision("tax_amount")
+
+		for item, tax_rate, current_tax_amount in zip(self._items, tax_rates, tax_amounts):
+			key = item.item_code or item.item_name
+			item_wise_tax_amount = current_tax_amount * conversion_rate
+			previous = item_wise_tax_detail.get(key)
+			if round_row_wise_tax:
+				item_wise_tax_amount = flt(item_wise_tax_amount, tax_amount_precision)
+				if previous:
+					item_wise_tax_amount += flt(previous[1], tax_amount_precision)
+				item_wise_tax_detail[key] = [tax_rate, flt(item_wise_tax_amount, tax_amount_precision)]
+			else:
+				if previous:
+					item_wise_tax_amount += previous[1]
+				item_wise_tax_detail[key] = [tax_rate, flt(item_wise_tax_amount)]
+
 	def get_tax_amount_if_for_valuation_or_deduction(self, tax_amount, tax):
 		# if just for valuation, do not add the tax amount in total
 		# if tax/charges is for deduction, multiply by -1
@@ -986,6 +1130,13 @@ def get_itemised_tax_breakup_html(doc):
 	)
 
 
+@request_cache
+def load_item_tax_rate(item_tax_rate):
+	"""Item tax map of the JSON, parsed once per request as totals are calculated several
+	times per save. The map is shared, so it must not be modified."""
+	return json.loads(item_tax_rate)
+
+
 @frappe.whitelist()
 def get_round_off_applicable_accounts(company, account_list):
 	# required to set correct region
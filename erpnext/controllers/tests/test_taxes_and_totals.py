@@ -0,0 +1,189 @@
+import json
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase, change_settings
+
+from erpnext.controllers.taxes_and_totals import calculate_taxes_and_totals
+
+ITEM_FIELDS = ("net_rate", "net_amount", "base_net_rate", "base_net_amount", "amount")
+TAX_FIELDS = (
+	"tax_amount",
+	"base_tax_amount",
+	"tax_amount_after_discount_amount",
+	"base_tax_amount_after_discount_amount",
+	"total",
+	"base_total",
+	"tax_amount_for_current_item",
+	"grand_total_for_current_item",
+	"item_wise_tax_detail",
+)
+DOC_FIELDS = (
+	"net_total",
+	"base_net_total",
+	"total_taxes_and_charges",
+	"base_total_taxes_and_charges",
+	"taxes_and_charges_added",
+	"taxes_and_charges_deducted",
+	"discount_amount",
+	"grand_total",
+	"base_grand_total",
+	"rounding_adjustment",
+	"rounded_total",
+)
+
+
+class TestColumnarTaxes(FrappeTestCase):
+	"""Columnar calculation of large documents against the row-wise one"""
+
+	def make_invoice(self, doctype, taxes, items=150, **fields):
+		doc = frappe.get_doc(
+			{
+				"doctype": doctype,
+				"company": "_Test Company",
+				"currency": "USD",
+				"conversion_rate": 63.17,
+				"price_list_currency": "USD",
+				"plc_conversion_rate": 63.17,
+				**fields,
+			}
+		)
+		item_codes = ("_Test Item", "_Test Item 2", "_Test Item Home Desktop 100")
+		for i in range(items):
+			doc.append(
+				"items",
+				{
+					"item_code": item_codes[i % 3],
+					"qty": i % 7 + 1,
+					"rate": 10.13 * (i % 11 + 1),
+					"price_list_rate": 10.13 * (i % 11 + 1),
+					"conversion_factor": 1,
+					"item_tax_rate": json.dumps({"_Test Account Excise Duty - _TC": 7.25})
+					if i % 4 == 0
+					else None,
+				},
+			)
+		for tax in taxes:
+			doc.append("taxes", {"cost_center": "_Test Cost Center - _TC", "description": "Tax", **tax})
+
+		return doc
+
+	def assert_same_as_row_wise(self, make_doc):
+		with patch("erpnext.controllers.taxes_and_totals.COLUMNAR_TAXES_MIN_ITEMS", 10**6):
+			row_wise = make_doc()
+			calculate_taxes_and_totals(row_wise)
+
+		with patch("erpnext.controllers.taxes_and_totals.COLUMNAR_TAXES_MIN_ITEMS", 1):
+			columnar = make_doc()
+			calculate_taxes_and_totals(columnar)
+
+		for fieldname in DOC_FIELDS:
+			self.assertEqual(row_wise.get(fieldname), columnar.get(fieldname), fieldname)
+		for expected, actual in zip(row_wise.items, columnar.items):
+			for fieldname in ITEM_FIELDS:
+				self.assertEqual(expected.get(fieldname), actual.get(fieldname), fieldname)
+		for expected, actual in zip(row_wise.taxes, columnar.taxes):
+			for fieldname in TAX_FIELDS:
+				self.assertEqual(expected.get(fieldname), actual.get(fieldname), fieldname)
+
+	def get_sales_taxes(self):
+		return [
+			{
+				"charge_type": "On Net Total",
+				"account_head": "_Test Account Excise Duty - _TC",
+				"rate": 12.5,
+			},
+			{
+				"charge_type": "On Previous Row Amount",
+				"account_head": "_Test Account Education Cess - _TC",
+				"rate": 2,
+				"row_id": 1,
+			},
+			{
+				"charge_type": "On Previous Row Total",
+				"account_head": "_Test Account S&H Education Cess - _TC",
+				"rate": 1.3,
+				"row_id": 2,
+			},
+			{
+				"charge_type": "Actual",
+				"account_head": "_Test Account Shipping Charges - _TC",
+				"tax_amount": 100.37,
+			},
+			{
+				"charge_type": "On Item Quantity",
+				"account_head": "_Test Account CST - _TC",
+				"rate": 0.35,
+			},
+		]
+
+	def test_sales_invoice_taxes(self):
+		self.assert_same_as_row_wise(
+			lambda: self.make_invoice("Sales Invoice", self.get_sales_taxes(), customer="_Test Customer")
+		)
+
+	@change_settings("Accounts Settings", {"round_row_wise_tax": 1})
+	def test_sales_invoice_taxes_rounded_row_wise(self):
+		self.assert_same_as_row_wise(
+			lambda: self.make_invoice("Sales Invoice", self.get_sales_taxes(), customer="_Test Customer")
+		)
+
+	def test_sales_invoice_discount_on_grand_total(self):
+		self.assert_same_as_row_wise(
+			lambda: self.make_invoice(
+				"Sales Invoice",
+				self.get_sales_taxes(),
+				customer="_Test Customer",
+				apply_discount_on="Grand Total",
+				additional_discount_percentage=7.5,
+			)
+		)
+
+	def test_inclusive_taxes(self):
+		taxes = [
+			{
+				"charge_type": "On Net Total",
+				"account_head": "_Test Account Excise Duty - _TC",
+				"rate": 12.5,
+				"included_in_print_rate": 1,
+			},
+			{
+				"charge_type": "On Previous Row Total",
+				"account_head": "_Test Account VAT - _TC",
+				"rate": 4,
+				"row_id": 1,
+				"included_in_print_rate": 1,
+			},
+		]
+		self.assert_same_as_row_wise(
+			lambda: self.make_invoice("Sales Invoice", taxes, customer="_Test Customer")
+		)
+
+	def test_purchase_invoice_valuation_and_deduction(self):
+		taxes = [
+			{
+				"charge_type": "On Net Total",
+				"account_head": "_Test Account Excise Duty - _TC",
+				"rate": 12.5,
+				"category": "Total",
+				"add_deduct_tax": "Add",
+			},
+			{
+				"charge_type": "On Net Total",
+				"account_head": "_Test Account Shipping Charges - _TC",
+				"rate": 3,
+				"category": "Valuation",
+				"add_deduct_tax": "Add",
+			},
+			{
+				"charge_type": "On Previous Row Total",
+				"account_head": "_Test Account VAT - _TC",
+				"rate": 2,
+				"row_id": 2,
+				"category": "Total",
+				"add_deduct_tax": "Deduct",
+			},
+		]
+		self.assert_same_as_row_wise(
+			lambda: self.make_invoice("Purchase Invoice", taxes, supplier="_Test Supplier")
+		)
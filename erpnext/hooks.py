@@ -310,11 +310,23 @@ period_closing_doctypes = [
 
 doc_events = {
 	"*": {
+		"before_validate": "erpnext.utilities.submit_profiler.start_profile",
 		"validate": "erpnext.support.doctype.service_level_agreement.service_level_agreement.apply",
+		"before_cancel": "erpnext.utilities.submit_profiler.start_profile",
+		"on_submit": "erpnext.utilities.submit_profiler.finish_profile",
+		"on_cancel": "erpnext.utilities.submit_profiler.finish_profile",
 	},
 	tuple(period_closing_doctypes): {
 		"validate": "erpnext.accounts.doctype.accounting_period.accounting_period.validate_accounting_period_on_doc_save",
 	},
+	("Quotation", "Sales Order", "Delivery Note", "Sales Invoice"): {
+		"on_submit": "erpnext.setup.doctype.company_transaction_summary.company_transaction_summary.update_company_transaction_summary",
+		"on_cancel": "erpnext.setup.doctype.company_transaction_summary.company_transaction_summary.update_company_transaction_summary",
+	},
+	("Issue", "Project"): {
+		"after_insert": "erpnext.setup.doctype.company_transaction_summary.company_transaction_summary.update_company_transaction_summary",
+		"on_trash": "erpnext.setup.doctype.company_transaction_summary.company_transaction_summary.update_company_transaction_summary",
+	},
 	"Stock Entry": {
 		"on_submit": "erpnext.stock.doctype.material_request.material_request.update_completed_and_requested_qty",
 		"on_cancel": "erpnext.stock.doctype.material_request.material_request.update_completed_and_requested_qty",
@@ -450,6 +462,7 @@ scheduler_events = {
 		"erpnext.manufacturing.doctype.bom_update_tool.bom_update_tool.auto_update_latest_price_in_all_boms",
 		"erpnext.crm.utils.open_leads_opportunities_based_on_todays_event",
 		"erpnext.assets.doctype.asset.depreciation.post_depreciation_entries",
+		"erpnext.accounts.doctype.ledger_integrity_mismatch.ledger_integrity_mismatch.check_ledger_integrity",
 	],
 	"monthly_long": [
 		"erpnext.accounts.deferred_revenue.process_deferred_accounting",
@@ -536,6 +549,7 @@ accounting_dimension_doctypes = [
 	"Subcontracting Receipt",
 	"Subcontracting Receipt Item",
 	"Account Closing Balance",
+	"Account Balance Snapshot",
 	"Supplier Quotation",
 	"Supplier Quotation Item",
 ]
@@ -640,6 +654,7 @@ extend_bootinfo = [
 
 default_log_clearing_doctypes = {
 	"Repost Item Valuation": 60,
+	"Submit Profile Log": 30,
 }
 
 export_python_type_annotations = True
@@ -17,6 +17,12 @@ frappe.ui.form.on('Production Plan', {
 			'Work Order': 'Work Order / Subcontract PO',
 			'Material Request': 'Material Request',
 		};
+
+		frappe.realtime.on("production_plan_mr_items", data => {
+			if (data.production_plan === frm.doc.name) {
+				frm.events.set_mr_items(frm, data.mr_items);
+			}
+		});
 	},
 
 	setup_queries(frm) {
@@ -349,29 +355,40 @@ frappe.ui.form.on('Production Plan', {
 
 	get_items_for_material_requests(frm, warehouses) {
 		frappe.call({
-			method: "erpnext.manufacturing.doctype.production_plan.production_plan.get_items_for_material_requests",
+			method: "erpnext.manufacturing.doctype.production_plan.production_plan.enqueue_items_for_material_requests",
 			freeze: true,
 			args: {
 				doc: frm.doc,
 				warehouses: warehouses || []
 			},
 			callback: function(r) {
-				if(r.message) {
-					frm.set_value('mr_items', []);
-					r.message.forEach(row => {
-						let d = frm.add_child('mr_items');
-						for (let field in row) {
-							if (field !== 'name') {
-								d[field] = row[field];
-							}
-						}
+				if (r.message && r.message.queued) {
+					frappe.show_alert({
+						message: __("Getting raw materials in the background"),
+						indicator: "blue"
 					});
+				} else if (r.message) {
+					frm.events.set_mr_items(frm, r.message.mr_items);
 				}
-				refresh_field('mr_items');
 			}
 		});
 	},
 
+	set_mr_items(frm, mr_items) {
+		if (mr_items) {
+			frm.set_value('mr_items', []);
+			mr_items.forEach(row => {
+				let d = frm.add_child('mr_items');
+				for (let field in row) {
+					if (field !== 'name') {
+						d[field] = row[field];
+					}
+				}
+			});
+		}
+		refresh_field('mr_items');
+	},
+
 	download_materials_required(frm) {
 		const fields = [{
 			fieldname: 'warehouses',
@@ -20,6 +20,7 @@ from frappe.utils import (
 	now_datetime,
 	nowdate,
 )
+from frappe.utils.background_jobs import is_job_enqueued
 from frappe.utils.csvutils import build_csv_response
 from pypika.terms import ExistsCriterion
 
@@ -31,6 +32,9 @@ from erpnext.stock.get_item_details import get_conversion_factor
 from erpnext.stock.utils import get_or_make_bin
 from erpnext.utilities.transaction_base import validate_uom_is_integer
 
+# plans with at least as many finished goods and sub-assemblies get raw materials in a job
+ENQUEUE_MR_ITEMS_MIN_ROWS = 50
+
 
 class ProductionPlan(Document):
 	# begin: auto-generated types
@@ -87,6 +91,7 @@ class ProductionPlan(Document):
 		project: DF.Link | None
 		sales_order_status: DF.Literal["", "To Deliver and Bill", "To Bill", "To Deliver"]
 		sales_orders: DF.Table[ProductionPlanSalesOrder]
+		schedule_by_lead_time: DF.Check
 		skip_available_sub_assembly_item: DF.Check
 		status: DF.Literal[
 			"",
@@ -1252,7 +1257,7 @@ def get_material_request_items(
 
 			required_qty = required_qty / row["conversion_factor"]
 
-	if frappe.db.get_value("UOM", row["purchase_uom"], "must_be_whole_number"):
+	if frappe.get_cached_value("UOM", row["purchase_uom"], "must_be_whole_number"):
 		required_qty = ceil(required_qty)
 
 	if include_safety_stock:
@@ -1369,20 +1374,51 @@ def get_bin_details(row, company, for_warehouse=None, all_warehouse=False):
 	if isinstance(row, str):
 		row = frappe._dict(json.loads(row))
 
+	warehouse = ""
+	if not all_warehouse:
+		warehouse = for_warehouse or row.get("source_warehouse") or row.get("default_warehouse")
+
+	bin = frappe.qb.DocType("Bin")
+	query = get_bin_details_query(company, warehouse).where(bin.item_code == row["item_code"])
+
+	return query.run(as_dict=True)
+
+
+def get_bin_details_of_items(rows, company, for_warehouse=None):
+	"""Bins of all the rows, one query per warehouse instead of one per row.
+
+	Returns the same first row as `get_bin_details` for each (item_code, warehouse) key,
+	where warehouse is the warehouse the row's stock is looked up in."""
+	items_by_warehouse = {}
+	for row in rows:
+		warehouse = for_warehouse or row.get("source_warehouse") or row.get("default_warehouse") or ""
+		items_by_warehouse.setdefault(warehouse, set()).add(row["item_code"])
+
+	bin = frappe.qb.DocType("Bin")
+	bin_details = {}
+	for warehouse, item_codes in items_by_warehouse.items():
+		query = (
+			get_bin_details_query(company, warehouse)
+			.select(bin.item_code)
+			.where(bin.item_code.isin(list(item_codes)))
+		)
+		for d in query.run(as_dict=True):
+			bin_details.setdefault((d.pop("item_code"), warehouse), d)
+
+	return bin_details
+
+
+def get_bin_details_query(company, warehouse=None):
 	bin = frappe.qb.DocType("Bin")
 	wh = frappe.qb.DocType("Warehouse")
 
 	subquery = frappe.qb.from_(wh).select(wh.name).where(wh.company == company)
 
-	warehouse = ""
-	if not all_warehouse:
-		warehouse = for_warehouse or row.get("source_warehouse") or row.get("default_warehouse")
-
 	if warehouse:
 		lft, rgt = frappe.db.get_value("Warehouse", warehouse, ["lft", "rgt"])
 		subquery = subquery.where((wh.lft >= lft) & (wh.rgt <= rgt) & (wh.name == bin.warehouse))
 
-	query = (
+	return (
 		frappe.qb.from_(bin)
 		.select(
 			bin.warehouse,
@@ -1392,12 +1428,12 @@ def get_bin_details(row, company, for_warehouse=None, all_warehouse=False):
 			IfNull(Sum(bin.reserved_qty_for_production), 0).as_("reserved_qty_for_production"),
 			IfNull(Sum(bin.planned_qty), 0).as_("planned_qty"),
 		)
-		.where((bin.item_code == row["item_code"]) & (bin.warehouse.isin(subquery)))
+		.where(bin.warehouse.isin(subquery))
 		.groupby(bin.item_code, bin.warehouse)
+		.orderby(bin.item_code)
+		.orderby(bin.warehouse)
 	)
 
-	return query.run(as_dict=True)
-
 
 @frappe.whitelist()
 def get_so_details(sales_order):
@@ -1423,7 +1459,9 @@ def get_warehouse_list(warehouses):
 
 
 @frappe.whitelist()
-def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_data=None):
+def get_items_for_material_requests(
+	doc, warehouses=None, get_parent_warehouse_data=None, publish_progress=False
+):
 	if isinstance(doc, str):
 		doc = frappe._dict(json.loads(doc))
 
@@ -1473,7 +1511,15 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 		for d in doc.get("sub_assembly_items"):
 			sub_assembly_items.setdefault((d.get("production_item"), d.get("bom_no")), d.get("qty"))
 
-	for data in po_items:
+	for idx, data in enumerate(po_items):
+		if publish_progress:
+			frappe.publish_progress(
+				idx * 100 / len(po_items),
+				title=_("Getting Raw Materials..."),
+				doctype="Production Plan",
+				docname=doc.get("name"),
+			)
+
 		if not data.get("include_exploded_items") and doc.get("sub_assembly_items"):
 			data["include_exploded_items"] = 1
 
@@ -1565,12 +1611,20 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 			else:
 				so_item_details[sales_order][item_code] = details
 
+	bin_details = get_bin_details_of_items(
+		[details for item_dict in so_item_details.values() for details in item_dict.values()],
+		doc.company,
+		warehouse,
+	)
+
 	mr_items = []
 	for sales_order, item_code in so_item_details.items():
 		item_dict = so_item_details[sales_order]
 		for details in item_dict.values():
-			bin_dict = get_bin_details(details, doc.company, warehouse)
-			bin_dict = bin_dict[0] if bin_dict else {}
+			bin_warehouse = (
+				warehouse or details.get("source_warehouse") or details.get("default_warehouse") or ""
+			)
+			bin_dict = bin_details.get((details.item_code, bin_warehouse), {})
 
 			if details.qty > 0:
 				items = get_material_request_items(
@@ -1593,6 +1647,9 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 
 		mr_items = new_mr_items
 
+	if doc.get("schedule_by_lead_time"):
+		set_schedule_dates_by_lead_time(mr_items, po_items)
+
 	if not mr_items:
 		to_enable = frappe.bold(_("Ignore Existing Projected Quantity"))
 		warehouse = frappe.bold(doc.get("for_warehouse"))
@@ -1609,6 +1666,65 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 	return mr_items
 
 
+def set_schedule_dates_by_lead_time(mr_items, po_items):
+	"""Materials are required by the earliest planned start date, unless their lead time
+	means they cannot arrive by then"""
+	start_dates = [
+		getdate(d.get("planned_start_date")) for d in po_items if d.get("planned_start_date")
+	]
+	today = getdate(nowdate())
+	required_by = min(start_dates) if start_dates else today
+
+	lead_times = dict(
+		frappe.get_all(
+			"Item",
+			filters={"name": ("in", list({d["item_code"] for d in mr_items}))},
+			fields=["name", "lead_time_days"],
+			as_list=True,
+		)
+		if mr_items
+		else []
+	)
+
+	for d in mr_items:
+		d["schedule_date"] = max(required_by, add_days(today, cint(lead_times.get(d["item_code"]))))
+
+
+@frappe.whitelist()
+def enqueue_items_for_material_requests(doc, warehouses=None):
+	"""Raw materials of large saved plans are fetched in the background and sent to the
+	user with the `production_plan_mr_items` event, smaller plans are returned directly"""
+	if isinstance(doc, str):
+		doc = frappe._dict(json.loads(doc))
+
+	rows = len(doc.get("po_items") or []) + len(doc.get("sub_assembly_items") or [])
+	if rows < ENQUEUE_MR_ITEMS_MIN_ROWS or not doc.get("name") or doc.get("__islocal"):
+		return {"mr_items": get_items_for_material_requests(doc, warehouses)}
+
+	job_id = f"production_plan_mr_items::{doc.name}"
+	if not is_job_enqueued(job_id):
+		frappe.enqueue(
+			get_items_for_material_requests_in_background,
+			queue="long",
+			job_id=job_id,
+			doc=doc,
+			warehouses=warehouses,
+			user=frappe.session.user,
+			now=frappe.flags.in_test,
+		)
+
+	return {"queued": True}
+
+
+def get_items_for_material_requests_in_background(doc, warehouses, user):
+	mr_items = get_items_for_material_requests(doc, warehouses, publish_progress=True)
+	frappe.publish_realtime(
+		"production_plan_mr_items",
+		{"production_plan": doc.get("name"), "mr_items": mr_items},
+		user=user,
+	)
+
+
 def get_materials_from_other_locations(item, warehouses, new_mr_items, company):
 	from erpnext.stock.doctype.pick_list.pick_list import get_available_item_locations
 
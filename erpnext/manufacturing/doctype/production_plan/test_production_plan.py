@@ -6,6 +6,8 @@ from frappe.utils import add_to_date, flt, getdate, now_datetime, nowdate
 
 from erpnext.controllers.item_variant import create_variant
 from erpnext.manufacturing.doctype.production_plan.production_plan import (
+	get_bin_details,
+	get_bin_details_of_items,
 	get_items_for_material_requests,
 	get_non_completed_production_plans,
 	get_sales_orders,
@@ -1522,6 +1524,56 @@ class TestProductionPlan(FrappeTestCase):
 		for d in mr_items:
 			self.assertEqual(d.get("quantity"), 1000.0)
 
+	def test_bin_details_of_items(self):
+		"""Bins fetched for all items at once are the same as fetched item by item"""
+		from erpnext.stock.doctype.warehouse.test_warehouse import create_warehouse
+
+		rm_warehouse = create_warehouse("RM Warehouse", company="_Test Company")
+		rows = []
+		for warehouse in ("_Test Warehouse - _TC", rm_warehouse, None):
+			item_code = make_item(properties={"is_stock_item": 1}).name
+			for target in ("_Test Warehouse - _TC", rm_warehouse):
+				make_stock_entry(item_code=item_code, target=target, qty=5, basic_rate=100)
+			rows.append(frappe._dict({"item_code": item_code, "source_warehouse": warehouse}))
+
+		for for_warehouse in (None, rm_warehouse):
+			bin_details = get_bin_details_of_items(rows, "_Test Company", for_warehouse)
+			for row in rows:
+				expected = get_bin_details(row, "_Test Company", for_warehouse)[0]
+				warehouse = for_warehouse or row.source_warehouse or ""
+				self.assertEqual(bin_details[(row.item_code, warehouse)], expected)
+
+	def test_mr_items_scheduled_by_lead_time(self):
+		fg_item = make_item(properties={"is_stock_item": 1}).name
+		rm_item = make_item(properties={"is_stock_item": 1}).name
+		rm_item_with_lead_time = make_item(properties={"is_stock_item": 1, "lead_time_days": 10}).name
+
+		make_bom(
+			item=fg_item,
+			raw_materials=[rm_item, rm_item_with_lead_time],
+			source_warehouse="_Test Warehouse - _TC",
+		)
+
+		planned_start_date = add_to_date(nowdate(), days=3)
+		pln = create_production_plan(
+			item_code=fg_item,
+			planned_start_date=planned_start_date,
+			skip_getting_mr_items=1,
+			do_not_save=1,
+		)
+
+		mr_items = get_items_for_material_requests(pln.as_dict())
+		self.assertFalse([d for d in mr_items if d.get("schedule_date")])
+
+		pln.schedule_by_lead_time = 1
+		schedule_dates = {
+			d["item_code"]: d["schedule_date"] for d in get_items_for_material_requests(pln.as_dict())
+		}
+		self.assertEqual(schedule_dates[rm_item], getdate(planned_start_date))
+		self.assertEqual(
+			schedule_dates[rm_item_with_lead_time], getdate(add_to_date(nowdate(), days=10))
+		)
+
 	def test_fg_item_quantity(self):
 		from erpnext.stock.doctype.warehouse.test_warehouse import create_warehouse
 		from erpnext.stock.utils import get_or_make_bin
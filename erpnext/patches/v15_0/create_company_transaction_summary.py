@@ -0,0 +1,62 @@
+import frappe
+from frappe.query_builder.functions import Count, Date, Sum
+from frappe.utils import flt, now
+
+from erpnext.setup.doctype.company_transaction_summary.company_transaction_summary import (
+	SUMMARY_DOCTYPES,
+)
+
+
+def execute():
+	frappe.db.truncate("Company Transaction Summary")
+
+	fields = [
+		"name",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+		"company",
+		"reference_doctype",
+		"transaction_date",
+		"transaction_count",
+		"transaction_amount",
+	]
+	timestamp = now()
+
+	for doctype, (date_field, amount_field) in SUMMARY_DOCTYPES.items():
+		table = frappe.qb.DocType(doctype)
+		query = (
+			frappe.qb.from_(table)
+			.select(
+				table.company,
+				Date(table[date_field]).as_("transaction_date"),
+				Count(table.name).as_("count"),
+			)
+			.where(table.company.isnotnull())
+			.groupby(table.company, Date(table[date_field]))
+		)
+
+		if amount_field:
+			query = query.select(Sum(table[amount_field]).as_("amount"))
+
+		if frappe.get_meta(doctype).is_submittable:
+			query = query.where(table.docstatus == 1)
+
+		values = [
+			(
+				frappe.generate_hash(length=10),
+				timestamp,
+				timestamp,
+				"Administrator",
+				"Administrator",
+				d.company,
+				doctype,
+				d.transaction_date,
+				d.count,
+				flt(d.amount),
+			)
+			for d in query.run(as_dict=True)
+		]
+
+		frappe.db.bulk_insert("Company Transaction Summary", fields=fields, values=values)
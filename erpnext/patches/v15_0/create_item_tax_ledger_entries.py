@@ -0,0 +1,57 @@
+import frappe
+
+from erpnext.accounts.doctype.item_tax_ledger_entry.item_tax_ledger_entry import (
+	TAX_DOCTYPES,
+	get_item_tax_ledger_entries,
+	insert_item_tax_ledger_entries,
+)
+
+
+def execute():
+	frappe.db.delete("Item Tax Ledger Entry")
+
+	for doctype, tax_doctype in TAX_DOCTYPES.items():
+		invoices = frappe.get_all(
+			doctype,
+			filters={"docstatus": 1},
+			fields=["name", "company", "posting_date", "base_net_total"],
+			order_by="name",
+		)
+
+		item_fields = ["name", "parent", "item_code", "item_name", "base_net_amount"]
+		tax_fields = [
+			"name",
+			"parent",
+			"description",
+			"item_wise_tax_detail",
+			"account_head",
+			"charge_type",
+			"base_tax_amount_after_discount_amount",
+		]
+		if doctype == "Purchase Invoice":
+			tax_fields += ["category", "add_deduct_tax"]
+
+		for i in range(0, len(invoices), 1000):
+			chunk = {
+				d.name: frappe._dict(d, doctype=doctype, items=[], taxes=[])
+				for d in invoices[i : i + 1000]
+			}
+
+			for field, child_doctype, fields in (
+				("items", f"{doctype} Item", item_fields),
+				("taxes", tax_doctype, tax_fields),
+			):
+				for row in frappe.get_all(
+					child_doctype,
+					filters={"parenttype": doctype, "parent": ("in", list(chunk))},
+					fields=fields,
+					order_by="idx",
+				):
+					chunk[row.parent][field].append(row)
+
+			entries = []
+			for invoice in chunk.values():
+				entries.extend(get_item_tax_ledger_entries(invoice))
+
+			insert_item_tax_ledger_entries(entries)
+			frappe.db.commit()
@@ -0,0 +1,114 @@
+import frappe
+
+from erpnext.accounts.doctype.tax_withholding_balance.tax_withholding_balance import (
+	get_or_make_tax_withholding_balance,
+	get_withholding_period,
+)
+
+
+def execute():
+	set_sales_invoice_tax_withholding_category()
+	frappe.db.delete("Tax Withholding Balance")
+
+	keys = set()
+	for d in get_tax_withholding_vouchers():
+		period = get_withholding_period(d.tax_withholding_category, d.posting_date, d.company)
+		if period:
+			keys.add(
+				(
+					d.company,
+					d.tax_withholding_category,
+					d.party_type,
+					d.party,
+					period.from_date,
+					period.to_date,
+				)
+			)
+
+	for company, tax_withholding_category, party_type, party, from_date, to_date in keys:
+		key = frappe._dict(
+			{
+				"company": company,
+				"tax_withholding_category": tax_withholding_category,
+				"party_type": party_type,
+				"party": party,
+				"from_date": from_date,
+				"to_date": to_date,
+			}
+		)
+		get_or_make_tax_withholding_balance(key)
+		frappe.db.commit()
+
+
+def set_sales_invoice_tax_withholding_category():
+	"""Submitted invoices were withheld under the current category of their Customer"""
+	si = frappe.qb.DocType("Sales Invoice")
+	for customer, tax_withholding_category in frappe.get_all(
+		"Customer",
+		filters={"tax_withholding_category": ("is", "set")},
+		fields=["name", "tax_withholding_category"],
+		as_list=True,
+	):
+		(
+			frappe.qb.update(si)
+			.set(si.tax_withholding_category, tax_withholding_category)
+			.where(
+				(si.customer == customer)
+				& (si.docstatus == 1)
+				& (si.tax_withholding_category.isnull())
+			)
+		).run()
+
+
+def get_tax_withholding_vouchers():
+	fields = ["company", "posting_date", "tax_withholding_category"]
+
+	vouchers = frappe.get_all(
+		"Purchase Invoice",
+		filters={"docstatus": 1, "apply_tds": 1, "tax_withholding_category": ("is", "set")},
+		fields=fields + ["supplier as party"],
+		distinct=True,
+	)
+	for d in vouchers:
+		d.party_type = "Supplier"
+	vouchers += frappe.get_all(
+		"Payment Entry",
+		filters={
+			"docstatus": 1,
+			"party_type": "Supplier",
+			"apply_tax_withholding_amount": 1,
+			"tax_withholding_category": ("is", "set"),
+		},
+		fields=fields + ["party_type", "party"],
+		distinct=True,
+	)
+
+	sales_invoices = frappe.get_all(
+		"Sales Invoice",
+		filters={"docstatus": 1, "tax_withholding_category": ("is", "set")},
+		fields=fields + ["customer as party"],
+		distinct=True,
+	)
+	for d in sales_invoices:
+		d.party_type = "Customer"
+	vouchers += sales_invoices
+
+	je = frappe.qb.DocType("Journal Entry")
+	jea = frappe.qb.DocType("Journal Entry Account")
+	vouchers += (
+		frappe.qb.from_(je)
+		.inner_join(jea)
+		.on(je.name == jea.parent)
+		.select(je.company, je.posting_date, je.tax_withholding_category, jea.party_type, jea.party)
+		.distinct()
+		.where(
+			(je.docstatus == 1)
+			& (je.apply_tds == 1)
+			& (je.tax_withholding_category.isnotnull())
+			& (jea.party_type.isin(["Supplier", "Customer"]))
+			& (jea.party.isnotnull())
+		)
+		.run(as_dict=True)
+	)
+
+	return [d for d in vouchers if d.tax_withholding_category]
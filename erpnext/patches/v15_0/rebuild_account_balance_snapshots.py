@@ -0,0 +1,15 @@
+from erpnext.accounts.doctype.account_balance_snapshot.account_balance_snapshot import (
+	is_snapshot_enabled,
+	rebuild_account_balance_snapshots,
+)
+from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
+	create_accounting_dimensions_for_doctype,
+)
+
+
+def execute():
+	create_accounting_dimensions_for_doctype(doctype="Account Balance Snapshot")
+
+	# snapshots are now also kept per finance book, project and accounting dimension
+	if is_snapshot_enabled():
+		rebuild_account_balance_snapshots()
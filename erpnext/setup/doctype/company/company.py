@@ -11,7 +11,7 @@ from frappe.cache_manager import clear_defaults_cache
 from frappe.contacts.address_and_contact import load_address_and_contact
 from frappe.custom.doctype.property_setter.property_setter import make_property_setter
 from frappe.desk.page.setup_wizard.setup_wizard import make_records
-from frappe.utils import cint, formatdate, get_timestamp, today
+from frappe.utils import cint, flt, formatdate, get_timestamp
 from frappe.utils.nestedset import NestedSet, rebuild_tree
 
 from erpnext.accounts.doctype.account.account import get_account_currency
@@ -702,45 +702,24 @@ def install_country_fixtures(company, country):
 
 
 def update_company_current_month_sales(company):
-	current_month_year = formatdate(today(), "MM-yyyy")
-
-	results = frappe.db.sql(
-		"""
-		SELECT
-			SUM(base_grand_total) AS total,
-			DATE_FORMAT(`posting_date`, '%m-%Y') AS month_year
-		FROM
-			`tabSales Invoice`
-		WHERE
-			DATE_FORMAT(`posting_date`, '%m-%Y') = '{current_month_year}'
-			AND docstatus = 1
-			AND company = {company}
-		GROUP BY
-			month_year
-	""".format(
-			current_month_year=current_month_year, company=frappe.db.escape(company)
-		),
-		as_dict=True,
+	from erpnext.setup.doctype.company_transaction_summary.company_transaction_summary import (
+		get_current_month_sales,
 	)
 
-	monthly_total = results[0]["total"] if len(results) > 0 else 0
-
-	frappe.db.set_value("Company", company, "total_monthly_sales", monthly_total)
+	frappe.db.set_value("Company", company, "total_monthly_sales", get_current_month_sales(company))
 
 
 def update_company_monthly_sales(company):
 	"""Cache past year monthly sales of every company based on sales invoices"""
-	import json
-
-	from frappe.utils.goal import get_monthly_results
-
-	filter_str = "company = {0} and status != 'Draft' and docstatus=1".format(
-		frappe.db.escape(company)
-	)
-	month_to_value_dict = get_monthly_results(
-		"Sales Invoice", "base_grand_total", "posting_date", filter_str, "sum"
+	from erpnext.setup.doctype.company_transaction_summary.company_transaction_summary import (
+		get_transaction_summary,
 	)
 
+	month_to_value_dict = {}
+	for d in get_transaction_summary(company, reference_doctype="Sales Invoice"):
+		month_year = formatdate(d.transaction_date, "MM-yyyy")
+		month_to_value_dict[month_year] = flt(month_to_value_dict.get(month_year)) + flt(d.amount)
+
 	frappe.db.set_value("Company", company, "sales_monthly_history", json.dumps(month_to_value_dict))
 
 
@@ -797,79 +776,21 @@ def add_node():
 
 
 def get_all_transactions_annual_history(company):
-	out = {}
-
-	items = frappe.db.sql(
-		"""
-		select transaction_date, count(*) as count
-
-		from (
-			select name, transaction_date, company
-			from `tabQuotation`
-
-			UNION ALL
-
-			select name, transaction_date, company
-			from `tabSales Order`
-
-			UNION ALL
-
-			select name, posting_date as transaction_date, company
-			from `tabDelivery Note`
-
-			UNION ALL
-
-			select name, posting_date as transaction_date, company
-			from `tabSales Invoice`
-
-			UNION ALL
-
-			select name, creation as transaction_date, company
-			from `tabIssue`
-
-			UNION ALL
-
-			select name, creation as transaction_date, company
-			from `tabProject`
-		) t
-
-		where
-			company=%s
-			and
-			transaction_date > date_sub(curdate(), interval 1 year)
-
-		group by
-			transaction_date
-			""",
-		(company),
-		as_dict=True,
+	from erpnext.setup.doctype.company_transaction_summary.company_transaction_summary import (
+		get_annual_transaction_count,
 	)
 
-	for d in items:
-		timestamp = get_timestamp(d["transaction_date"])
-		out.update({timestamp: d["count"]})
+	out = {}
+	for d in get_annual_transaction_count(company):
+		timestamp = get_timestamp(d.transaction_date)
+		out.update({timestamp: d.count})
 
 	return out
 
 
 def get_timeline_data(doctype, name):
 	"""returns timeline data based on linked records in dashboard"""
-	out = {}
-	date_to_value_dict = {}
-
-	history = frappe.get_cached_value("Company", name, "transactions_annual_history")
-
-	try:
-		date_to_value_dict = json.loads(history) if history and "{" in history else None
-	except ValueError:
-		date_to_value_dict = None
-
-	if date_to_value_dict is None:
-		update_transactions_annual_history(name, True)
-		history = frappe.get_cached_value("Company", name, "transactions_annual_history")
-		return json.loads(history) if history and "{" in history else {}
-
-	return date_to_value_dict
+	return get_all_transactions_annual_history(name)
 
 
 @frappe.whitelist()
@@ -0,0 +1,146 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder.functions import Sum
+from frappe.utils import add_years, flt, get_first_day, get_last_day, getdate, today
+
+# doctype: (date field, amount field)
+SUMMARY_DOCTYPES = {
+	"Quotation": ("transaction_date", "base_grand_total"),
+	"Sales Order": ("transaction_date", "base_grand_total"),
+	"Delivery Note": ("posting_date", "base_grand_total"),
+	"Sales Invoice": ("posting_date", "base_grand_total"),
+	"Issue": ("creation", None),
+	"Project": ("creation", None),
+}
+
+
+class CompanyTransactionSummary(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		company: DF.Link | None
+		reference_doctype: DF.Link | None
+		transaction_amount: DF.Currency
+		transaction_count: DF.Int
+		transaction_date: DF.Date | None
+	# end: auto-generated types
+
+	pass
+
+
+def update_company_transaction_summary(doc, method=None):
+	"""Add / remove the transaction from the daily summary of its company.
+
+	Hooked on submit / cancel of sales transactions and on insert / delete of Issues and Projects."""
+
+	if not doc.get("company") or doc.doctype not in SUMMARY_DOCTYPES:
+		return
+
+	date_field, amount_field = SUMMARY_DOCTYPES[doc.doctype]
+	sign = -1 if method in ("on_cancel", "on_trash") else 1
+	amount = flt(doc.get(amount_field)) if amount_field else 0
+
+	add_to_summary(
+		doc.company, doc.doctype, getdate(doc.get(date_field)), count=sign, amount=sign * amount
+	)
+
+	if (
+		doc.doctype == "Sales Invoice"
+		and frappe.db.get_single_value("Selling Settings", "sales_update_frequency")
+		== "Each Transaction"
+	):
+		from erpnext.setup.doctype.company.company import update_company_current_month_sales
+
+		update_company_current_month_sales(doc.company)
+
+
+def add_to_summary(company, reference_doctype, transaction_date, count=0, amount=0):
+	name = get_or_make_summary(company, reference_doctype, transaction_date)
+
+	# increment in the database to not lose concurrent updates of the same day
+	cts = frappe.qb.DocType("Company Transaction Summary")
+	(
+		frappe.qb.update(cts)
+		.set(cts.transaction_count, cts.transaction_count + count)
+		.set(cts.transaction_amount, cts.transaction_amount + amount)
+		.where(cts.name == name)
+	).run()
+
+
+def get_or_make_summary(company, reference_doctype, transaction_date):
+	filters = {
+		"company": company,
+		"reference_doctype": reference_doctype,
+		"transaction_date": transaction_date,
+	}
+
+	if name := frappe.db.get_value("Company Transaction Summary", filters):
+		return name
+
+	savepoint = "create_company_transaction_summary"
+	try:
+		frappe.db.savepoint(savepoint)
+		summary = frappe.get_doc(doctype="Company Transaction Summary", **filters)
+		summary.flags.ignore_permissions = True
+		summary.insert()
+		return summary.name
+	except frappe.UniqueValidationError:
+		frappe.db.rollback(save_point=savepoint)  # preserve transaction in postgres
+		return frappe.db.get_value("Company Transaction Summary", filters)
+
+
+def get_transaction_summary(company, from_date=None, to_date=None, reference_doctype=None):
+	"""Returns date wise transaction count and amount of the company"""
+
+	cts = frappe.qb.DocType("Company Transaction Summary")
+	query = (
+		frappe.qb.from_(cts)
+		.select(
+			cts.transaction_date,
+			Sum(cts.transaction_count).as_("count"),
+			Sum(cts.transaction_amount).as_("amount"),
+		)
+		.where(cts.company == company)
+		.groupby(cts.transaction_date)
+		.orderby(cts.transaction_date)
+	)
+
+	if from_date:
+		query = query.where(cts.transaction_date >= from_date)
+
+	if to_date:
+		query = query.where(cts.transaction_date <= to_date)
+
+	if reference_doctype:
+		query = query.where(cts.reference_doctype == reference_doctype)
+
+	return query.run(as_dict=True)
+
+
+def get_current_month_sales(company):
+	data = get_transaction_summary(
+		company, get_first_day(today()), get_last_day(today()), reference_doctype="Sales Invoice"
+	)
+
+	return sum(flt(d.amount) for d in data)
+
+
+def get_annual_transaction_count(company):
+	data = get_transaction_summary(company, from_date=add_years(today(), -1))
+	return [d for d in data if d.count > 0]
+
+
+def on_doctype_update():
+	frappe.db.add_unique(
+		"Company Transaction Summary",
+		["company", "reference_doctype", "transaction_date"],
+		constraint_name="unique_company_doctype_date",
+	)
@@ -0,0 +1,38 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import flt, getdate, nowdate
+
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+
+class TestCompanyTransactionSummary(FrappeTestCase):
+	def test_summary_updated_on_submit_and_cancel(self):
+		before = get_summary("_Test Company", "Sales Invoice", nowdate())
+
+		si = create_sales_invoice(qty=2, rate=150)
+		after_submit = get_summary("_Test Company", "Sales Invoice", nowdate())
+		self.assertEqual(after_submit.transaction_count, before.transaction_count + 1)
+		self.assertEqual(
+			flt(after_submit.transaction_amount), flt(before.transaction_amount) + si.base_grand_total
+		)
+
+		si.cancel()
+		after_cancel = get_summary("_Test Company", "Sales Invoice", nowdate())
+		self.assertEqual(after_cancel.transaction_count, before.transaction_count)
+		self.assertEqual(flt(after_cancel.transaction_amount), flt(before.transaction_amount))
+
+
+def get_summary(company, reference_doctype, transaction_date):
+	return frappe.db.get_value(
+		"Company Transaction Summary",
+		{
+			"company": company,
+			"reference_doctype": reference_doctype,
+			"transaction_date": getdate(transaction_date),
+		},
+		["transaction_count", "transaction_amount"],
+		as_dict=True,
+	) or frappe._dict(transaction_count=0, transaction_amount=0)
@@ -9,6 +9,8 @@ import frappe.desk.notifications
 from dateutil.relativedelta import relativedelta
 from frappe import _
 from frappe.core.doctype.user.user import STANDARD_USERS
+from frappe.query_builder import Case
+from frappe.query_builder.functions import Sum
 from frappe.utils import (
 	add_to_date,
 	flt,
@@ -18,11 +20,17 @@ from frappe.utils import (
 	get_link_to_report,
 	get_url_to_form,
 	get_url_to_list,
+	getdate,
 	now_datetime,
 	today,
 )
 
-from erpnext.accounts.utils import get_balance_on, get_count_on, get_fiscal_year
+from erpnext.accounts.utils import (
+	FiscalYearError,
+	get_balance_on,
+	get_count_on,
+	get_fiscal_year,
+)
 
 user_specific_content = ["calendar_events", "todo_list"]
 
@@ -118,9 +126,15 @@ class EmailDigest(Document):
 		]
 
 		if self.recipients:
+			# everything but the user specific content is the same for all recipients
+			context = self.get_common_context()
+
 			for row in self.recipients:
-				msg_for_this_recipient = self.get_msg_html()
-				if msg_for_this_recipient and row.recipient in valid_users:
+				if row.recipient not in valid_users:
+					continue
+
+				msg_for_this_recipient = self.get_msg_html(user_id=row.recipient, context=context)
+				if msg_for_this_recipient:
 					frappe.sendmail(
 						recipients=row.recipient,
 						subject=_("{0} Digest").format(_(self.frequency)),
@@ -130,11 +144,35 @@ class EmailDigest(Document):
 						unsubscribe_message=_("Unsubscribe from this Email Digest"),
 					)
 
-	def get_msg_html(self):
+	def get_msg_html(self, user_id=None, context=None):
 		"""Build email digest content"""
-		frappe.flags.ignore_account_permission = True
 		from erpnext.setup.doctype.email_digest.quotes import get_random_quote
 
+		if context is None:
+			context = self.get_common_context()
+
+		frappe.flags.ignore_account_permission = True
+
+		context = frappe._dict(context)
+		self.set_user_specific_content(context, user_id)
+
+		quote = get_random_quote()
+		context.quote = {"text": quote[0], "author": quote[1]}
+
+		if not context:
+			return None
+
+		frappe.flags.ignore_account_permission = False
+
+		# style
+		return frappe.render_template(
+			"erpnext/setup/doctype/email_digest/templates/default.html", context, is_path=True
+		)
+
+	def get_common_context(self):
+		"""Build the digest content that does not depend on the recipient"""
+		frappe.flags.ignore_account_permission = True
+
 		context = frappe._dict()
 		context.update(self.__dict__)
 
@@ -142,23 +180,14 @@ class EmailDigest(Document):
 		self.set_style(context)
 		self.set_accounting_cards(context)
 
-		if self.get("calendar_events"):
-			context.events, context.event_count = self.get_calendar_events()
-		if self.get("todo_list"):
-			context.todo_list = self.get_todo_list()
-			context.todo_count = self.get_todo_count()
 		if self.get("notifications"):
 			context.notifications = self.get_notifications()
 		if self.get("issue"):
-			context.issue_list = self.get_issue_list()
 			context.issue_count = self.get_issue_count()
 		if self.get("project"):
 			context.project_list = self.get_project_list()
 			context.project_count = self.get_project_count()
 
-		quote = get_random_quote()
-		context.quote = {"text": quote[0], "author": quote[1]}
-
 		if self.get("purchase_orders_items_overdue"):
 			(
 				context.purchase_order_list,
@@ -167,15 +196,18 @@ class EmailDigest(Document):
 			if not context.purchase_order_list:
 				frappe.throw(_("No items to be received are overdue"))
 
-		if not context:
-			return None
-
 		frappe.flags.ignore_account_permission = False
 
-		# style
-		return frappe.render_template(
-			"erpnext/setup/doctype/email_digest/templates/default.html", context, is_path=True
-		)
+		return context
+
+	def set_user_specific_content(self, context, user_id=None):
+		if self.get("calendar_events"):
+			context.events, context.event_count = self.get_calendar_events(user_id)
+		if self.get("todo_list"):
+			context.todo_list = self.get_todo_list(user_id)
+			context.todo_count = self.get_todo_count(user_id)
+		if self.get("issue"):
+			context.issue_list = self.get_issue_list(user_id)
 
 	def set_title(self, context):
 		"""Set digest title"""
@@ -217,13 +249,13 @@ class EmailDigest(Document):
 
 		return notifications
 
-	def get_calendar_events(self):
+	def get_calendar_events(self, user_id=None):
 		"""Get calendar events for given user"""
 		from frappe.desk.doctype.event.event import get_events
 
 		from_date, to_date = get_future_date_for_calendaer_event(self.frequency)
 
-		events = get_events(from_date, to_date)
+		events = get_events(from_date, to_date, user=user_id)
 
 		event_count = 0
 		for i, e in enumerate(events):
@@ -394,7 +426,7 @@ class EmailDigest(Document):
 
 	def get_income(self):
 		"""Get income for given period"""
-		income, past_income, count = self.get_period_amounts(self.get_roots("income"), "income")
+		income, past_income, count = self.get_period_amounts("income")
 
 		income_account = frappe.db.get_all(
 			"Account",
@@ -424,13 +456,16 @@ class EmailDigest(Document):
 
 	def get_year_to_date_balance(self, root_type, fieldname):
 		"""Get income to date"""
-		balance = 0.0
-		count = 0
 		fy_start_date = get_fiscal_year(self.future_to_date)[1]
 
-		for account in self.get_root_type_accounts(root_type):
-			balance += get_balance_on(account, date=self.future_to_date, start_date=fy_start_date)
-			count += get_count_on(account, fieldname, date=self.future_to_date)
+		totals = get_gl_totals_on(
+			self.company,
+			self.get_root_type_accounts(root_type),
+			[self.future_to_date],
+			start_date=fy_start_date,
+			count_for_fiscal_year=True,
+		)[getdate(self.future_to_date)]
+		balance, count = totals.balance_in_account_currency, totals.count
 
 		if fieldname == "income":
 			filters = {"currency": self.currency}
@@ -465,9 +500,7 @@ class EmailDigest(Document):
 		return self.get_type_balance("invoiced_amount", "Receivable")
 
 	def get_expenses_booked(self):
-		expenses, past_expenses, count = self.get_period_amounts(
-			self.get_roots("expense"), "expenses_booked"
-		)
+		expenses, past_expenses, count = self.get_period_amounts("expense")
 
 		expense_account = frappe.db.get_all(
 			"Account",
@@ -487,14 +520,31 @@ class EmailDigest(Document):
 		)
 		return {"label": label, "value": expenses, "last_value": past_expenses, "count": count}
 
-	def get_period_amounts(self, accounts, fieldname):
+	def get_period_amounts(self, root_type):
 		"""Get amounts for current and past periods"""
-		balance = past_balance = 0.0
-		count = 0
-		for account in accounts:
-			balance += get_incomes_expenses_for_period(account, self.future_from_date, self.future_to_date)
-			past_balance += get_incomes_expenses_for_period(account, self.past_from_date, self.past_to_date)
-			count += get_count_for_period(account, fieldname, self.future_from_date, self.future_to_date)
+		dates = get_period_boundaries(self.future_from_date, self.future_to_date)
+		dates += get_period_boundaries(self.past_from_date, self.past_to_date)
+
+		# balances of the whole root type are the balances of its root accounts
+		totals = get_gl_totals_on(
+			self.company, self.get_root_type_accounts(root_type), dates, count_for_fiscal_year=True
+		)
+
+		def balance_on(date):
+			return totals[getdate(date)].balance
+
+		def count_on(date):
+			return totals[getdate(date)].count
+
+		balance = get_incomes_expenses_for_period(
+			None, self.future_from_date, self.future_to_date, balance_on=balance_on
+		)
+		past_balance = get_incomes_expenses_for_period(
+			None, self.past_from_date, self.past_to_date, balance_on=balance_on
+		)
+		count = get_count_for_period(
+			None, None, self.future_from_date, self.future_to_date, count_on=count_on
+		)
 
 		return balance, past_balance, count
 
@@ -625,12 +675,9 @@ class EmailDigest(Document):
 				)
 			]
 
-		balance = prev_balance = 0.0
-		count = 0
-		for account in accounts:
-			balance += get_balance_on(account, date=self.future_to_date, in_account_currency=False)
-			count += get_count_on(account, fieldname, date=self.future_to_date)
-			prev_balance += get_balance_on(account, date=self.past_to_date, in_account_currency=False)
+		totals = get_gl_totals_on(self.company, accounts, [self.future_to_date, self.past_to_date])
+		balance = totals[getdate(self.future_to_date)].balance
+		prev_balance = totals[getdate(self.past_to_date)].balance
 
 		if fieldname in ("bank_balance", "credit_balance"):
 			label = ""
@@ -657,6 +704,10 @@ class EmailDigest(Document):
 
 			return {"label": label, "value": balance, "last_value": prev_balance}
 		else:
+			count = 0
+			for account in accounts:
+				count += get_count_on(account, fieldname, date=self.future_to_date)
+
 			if account_type == "Payable":
 				label = get_link_to_report(
 					"Accounts Payable",
@@ -674,20 +725,6 @@ class EmailDigest(Document):
 
 			return {"label": label, "value": balance, "last_value": prev_balance, "count": count}
 
-	def get_roots(self, root_type):
-		return [
-			d.name
-			for d in frappe.db.get_all(
-				"Account",
-				filters={
-					"root_type": root_type.title(),
-					"company": self.company,
-					"is_group": 1,
-					"parent_account": ["in", ("", None)],
-				},
-			)
-		]
-
 	def get_root_type_accounts(self, root_type):
 		if root_type not in self._accounts:
 			self._accounts[root_type] = [
@@ -939,12 +976,16 @@ def get_digest_msg(name):
 	return frappe.get_doc("Email Digest", name).get_msg_html()
 
 
-def get_incomes_expenses_for_period(account, from_date, to_date):
+def get_incomes_expenses_for_period(account, from_date, to_date, balance_on=None):
 	"""Get amounts for current and past periods"""
+	if not balance_on:
+
+		def balance_on(date):
+			return get_balance_on(account, date=date)
 
 	val = 0.0
-	balance_on_to_date = get_balance_on(account, date=to_date)
-	balance_before_from_date = get_balance_on(account, date=from_date - timedelta(days=1))
+	balance_on_to_date = balance_on(to_date)
+	balance_before_from_date = balance_on(from_date - timedelta(days=1))
 
 	fy_start_date = get_fiscal_year(to_date)[1]
 
@@ -953,16 +994,21 @@ def get_incomes_expenses_for_period(account, from_date, to_date):
 	elif from_date > fy_start_date:
 		val = balance_on_to_date - balance_before_from_date
 	else:
-		last_year_closing_balance = get_balance_on(account, date=fy_start_date - timedelta(days=1))
+		last_year_closing_balance = balance_on(fy_start_date - timedelta(days=1))
 		val = balance_on_to_date + (last_year_closing_balance - balance_before_from_date)
 
 	return val
 
 
-def get_count_for_period(account, fieldname, from_date, to_date):
+def get_count_for_period(account, fieldname, from_date, to_date, count_on=None):
+	if not count_on:
+
+		def count_on(date):
+			return get_count_on(account, fieldname, date)
+
 	count = 0.0
-	count_on_to_date = get_count_on(account, fieldname, to_date)
-	count_before_from_date = get_count_on(account, fieldname, from_date - timedelta(days=1))
+	count_on_to_date = count_on(to_date)
+	count_before_from_date = count_on(from_date - timedelta(days=1))
 
 	fy_start_date = get_fiscal_year(to_date)[1]
 	if from_date == fy_start_date:
@@ -970,12 +1016,81 @@ def get_count_for_period(account, fieldname, from_date, to_date):
 	elif from_date > fy_start_date:
 		count = count_on_to_date - count_before_from_date
 	else:
-		last_year_closing_count = get_count_on(account, fieldname, fy_start_date - timedelta(days=1))
+		last_year_closing_count = count_on(fy_start_date - timedelta(days=1))
 		count = count_on_to_date + (last_year_closing_count - count_before_from_date)
 
 	return count
 
 
+def get_period_boundaries(from_date, to_date):
+	"""Dates on which balances are needed by `get_incomes_expenses_for_period`"""
+	fy_start_date = get_fiscal_year(to_date)[1]
+	return [to_date, from_date - timedelta(days=1), fy_start_date - timedelta(days=1)]
+
+
+def get_gl_totals_on(company, accounts, dates, start_date=None, count_for_fiscal_year=False):
+	"""
+	Returns the total balance of the ledger `accounts` as on each of `dates`, from one
+	aggregate query on GL Entry instead of one `get_balance_on` per account and date.
+
+	With `count_for_fiscal_year`, the GL Entries counted for each date are the ones within
+	its fiscal year, like `get_count_on` does for Profit and Loss accounts.
+	"""
+	dates = sorted({getdate(date) for date in dates})
+	totals = {
+		date: frappe._dict(balance=0.0, balance_in_account_currency=0.0, count=0) for date in dates
+	}
+	if not accounts or not dates:
+		return totals
+
+	gle = frappe.qb.DocType("GL Entry")
+	fields = []
+	for idx, date in enumerate(dates):
+		on_date = gle.posting_date <= date
+		fields += [
+			Sum(Case().when(on_date, gle.debit - gle.credit).else_(0)).as_(f"balance_{idx}"),
+			Sum(
+				Case()
+				.when(on_date, gle.debit_in_account_currency - gle.credit_in_account_currency)
+				.else_(0)
+			).as_(f"balance_in_account_currency_{idx}"),
+		]
+
+		if count_for_fiscal_year:
+			try:
+				year_start_date = get_fiscal_year(date, company=company, verbose=0)[1]
+			except FiscalYearError:
+				continue
+
+			in_fiscal_year = (
+				on_date
+				& (gle.posting_date >= year_start_date)
+				& (gle.voucher_type != "Period Closing Voucher")
+			)
+			fields.append(Sum(Case().when(in_fiscal_year, 1).else_(0)).as_(f"count_{idx}"))
+
+	query = (
+		frappe.qb.from_(gle)
+		.select(*fields)
+		.where(
+			(gle.company == company)
+			& (gle.is_cancelled == 0)
+			& (gle.account.isin(accounts))
+			& (gle.posting_date <= dates[-1])
+		)
+	)
+	if start_date:
+		query = query.where(gle.posting_date >= start_date)
+
+	result = query.run(as_dict=True)[0]
+	for idx, date in enumerate(dates):
+		totals[date].balance = flt(result.get(f"balance_{idx}"))
+		totals[date].balance_in_account_currency = flt(result.get(f"balance_in_account_currency_{idx}"))
+		totals[date].count = int(flt(result.get(f"count_{idx}")))
+
+	return totals
+
+
 def get_future_date_for_calendaer_event(frequency):
 	from_date = to_date = today()
 
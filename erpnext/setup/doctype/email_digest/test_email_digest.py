@@ -1,10 +1,134 @@
 # Copyright (c) 2015, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 
-import unittest
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_months, getdate, nowdate
+
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+from erpnext.accounts.utils import get_balance_on, get_count_on, get_fiscal_year
+from erpnext.setup.doctype.email_digest.email_digest import (
+	get_count_for_period,
+	get_gl_totals_on,
+	get_incomes_expenses_for_period,
+	get_period_boundaries,
+)
 
 # test_records = frappe.get_test_records('Email Digest')
 
 
-class TestEmailDigest(unittest.TestCase):
-	pass
+class TestEmailDigest(FrappeTestCase):
+	def setUp(self):
+		self.company = "_Test Company"
+		self.to_date = getdate(nowdate())
+
+		for months in (-14, -1, 0):
+			posting_date = add_months(self.to_date, months)
+			make_journal_entry(
+				"_Test Bank - _TC", "Sales - _TC", 500, posting_date=posting_date, submit=True
+			)
+			make_journal_entry(
+				"_Test Account Cost for Goods Sold - _TC",
+				"_Test Bank - _TC",
+				200,
+				posting_date=posting_date,
+				submit=True,
+			)
+		create_sales_invoice(rate=300)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def get_accounts(self, **filters):
+		return frappe.get_all(
+			"Account", filters={"company": self.company, "is_group": 0, **filters}, pluck="name"
+		)
+
+	def get_roots(self, root_type):
+		return frappe.get_all(
+			"Account",
+			filters={
+				"company": self.company,
+				"root_type": root_type,
+				"is_group": 1,
+				"parent_account": ["in", ("", None)],
+			},
+			pluck="name",
+		)
+
+	def test_period_totals_match_balance_and_count(self):
+		for root_type, fieldname in (("Income", "income"), ("Expense", "expenses_booked")):
+			roots = self.get_roots(root_type)
+
+			# a period within the fiscal year and one going back into the previous year
+			for from_date in (add_months(self.to_date, -1), add_months(self.to_date, -14)):
+				from_date = getdate(from_date)
+				totals = get_gl_totals_on(
+					self.company,
+					self.get_accounts(root_type=root_type),
+					get_period_boundaries(from_date, self.to_date),
+					count_for_fiscal_year=True,
+				)
+
+				def balance_on(date):
+					return totals[getdate(date)].balance
+
+				def count_on(date):
+					return totals[getdate(date)].count
+
+				self.assertAlmostEqual(
+					get_incomes_expenses_for_period(None, from_date, self.to_date, balance_on=balance_on),
+					sum(get_incomes_expenses_for_period(root, from_date, self.to_date) for root in roots),
+				)
+				self.assertEqual(
+					get_count_for_period(None, None, from_date, self.to_date, count_on=count_on),
+					sum(
+						get_count_for_period(root, fieldname, from_date, self.to_date) for root in roots
+					),
+				)
+
+	def test_fiscal_year_totals_match_balance_and_count(self):
+		fy_start_date = get_fiscal_year(self.to_date)[1]
+
+		for root_type, fieldname in (("Income", "income"), ("Expense", "expenses_booked")):
+			accounts = self.get_accounts(root_type=root_type)
+			totals = get_gl_totals_on(
+				self.company,
+				accounts,
+				[self.to_date],
+				start_date=fy_start_date,
+				count_for_fiscal_year=True,
+			)[self.to_date]
+
+			self.assertAlmostEqual(
+				totals.balance_in_account_currency,
+				sum(
+					get_balance_on(account, date=self.to_date, start_date=fy_start_date)
+					for account in accounts
+				),
+			)
+			self.assertEqual(
+				totals.count,
+				sum(get_count_on(account, fieldname, date=self.to_date) for account in accounts),
+			)
+
+	def test_type_balances_match_balance(self):
+		dates = [add_months(self.to_date, -1), self.to_date]
+
+		for filters in (
+			{"account_type": "Bank", "root_type": "Asset"},
+			{"account_type": "Receivable"},
+			{"account_type": "Payable"},
+		):
+			accounts = self.get_accounts(**filters)
+			totals = get_gl_totals_on(self.company, accounts, dates)
+
+			for date in dates:
+				self.assertAlmostEqual(
+					totals[getdate(date)].balance,
+					sum(
+						get_balance_on(account, date=date, in_account_currency=False)
+						for account in accounts
+					),
+				)
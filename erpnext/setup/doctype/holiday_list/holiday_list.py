@@ -44,6 +44,14 @@ class HolidayList(Document):
 		self.total_holidays = len(self.holidays)
 		self.validate_dupliacte_date()
 
+	def clear_cache(self):
+		from erpnext.support.doctype.service_level_agreement.service_level_agreement import (
+			get_working_calendar,
+		)
+
+		get_working_calendar.clear_cache()
+		return super().clear_cache()
+
 	@frappe.whitelist()
 	def get_weekly_off_dates(self):
 		if not self.weekly_off:
@@ -0,0 +1,239 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder import Order
+from frappe.query_builder.functions import CombineDatetime
+from frappe.utils import cint, flt, getdate, now
+
+MOVEMENT_FIELDS = (
+	"in_qty",
+	"in_value",
+	"out_qty",
+	"out_value",
+	"opening_qty",
+	"opening_value",
+	"qty_change",
+	"value_change",
+)
+CLOSING_FIELDS = ("qty_after_transaction", "stock_value", "valuation_rate")
+
+
+class DailyStockMovement(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		company: DF.Link | None
+		in_qty: DF.Float
+		in_value: DF.Currency
+		item_code: DF.Link | None
+		opening_qty: DF.Float
+		opening_value: DF.Currency
+		out_qty: DF.Float
+		out_value: DF.Currency
+		posting_date: DF.Date | None
+		qty_after_transaction: DF.Float
+		qty_change: DF.Float
+		stock_value: DF.Currency
+		valuation_rate: DF.Currency
+		value_change: DF.Currency
+		warehouse: DF.Link | None
+	# end: auto-generated types
+
+	pass
+
+
+def is_daily_stock_movement_enabled():
+	return cint(frappe.db.get_single_value("Stock Settings", "maintain_daily_stock_movement"))
+
+
+def update_daily_stock_movement(item_code, warehouse, from_date=None):
+	"""Rebuild the daily movement of an item and warehouse from `from_date` onwards,
+	to be called after its stock ledger entries are posted, cancelled or reposted."""
+
+	if not is_daily_stock_movement_enabled():
+		return
+
+	from_date = getdate(from_date) if from_date else None
+
+	movement = frappe.qb.DocType("Daily Stock Movement")
+	delete_query = (
+		frappe.qb.from_(movement)
+		.delete()
+		.where((movement.item_code == item_code) & (movement.warehouse == warehouse))
+	)
+	if from_date:
+		delete_query = delete_query.where(movement.posting_date >= from_date)
+	delete_query.run()
+
+	previous_qty = 0.0
+	if from_date:
+		previous_qty = flt(
+			frappe.db.get_value(
+				"Daily Stock Movement",
+				{"item_code": item_code, "warehouse": warehouse, "posting_date": ("<", from_date)},
+				"qty_after_transaction",
+				order_by="posting_date desc",
+			)
+		)
+
+	entries = get_stock_ledger_entries(item_code, warehouse, from_date)
+	insert_daily_stock_movement(get_daily_movement(entries, previous_qty))
+
+
+def get_stock_ledger_entries(item_code, warehouse, from_date=None):
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	query = (
+		frappe.qb.from_(sle)
+		.select(
+			sle.company,
+			sle.item_code,
+			sle.warehouse,
+			sle.posting_date,
+			sle.voucher_type,
+			sle.voucher_no,
+			sle.actual_qty,
+			sle.qty_after_transaction,
+			sle.stock_value,
+			sle.stock_value_difference,
+			sle.valuation_rate,
+			sle.batch_no,
+			sle.serial_no,
+		)
+		.where(
+			(sle.item_code == item_code) & (sle.warehouse == warehouse) & (sle.is_cancelled == 0)
+		)
+		.orderby(CombineDatetime(sle.posting_date, sle.posting_time))
+		.orderby(sle.creation)
+		.orderby(sle.actual_qty)
+	)
+
+	if from_date:
+		query = query.where(sle.posting_date >= from_date)
+
+	return query.run(as_dict=True)
+
+
+def get_daily_movement(entries, previous_qty=0.0):
+	"""Aggregate stock ledger entries, in posting order, into one movement row per
+	company, item, warehouse and day, the way the Stock Balance report buckets them."""
+
+	opening_vouchers = get_opening_vouchers(entries)
+	precision = cint(frappe.db.get_default("float_precision")) or 3
+
+	movement = {}
+	balance_qty = {}
+	for entry in entries:
+		key = (entry.company, entry.item_code, entry.warehouse)
+		balance_qty.setdefault(key, previous_qty)
+
+		if entry.voucher_type == "Stock Reconciliation" and (not entry.batch_no or entry.serial_no):
+			qty_diff = flt(entry.qty_after_transaction) - balance_qty[key]
+		else:
+			qty_diff = flt(entry.actual_qty)
+
+		value_diff = flt(entry.stock_value_difference)
+		balance_qty[key] += qty_diff
+
+		row = movement.get(key + (entry.posting_date,))
+		if not row:
+			row = movement[key + (entry.posting_date,)] = frappe._dict(
+				dict.fromkeys(MOVEMENT_FIELDS, 0.0),
+				company=entry.company,
+				item_code=entry.item_code,
+				warehouse=entry.warehouse,
+				posting_date=entry.posting_date,
+			)
+
+		if (entry.voucher_type, entry.voucher_no) in opening_vouchers:
+			row.opening_qty += qty_diff
+			row.opening_value += value_diff
+		elif flt(qty_diff, precision) >= 0:
+			row.in_qty += qty_diff
+			row.in_value += value_diff
+		else:
+			row.out_qty += abs(qty_diff)
+			row.out_value += abs(value_diff)
+
+		row.qty_change += qty_diff
+		row.value_change += value_diff
+		row.qty_after_transaction = balance_qty[key]
+		row.stock_value = flt(entry.stock_value)
+		row.valuation_rate = flt(entry.valuation_rate)
+
+	return list(movement.values())
+
+
+def get_opening_vouchers(entries):
+	vouchers = {}
+	for entry in entries:
+		if entry.voucher_type in ("Stock Entry", "Stock Reconciliation"):
+			vouchers.setdefault(entry.voucher_type, set()).add(entry.voucher_no)
+
+	opening_vouchers = set()
+	for voucher_type, voucher_nos in vouchers.items():
+		filters = {"name": ("in", list(voucher_nos)), "docstatus": 1}
+		if voucher_type == "Stock Entry":
+			filters["is_opening"] = "Yes"
+		else:
+			filters["purpose"] = "Opening Stock"
+
+		for name in frappe.get_all(voucher_type, filters=filters, pluck="name"):
+			opening_vouchers.add((voucher_type, name))
+
+	return opening_vouchers
+
+
+def insert_daily_stock_movement(rows):
+	if not rows:
+		return
+
+	fields = ["name", "creation", "modified", "owner", "modified_by"]
+	fields += ["company", "item_code", "warehouse", "posting_date"]
+	fields += list(MOVEMENT_FIELDS) + list(CLOSING_FIELDS)
+
+	timestamp = now()
+	user = frappe.session.user
+	values = []
+	for row in rows:
+		values.append(
+			[frappe.generate_hash(length=10), timestamp, timestamp, user, user]
+			+ [row.company, row.item_code, row.warehouse, row.posting_date]
+			+ [flt(row.get(field)) for field in MOVEMENT_FIELDS + CLOSING_FIELDS]
+		)
+
+	frappe.db.bulk_insert("Daily Stock Movement", fields=fields, values=values)
+
+
+def rebuild_daily_stock_movement():
+	"""Rebuild the daily movement of all items and warehouses from the stock ledger"""
+
+	frappe.db.delete("Daily Stock Movement")
+
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	item_warehouses = (
+		frappe.qb.from_(sle)
+		.select(sle.item_code, sle.warehouse)
+		.distinct()
+		.where(sle.is_cancelled == 0)
+		.orderby(sle.item_code, order=Order.asc)
+		.run(as_dict=True)
+	)
+
+	for idx, row in enumerate(item_warehouses, start=1):
+		entries = get_stock_ledger_entries(row.item_code, row.warehouse)
+		insert_daily_stock_movement(get_daily_movement(entries))
+
+		if idx % 1000 == 0:
+			frappe.db.commit()
+
+
+def on_doctype_update():
+	frappe.db.add_index("Daily Stock Movement", ["item_code", "warehouse", "posting_date"])
+	frappe.db.add_index("Daily Stock Movement", ["company", "posting_date"])
@@ -0,0 +1,92 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe import _dict
+from frappe.tests.utils import FrappeTestCase, change_settings
+from frappe.utils import add_days, today
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.stock.report.stock_analytics.stock_analytics import execute as stock_analytics
+from erpnext.stock.report.stock_balance.stock_balance import execute as stock_balance
+
+
+class TestDailyStockMovement(FrappeTestCase):
+	def setUp(self):
+		self.item = make_item().name
+		self.warehouse = "_Test Warehouse - _TC"
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def make_movements(self):
+		for qty, rate, days in ((10, 100, -40), (5, 120, -10)):
+			make_stock_entry(
+				item_code=self.item,
+				to_warehouse=self.warehouse,
+				qty=qty,
+				rate=rate,
+				posting_date=add_days(today(), days),
+			)
+
+		make_stock_entry(
+			item_code=self.item, from_warehouse=self.warehouse, qty=7, posting_date=add_days(today(), -5)
+		)
+
+		make_stock_entry(
+			item_code=self.item,
+			to_warehouse=self.warehouse,
+			qty=3,
+			rate=90,
+			posting_date=add_days(today(), -5),
+		).cancel()
+
+	def get_report_data(self):
+		balance_filters = _dict(
+			company="_Test Company",
+			item_code=self.item,
+			from_date=add_days(today(), -20),
+			to_date=today(),
+		)
+		analytics_filters = _dict(
+			company="_Test Company",
+			item_code=self.item,
+			from_date=add_days(today(), -60),
+			to_date=today(),
+			range="Weekly",
+			value_quantity="Quantity",
+		)
+
+		return stock_balance(balance_filters)[1], stock_analytics(analytics_filters)[1]
+
+	def test_reports_match_stock_ledger(self):
+		self.make_movements()
+		from_ledger = self.get_report_data()
+
+		with change_settings("Stock Settings", {"maintain_daily_stock_movement": 1}):
+			self.assertTrue(frappe.db.exists("Daily Stock Movement", {"item_code": self.item}))
+			from_movement = self.get_report_data()
+
+		self.assertEqual(len(from_ledger[0]), len(from_movement[0]))
+		for expected, actual in zip(from_ledger[0], from_movement[0]):
+			for field in ("opening_qty", "in_qty", "out_qty", "bal_qty", "bal_val", "val_rate"):
+				self.assertAlmostEqual(expected[field], actual[field], 3, msg=field)
+
+		self.assertEqual(from_ledger[1], from_movement[1])
+
+	def test_movement_follows_ledger(self):
+		with change_settings("Stock Settings", {"maintain_daily_stock_movement": 1}):
+			self.make_movements()
+
+			rows = frappe.get_all(
+				"Daily Stock Movement",
+				filters={"item_code": self.item, "warehouse": self.warehouse},
+				fields=["posting_date", "in_qty", "out_qty", "qty_change", "qty_after_transaction"],
+				order_by="posting_date",
+			)
+
+		self.assertEqual([row.qty_change for row in rows], [10, 5, -7])
+		self.assertEqual([row.in_qty for row in rows], [10, 5, 0])
+		self.assertEqual(rows[-1].out_qty, 7)
+		self.assertEqual(rows[-1].qty_after_transaction, 8)
@@ -327,20 +327,16 @@ class PickList(Document):
 		self.remove_serial_and_batch_bundle()
 		self.delete_key("locations")
 		updated_locations = frappe._dict()
-		for item_doc in items:
-			item_code = item_doc.item_code
-
-			self.item_location_map.setdefault(
-				item_code,
-				get_available_item_locations(
-					item_code,
-					from_warehouses,
-					self.item_count_map.get(item_code),
-					self.company,
-					picked_item_details=picked_items_details.get(item_code),
-				),
+		self.item_location_map.update(
+			get_available_item_locations_for_items(
+				self.item_count_map,
+				from_warehouses,
+				self.company,
+				picked_items_details=picked_items_details,
 			)
+		)
 
+		for item_doc in items:
 			locations = get_items_with_location_and_quantity(
 				item_doc, self.item_location_map, self.docstatus
 			)
@@ -615,7 +611,7 @@ def validate_item_locations(pick_list):
 
 
 def get_items_with_location_and_quantity(item_doc, item_location_map, docstatus):
-	available_locations = item_location_map.get(item_doc.item_code)
+	available_locations = list(item_location_map.get(item_doc.item_code) or [])
 	locations = []
 
 	# if stock qty is zero on submitted entry, show positive remaining qty to recalculate in case of restock.
@@ -623,20 +619,24 @@ def get_items_with_location_and_quantity(item_doc, item_location_map, docstatus)
 		item_doc.qty if (docstatus == 1 and item_doc.stock_qty == 0) else item_doc.stock_qty
 	)
 
-	while flt(remaining_stock_qty) > 0 and available_locations:
-		item_location = available_locations.pop(0)
-		item_location = frappe._dict(item_location)
+	uom_must_be_whole_number = frappe.get_cached_value("UOM", item_doc.uom, "must_be_whole_number")
+
+	# walk the locations with a cursor instead of popping from the head of the list,
+	# which is quadratic for items stocked in many warehouses
+	index = 0
+	while flt(remaining_stock_qty) > 0 and index < len(available_locations):
+		item_location = frappe._dict(available_locations[index])
 
 		stock_qty = (
 			remaining_stock_qty if item_location.qty >= remaining_stock_qty else item_location.qty
 		)
 		qty = stock_qty / (item_doc.conversion_factor or 1)
 
-		uom_must_be_whole_number = frappe.get_cached_value("UOM", item_doc.uom, "must_be_whole_number")
 		if uom_must_be_whole_number:
 			qty = floor(qty)
 			stock_qty = qty * item_doc.conversion_factor
 			if not stock_qty:
+				index += 1
 				break
 
 		locations.append(
@@ -653,19 +653,95 @@ def get_items_with_location_and_quantity(item_doc, item_location_map, docstatus)
 		remaining_stock_qty -= stock_qty
 
 		qty_diff = item_location.qty - stock_qty
-		# if extra quantity is available push current warehouse to available locations
+		# if extra quantity is available keep current warehouse in available locations
 		if qty_diff > 0:
 			item_location.qty = qty_diff
 			if item_location.serial_no:
 				# set remaining serial numbers
 				item_location.serial_no = item_location.serial_no[-int(qty_diff) :]
-			available_locations = [item_location] + available_locations
+			available_locations[index] = item_location
+		else:
+			index += 1
 
 	# update available locations for the item
-	item_location_map[item_doc.item_code] = available_locations
+	item_location_map[item_doc.item_code] = available_locations[index:]
 	return locations
 
 
+def get_available_item_locations_for_items(
+	item_count_map,
+	from_warehouses,
+	company,
+	ignore_validation=False,
+	picked_items_details=None,
+):
+	"""Returns available locations of all the items in `item_count_map` (item code: required qty).
+
+	Items without serial or batch numbers are served by a single Bin query for the whole
+	pick list, serialized and batched items fall back to the per item lookups."""
+
+	item_locations_map = {}
+	if not item_count_map:
+		return item_locations_map
+
+	picked_items_details = picked_items_details or {}
+	item_details = get_item_serial_batch_details(list(item_count_map))
+
+	other_items = frappe._dict()
+	for item_code, required_qty in item_count_map.items():
+		details = item_details.get(item_code) or frappe._dict()
+		if details.has_serial_no or details.has_batch_no:
+			item_locations_map[item_code] = get_available_item_locations(
+				item_code,
+				from_warehouses,
+				required_qty,
+				company,
+				ignore_validation=ignore_validation,
+				picked_item_details=picked_items_details.get(item_code),
+			)
+		else:
+			other_items[item_code] = cint(
+				required_qty + get_total_picked_qty(picked_items_details.get(item_code))
+			)
+
+	if other_items:
+		bin_locations = get_available_item_locations_for_other_items(
+			other_items, from_warehouses, company
+		)
+
+		for item_code, required_qty in item_count_map.items():
+			if item_code not in other_items:
+				continue
+
+			item_locations_map[item_code] = validate_available_item_locations(
+				item_code,
+				bin_locations.get(item_code, []),
+				required_qty,
+				ignore_validation=ignore_validation,
+				picked_item_details=picked_items_details.get(item_code),
+			)
+
+	return item_locations_map
+
+
+def get_item_serial_batch_details(item_codes):
+	return {
+		d.name: d
+		for d in frappe.get_all(
+			"Item",
+			filters={"name": ("in", item_codes)},
+			fields=["name", "has_serial_no", "has_batch_no"],
+		)
+	}
+
+
+def get_total_picked_qty(picked_item_details):
+	if not picked_item_details:
+		return 0
+
+	return sum([v.get("picked_qty") for k, v in picked_item_details.items()])
+
+
 def get_available_item_locations(
 	item_code,
 	from_warehouses,
@@ -675,9 +751,7 @@ def get_available_item_locations(
 	picked_item_details=None,
 ):
 	locations = []
-	total_picked_qty = (
-		sum([v.get("picked_qty") for k, v in picked_item_details.items()]) if picked_item_details else 0
-	)
+	total_picked_qty = get_total_picked_qty(picked_item_details)
 	has_serial_no = frappe.get_cached_value("Item", item_code, "has_serial_no")
 	has_batch_no = frappe.get_cached_value("Item", item_code, "has_batch_no")
 
@@ -694,6 +768,18 @@ def get_available_item_locations(
 			item_code, from_warehouses, required_qty, company, total_picked_qty
 		)
 
+	return validate_available_item_locations(
+		item_code,
+		locations,
+		required_qty,
+		ignore_validation=ignore_validation,
+		picked_item_details=picked_item_details,
+	)
+
+
+def validate_available_item_locations(
+	item_code, locations, required_qty, ignore_validation=False, picked_item_details=None
+):
 	total_qty_available = sum(location.get("qty") for location in locations)
 	remaining_qty = required_qty - total_qty_available
 
@@ -858,6 +944,36 @@ def get_available_item_locations_for_other_item(
 	return item_locations
 
 
+def get_available_item_locations_for_other_items(item_limit_map, from_warehouses, company):
+	"""Bulk version of `get_available_item_locations_for_other_item`.
+
+	`item_limit_map` maps item code to the number of Bin rows to consider for the item."""
+
+	bin = frappe.qb.DocType("Bin")
+	query = (
+		frappe.qb.from_(bin)
+		.select(bin.item_code, bin.warehouse, bin.actual_qty.as_("qty"))
+		.where((bin.item_code.isin(list(item_limit_map))) & (bin.actual_qty > 0))
+		.orderby(bin.creation)
+	)
+
+	if from_warehouses:
+		query = query.where(bin.warehouse.isin(from_warehouses))
+	else:
+		wh = frappe.qb.DocType("Warehouse")
+		query = query.from_(wh).where((bin.warehouse == wh.name) & (wh.company == company))
+
+	item_locations = defaultdict(list)
+	for row in query.run(as_dict=True):
+		if len(item_locations[row.item_code]) >= item_limit_map[row.item_code]:
+			continue
+
+		item_code = row.pop("item_code")
+		item_locations[item_code].append(row)
+
+	return item_locations
+
+
 @frappe.whitelist()
 def create_delivery_note(source_name, target_doc=None):
 	pick_list = frappe.get_doc("Pick List", source_name)
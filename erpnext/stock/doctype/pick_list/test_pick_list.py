@@ -9,7 +9,11 @@ from erpnext.selling.doctype.sales_order.sales_order import create_pick_list
 from erpnext.selling.doctype.sales_order.test_sales_order import make_sales_order
 from erpnext.stock.doctype.item.test_item import create_item, make_item
 from erpnext.stock.doctype.packed_item.test_packed_item import create_product_bundle
-from erpnext.stock.doctype.pick_list.pick_list import create_delivery_note
+from erpnext.stock.doctype.pick_list.pick_list import (
+	create_delivery_note,
+	get_available_item_locations,
+	get_available_item_locations_for_items,
+)
 from erpnext.stock.doctype.purchase_receipt.test_purchase_receipt import make_purchase_receipt
 from erpnext.stock.doctype.serial_and_batch_bundle.test_serial_and_batch_bundle import (
 	get_batch_from_bundle,
@@ -853,3 +857,49 @@ class TestPickList(FrappeTestCase):
 		pl.cancel()
 		pl.reload()
 		self.assertEqual(pl.status, "Cancelled")
+
+	def test_bulk_item_locations_for_large_pick_list(self):
+		warehouses = ["_Test Warehouse - _TC", "_Test Warehouse 1 - _TC"]
+		item_count_map = {}
+		for idx in range(50):
+			item = make_item(properties={"is_stock_item": 1}).name
+			make_stock_entry(item=item, to_warehouse=warehouses[0], qty=5 + idx, basic_rate=10)
+			make_stock_entry(item=item, to_warehouse=warehouses[1], qty=20, basic_rate=10)
+			item_count_map[item] = 10 + idx
+
+		bulk_locations = get_available_item_locations_for_items(
+			item_count_map, warehouses, "_Test Company", ignore_validation=True
+		)
+
+		for item, required_qty in item_count_map.items():
+			self.assertEqual(
+				bulk_locations[item],
+				get_available_item_locations(
+					item, warehouses, required_qty, "_Test Company", ignore_validation=True
+				),
+			)
+
+		# one query for item details and one for the bins of all the items
+		with self.assertQueryCount(2):
+			get_available_item_locations_for_items(
+				item_count_map, warehouses, "_Test Company", ignore_validation=True
+			)
+
+		pick_list = frappe.get_doc(
+			{
+				"doctype": "Pick List",
+				"company": "_Test Company",
+				"purpose": "Material Transfer",
+				"locations": [
+					{"item_code": item, "qty": qty, "stock_qty": qty, "conversion_factor": 1}
+					for item, qty in item_count_map.items()
+				],
+			}
+		)
+		pick_list.set_item_locations()
+
+		picked_qty = {}
+		for row in pick_list.locations:
+			picked_qty[row.item_code] = picked_qty.get(row.item_code, 0) + row.stock_qty
+
+		self.assertEqual(picked_qty, item_count_map)
@@ -11,7 +11,7 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import cint, cstr, floor, flt, nowdate
 
-from erpnext.stock.utils import get_stock_balance
+from erpnext.stock.utils import get_stock_balance, get_stock_balances
 
 
 class PutawayRule(Document):
@@ -245,8 +245,9 @@ def get_ordered_putaway_rules(item_code, company, source_warehouse=None):
 		return False, None
 
 	vacant_rules = []
+	stock_balances = get_stock_balances([(rule.item_code, rule.warehouse) for rule in rules], nowdate())
 	for rule in rules:
-		balance_qty = get_stock_balance(rule.item_code, rule.warehouse, nowdate())
+		balance_qty = stock_balances[(rule.item_code, rule.warehouse)].qty
 		free_space = flt(rule.stock_capacity) - flt(balance_qty)
 		if free_space > 0:
 			rule["free_space"] = free_space
@@ -58,7 +58,6 @@ frappe.ui.form.on('Repost Item Valuation', {
 
 			if (frm.doc.status == 'In Progress') {
 				frm.doc.current_index = data.current_index;
-				frm.doc.items_to_be_repost = data.items_to_be_repost;
 				frm.doc.total_reposting_count = data.total_reposting_count;
 
 				frm.dashboard.reset();
@@ -16,6 +16,7 @@ import erpnext
 from erpnext.accounts.general_ledger import validate_accounting_period
 from erpnext.accounts.utils import get_future_stock_vouchers, repost_gle_for_stock_vouchers
 from erpnext.stock.stock_ledger import (
+	clear_reposting_log,
 	get_affected_transactions,
 	get_items_to_be_repost,
 	repost_future_sle,
@@ -60,13 +61,18 @@ class RepostItemValuation(Document):
 	def clear_old_logs(days=None):
 		days = days or 90
 		table = DocType("Repost Item Valuation")
+		log = DocType("Reposting Log Entry")
+		filters = (table.modified < (Now() - Interval(days=days))) & (
+			table.status.isin(["Completed", "Skipped"])
+		)
+
 		frappe.db.delete(
-			table,
-			filters=(
-				(table.modified < (Now() - Interval(days=days)))
-				& (table.status.isin(["Completed", "Skipped"]))
+			log,
+			filters=log.repost_item_valuation.isin(
+				frappe.qb.from_(table).select(table.name).where(filters)
 			),
 		)
+		frappe.db.delete(table, filters=filters)
 
 	def validate(self):
 		self.validate_period_closing_voucher()
@@ -190,6 +196,8 @@ class RepostItemValuation(Document):
 		if self.reposting_data_file:
 			self.db_set("reposting_data_file", None)
 
+		clear_reposting_log(self.name)
+
 	def on_submit(self):
 		"""During tests reposts are executed immediately.
 
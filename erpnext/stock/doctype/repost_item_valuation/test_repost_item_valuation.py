@@ -223,6 +223,98 @@ class TestRepostItemValuation(FrappeTestCase, StockTestMixin):
 			sorted(frappe.parse_json(frappe.as_json(set([("a", "b"), ("c", "d")])))),
 		)
 
+	def test_reposting_log_replay(self):
+		from erpnext.stock import stock_ledger
+		from erpnext.stock.stock_ledger import (
+			get_affected_transactions,
+			get_distinct_item_warehouse,
+			get_items_to_be_repost,
+			get_reposting_data,
+			update_args_in_repost_item_valuation,
+		)
+
+		riv = frappe.get_doc(
+			doctype="Repost Item Valuation",
+			based_on="Item and Warehouse",
+			item_code="_Test Item",
+			warehouse="_Test Warehouse - _TC",
+			company="_Test Company",
+			posting_date=today(),
+		).insert()
+		riv.db_set = MagicMock()
+
+		sle = frappe._dict(
+			item_code="_Test Item",
+			warehouse="_Test Warehouse - _TC",
+			posting_date=today(),
+			posting_time="00:00:00",
+		)
+		args = [sle]
+		distinct_item_warehouses = {
+			("_Test Item", "_Test Warehouse - _TC"): frappe._dict(
+				{"reposting_status": False, "sle": sle, "args_idx": 0}
+			)
+		}
+		affected_transactions = set()
+		update_args_in_repost_item_valuation(
+			riv, 0, args, distinct_item_warehouses, affected_transactions
+		)
+
+		def repost_next(index):
+			new_sle = frappe._dict(sle, item_code=f"_Test Item {index}")
+			key = (new_sle.item_code, new_sle.warehouse)
+			distinct_item_warehouses[key] = frappe._dict(
+				{"reposting_status": False, "sle": new_sle, "args_idx": len(args)}
+			)
+			args.append(new_sle)
+
+			new_transactions = {("Stock Entry", f"SE-{index}")}
+			affected_transactions.update(new_transactions)
+
+			changes = frappe._dict(
+				{
+					"args_idx": {len(args) - 1},
+					"item_warehouses": {key},
+					"affected_transactions": new_transactions,
+				}
+			)
+			update_args_in_repost_item_valuation(
+				riv, index, args, distinct_item_warehouses, affected_transactions, changes=changes
+			)
+
+		def assert_replayed(log_entries):
+			self.assertEqual(
+				frappe.db.count("Reposting Log Entry", {"repost_item_valuation": riv.name}), log_entries
+			)
+
+			reposting_data = get_reposting_data(riv.reposting_data_file)
+			self.assertEqual(get_items_to_be_repost(doc=riv, reposting_data=reposting_data), args)
+			self.assertEqual(
+				get_distinct_item_warehouse(doc=riv, reposting_data=reposting_data),
+				distinct_item_warehouses,
+			)
+			self.assertEqual(
+				get_affected_transactions(riv, reposting_data=reposting_data), affected_transactions
+			)
+
+		# only the changes are logged
+		repost_next(1)
+		repost_next(2)
+		assert_replayed(2)
+
+		# the log is compacted into a snapshot
+		orig_interval = stock_ledger.REPOSTING_LOG_COMPACTION_INTERVAL
+		stock_ledger.REPOSTING_LOG_COMPACTION_INTERVAL = 2
+		self.addCleanup(setattr, stock_ledger, "REPOSTING_LOG_COMPACTION_INTERVAL", orig_interval)
+		repost_next(3)
+		assert_replayed(0)
+
+		repost_next(4)
+		assert_replayed(1)
+
+		riv.clear_attachment()
+		self.assertFalse(frappe.db.exists("Reposting Log Entry", {"repost_item_valuation": riv.name}))
+
 	def test_gl_repost_progress(self):
 		from erpnext.accounts import utils
 
@@ -1272,6 +1272,95 @@ class TestStockLedgerEntry(FrappeTestCase, StockTestMixin):
 			item_code=item_code, source=warehouse, qty=470.84, rate=100, posting_date=add_days(today(), -1)
 		)
 
+	def test_bulk_sl_entries(self):
+		"SL entries made in bulk should match the ones made one by one."
+		from unittest.mock import patch
+
+		from erpnext.stock.stock_ledger import make_sl_entries_in_bulk
+
+		warehouse = "_Test Warehouse - _TC"
+		posting_date = add_days(today(), -1)
+
+		def make_entries(item_code):
+			make_stock_entry(
+				item_code=item_code, target=warehouse, qty=10, rate=100, posting_date=add_days(today(), -2)
+			)
+			# future entry for the backdated vouchers below
+			make_stock_entry(item_code=item_code, source=warehouse, qty=3)
+
+			receipt = make_stock_entry(
+				item_code=item_code,
+				target=warehouse,
+				qty=1,
+				rate=100,
+				posting_date=posting_date,
+				do_not_submit=True,
+			)
+			for qty in (2, 3, 4):
+				receipt.append(
+					"items",
+					{
+						"item_code": item_code,
+						"t_warehouse": warehouse,
+						"qty": qty,
+						"basic_rate": 100 + qty * 10,
+						"conversion_factor": 1.0,
+						"transfer_qty": qty,
+					},
+				)
+			receipt.submit()
+
+			issue = make_stock_entry(
+				item_code=item_code, source=warehouse, qty=1, posting_date=posting_date, do_not_submit=True
+			)
+			for qty in (2, 3):
+				issue.append(
+					"items",
+					{
+						"item_code": item_code,
+						"s_warehouse": warehouse,
+						"qty": qty,
+						"conversion_factor": 1.0,
+						"transfer_qty": qty,
+					},
+				)
+			issue.submit()
+
+		def get_ledger(item_code):
+			sles = frappe.get_all(
+				"Stock Ledger Entry",
+				filters={"item_code": item_code, "is_cancelled": 0},
+				fields=[
+					"actual_qty",
+					"qty_after_transaction",
+					"incoming_rate",
+					"valuation_rate",
+					"stock_value",
+					"stock_value_difference",
+					"stock_queue",
+				],
+				order_by="timestamp(posting_date, posting_time), creation",
+				as_list=True,
+			)
+			bin_details = frappe.db.get_value(
+				"Bin",
+				{"item_code": item_code, "warehouse": warehouse},
+				["actual_qty", "projected_qty", "valuation_rate", "stock_value"],
+			)
+			return sles, bin_details
+
+		row_wise_item = make_item(properties={"valuation_method": "FIFO"}).name
+		make_entries(row_wise_item)
+
+		bulk_item = make_item(properties={"valuation_method": "FIFO"}).name
+		with patch("erpnext.stock.stock_ledger.BULK_SL_ENTRIES_THRESHOLD", 2), patch(
+			"erpnext.stock.stock_ledger.make_sl_entries_in_bulk", wraps=make_sl_entries_in_bulk
+		) as bulk:
+			make_entries(bulk_item)
+
+		self.assertEqual(bulk.call_count, 2)
+		self.assertEqual(get_ledger(row_wise_item), get_ledger(bulk_item))
+
 
 def create_repack_entry(**args):
 	args = frappe._dict(args)
@@ -17,7 +17,7 @@ from erpnext.stock.doctype.serial_and_batch_bundle.serial_and_batch_bundle impor
 	get_available_serial_nos,
 )
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
-from erpnext.stock.utils import get_stock_balance
+from erpnext.stock.utils import get_stock_balance, get_stock_balances
 
 
 class OpeningEntryAccountError(frappe.ValidationError):
@@ -336,6 +336,15 @@ class StockReconciliation(StockController):
 		item_warehouse_combinations = []
 
 		default_currency = frappe.db.get_default("currency")
+		stock_balances = get_stock_balances(
+			[
+				(row.item_code, row.warehouse)
+				for row in self.items
+				if row.qty and row.valuation_rate in ["", None]
+			],
+			self.posting_date,
+			self.posting_time,
+		)
 
 		for row_num, row in enumerate(self.items):
 			# find duplicates
@@ -380,9 +389,7 @@ class StockReconciliation(StockController):
 				self.validation_messages.append(_get_msg(row_num, _("Negative Valuation Rate is not allowed")))
 
 			if row.qty and row.valuation_rate in ["", None]:
-				row.valuation_rate = get_stock_balance(
-					row.item_code, row.warehouse, self.posting_date, self.posting_time, with_valuation_rate=True
-				)[1]
+				row.valuation_rate = stock_balances[(row.item_code, row.warehouse)].valuation_rate
 				if not row.valuation_rate:
 					# try if there is a buying price list in default currency
 					buying_rate = frappe.db.get_value(
@@ -910,12 +917,17 @@ def get_items(
 
 	res = []
 	itemwise_batch_data = get_itemwise_batch(warehouse, posting_date, company, item_code)
+	stock_balances = get_stock_balances(
+		[(d.item_code, d.warehouse) for d in items],
+		posting_date,
+		posting_time,
+		with_serial_no=any(cint(d.has_serial_no) for d in items),
+	)
 
 	for d in items:
+		stock_bal = stock_balances[(d.item_code, d.warehouse)]
 		if d.item_code in itemwise_batch_data:
-			valuation_rate = get_stock_balance(
-				d.item_code, d.warehouse, posting_date, posting_time, with_valuation_rate=True
-			)[1]
+			valuation_rate = stock_bal.valuation_rate
 
 			for row in itemwise_batch_data.get(d.item_code):
 				if ignore_empty_stock and not row.qty:
@@ -924,21 +936,13 @@ def get_items(
 				args = get_item_data(row, row.qty, valuation_rate)
 				res.append(args)
 		else:
-			stock_bal = get_stock_balance(
-				d.item_code,
-				d.warehouse,
-				posting_date,
-				posting_time,
-				with_valuation_rate=True,
-				with_serial_no=cint(d.has_serial_no),
-			)
 			qty, valuation_rate, serial_no = (
-				stock_bal[0],
-				stock_bal[1],
-				stock_bal[2] if cint(d.has_serial_no) else "",
+				stock_bal.qty,
+				stock_bal.valuation_rate,
+				stock_bal.serial_nos if cint(d.has_serial_no) else "",
 			)
 
-			if ignore_empty_stock and not stock_bal[0]:
+			if ignore_empty_stock and not qty:
 				continue
 
 			args = get_item_data(d, qty, valuation_rate, serial_no)
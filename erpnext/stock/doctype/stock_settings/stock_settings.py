@@ -42,6 +42,7 @@ class StockSettings(Document):
 		enable_stock_reservation: DF.Check
 		item_group: DF.Link | None
 		item_naming_by: DF.Literal["Item Code", "Naming Series"]
+		maintain_daily_stock_movement: DF.Check
 		mr_qty_allowance: DF.Float
 		naming_series_prefix: DF.Data | None
 		over_delivery_receipt_allowance: DF.Float
@@ -99,6 +100,7 @@ class StockSettings(Document):
 		self.validate_warehouses()
 		self.cant_change_valuation_method()
 		self.validate_clean_description_html()
+		self.validate_daily_stock_movement()
 		self.validate_pending_reposts()
 		self.validate_stock_reservation()
 		self.change_precision_for_for_sales()
@@ -144,6 +146,20 @@ class StockSettings(Document):
 				enqueue_after_commit=True,
 			)
 
+	def validate_daily_stock_movement(self):
+		if self.maintain_daily_stock_movement and not self.db_get("maintain_daily_stock_movement"):
+			frappe.enqueue(
+				"erpnext.stock.doctype.daily_stock_movement.daily_stock_movement.rebuild_daily_stock_movement",
+				queue="long",
+				timeout=3600,
+				now=frappe.flags.in_test,
+				enqueue_after_commit=True,
+			)
+			frappe.msgprint(
+				_("Daily Stock Movement is being built from the Stock Ledger in the background."),
+				alert=True,
+			)
+
 	def validate_pending_reposts(self):
 		if self.stock_frozen_upto:
 			check_pending_reposting(self.stock_frozen_upto)
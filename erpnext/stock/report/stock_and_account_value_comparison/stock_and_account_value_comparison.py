@@ -31,9 +31,14 @@ def get_data(report_filters):
 	filters = {
 		"is_cancelled": 0,
 		"company": report_filters.company,
-		"posting_date": ("<=", report_filters.as_on_date),
 	}
 
+	if report_filters.as_on_date:
+		filters["posting_date"] = ("<=", report_filters.as_on_date)
+
+	if report_filters.voucher_nos:
+		filters["voucher_no"] = ("in", report_filters.voucher_nos)
+
 	currency_precision = get_currency_precision() or 2
 	stock_ledger_entries = get_stock_ledger_data(report_filters, filters)
 	voucher_wise_gl_data = get_gl_data(report_filters, filters)
@@ -7,12 +7,15 @@ from typing import Any, Dict, List, Optional, TypedDict
 
 import frappe
 from frappe import _
-from frappe.query_builder import Order
-from frappe.query_builder.functions import Coalesce, CombineDatetime
+from frappe.query_builder import Case, Order
+from frappe.query_builder.functions import Coalesce, CombineDatetime, Max, Sum
 from frappe.utils import add_days, cint, date_diff, flt, getdate
 from frappe.utils.nestedset import get_descendants_of
 
 import erpnext
+from erpnext.stock.doctype.daily_stock_movement.daily_stock_movement import (
+	is_daily_stock_movement_enabled,
+)
 from erpnext.stock.doctype.inventory_dimension.inventory_dimension import get_inventory_dimensions
 from erpnext.stock.doctype.warehouse.warehouse import apply_warehouse_filter
 from erpnext.stock.report.stock_ageing.stock_ageing import FIFOSlots, get_average_age
@@ -49,6 +52,7 @@ class StockBalanceReport(object):
 		self.data = []
 		self.columns = []
 		self.sle_entries: List[SLEntry] = []
+		self.item_warehouse_map = {}
 		self.set_company_currency()
 
 	def set_company_currency(self) -> None:
@@ -61,8 +65,12 @@ class StockBalanceReport(object):
 		self.float_precision = cint(frappe.db.get_default("float_precision")) or 3
 
 		self.inventory_dimensions = self.get_inventory_dimension_fields()
-		self.prepare_opening_data_from_closing_balance()
-		self.prepare_stock_ledger_entries()
+		if self.can_use_daily_stock_movement():
+			self.item_warehouse_map = self.get_item_warehouse_map_from_daily_movement()
+		else:
+			self.prepare_opening_data_from_closing_balance()
+			self.prepare_stock_ledger_entries()
+
 		self.prepare_new_data()
 
 		if not self.columns:
@@ -90,7 +98,7 @@ class StockBalanceReport(object):
 				self.opening_data.setdefault(group_by_key, entry)
 
 	def prepare_new_data(self):
-		if not self.sle_entries:
+		if not self.sle_entries and not self.item_warehouse_map:
 			return
 
 		if self.filters.get("show_stock_ageing_data"):
@@ -99,7 +107,8 @@ class StockBalanceReport(object):
 
 		_func = itemgetter(1)
 
-		self.item_warehouse_map = self.get_item_warehouse_map()
+		if self.sle_entries:
+			self.item_warehouse_map = self.get_item_warehouse_map()
 		sre_details = self.get_sre_reserved_qty_details()
 
 		variant_values = {}
@@ -163,6 +172,93 @@ class StockBalanceReport(object):
 
 		return item_warehouse_map
 
+	def can_use_daily_stock_movement(self) -> bool:
+		"""Stock ageing needs the individual ledger entries and the daily movement is not
+		kept per inventory dimension, so those views are always built from the ledger."""
+
+		if self.filters.get("show_stock_ageing_data"):
+			return False
+
+		if any(self.filters.get(fieldname) for fieldname in self.inventory_dimensions):
+			return False
+
+		return is_daily_stock_movement_enabled()
+
+	def get_item_warehouse_map_from_daily_movement(self):
+		movement = frappe.qb.DocType("Daily Stock Movement")
+		item_table = frappe.qb.DocType("Item")
+
+		before_from_date = movement.posting_date < self.from_date
+		query = (
+			frappe.qb.from_(movement)
+			.inner_join(item_table)
+			.on(movement.item_code == item_table.name)
+			.select(
+				movement.company,
+				movement.item_code,
+				movement.warehouse,
+				item_table.item_group,
+				item_table.stock_uom,
+				item_table.item_name,
+				Sum(Case().when(before_from_date, movement.qty_change).else_(movement.opening_qty)).as_(
+					"opening_qty"
+				),
+				Sum(Case().when(before_from_date, movement.value_change).else_(movement.opening_value)).as_(
+					"opening_val"
+				),
+				Sum(Case().when(before_from_date, 0).else_(movement.in_qty)).as_("in_qty"),
+				Sum(Case().when(before_from_date, 0).else_(movement.in_value)).as_("in_val"),
+				Sum(Case().when(before_from_date, 0).else_(movement.out_qty)).as_("out_qty"),
+				Sum(Case().when(before_from_date, 0).else_(movement.out_value)).as_("out_val"),
+				Sum(movement.qty_change).as_("bal_qty"),
+				Sum(movement.value_change).as_("bal_val"),
+				Max(movement.posting_date).as_("last_posting_date"),
+			)
+			.where(movement.posting_date <= self.to_date)
+			.groupby(movement.company, movement.item_code, movement.warehouse)
+		)
+
+		query = self.apply_warehouse_filters(query, movement)
+		query = self.apply_items_filters(query, item_table)
+
+		if self.filters.get("company"):
+			query = query.where(movement.company == self.filters.get("company"))
+
+		item_warehouse_map = {}
+		for row in query.run(as_dict=True):
+			row.currency = self.company_currency
+			row.opening_fifo_queue = []
+			row.val_rate = 0.0
+			item_warehouse_map[(row.company, row.item_code, row.warehouse)] = row
+
+		self.set_valuation_rate_from_daily_movement(item_warehouse_map)
+
+		for row in item_warehouse_map.values():
+			del row["last_posting_date"]
+
+		return filter_items_with_no_transactions(
+			item_warehouse_map, self.float_precision, self.inventory_dimensions
+		)
+
+	def set_valuation_rate_from_daily_movement(self, item_warehouse_map):
+		items_by_date = {}
+		for row in item_warehouse_map.values():
+			items_by_date.setdefault(row.last_posting_date, set()).add(row.item_code)
+
+		movement = frappe.qb.DocType("Daily Stock Movement")
+		for posting_date, item_codes in items_by_date.items():
+			rates = (
+				frappe.qb.from_(movement)
+				.select(movement.company, movement.item_code, movement.warehouse, movement.valuation_rate)
+				.where((movement.posting_date == posting_date) & (movement.item_code.isin(list(item_codes))))
+				.run(as_dict=True)
+			)
+
+			for rate in rates:
+				row = item_warehouse_map.get((rate.company, rate.item_code, rate.warehouse))
+				if row and row.last_posting_date == posting_date:
+					row.val_rate = rate.valuation_rate
+
 	def get_sre_reserved_qty_details(self) -> dict:
 		from erpnext.stock.doctype.stock_reservation_entry.stock_reservation_entry import (
 			get_sre_reserved_qty_for_items_and_warehouses as get_reserved_qty_details,
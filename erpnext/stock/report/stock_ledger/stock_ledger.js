@@ -91,6 +91,11 @@ frappe.query_reports["Stock Ledger"] = {
 			"options": "Currency\nFloat",
 			"default": "Currency"
 		},
+		{
+			"fieldname": "load_in_pages",
+			"label": __("Load in Pages"),
+			"fieldtype": "Check"
+		},
 	],
 	"formatter": function (value, row, column, data, default_formatter) {
 		value = default_formatter(value, row, column, data);
@@ -103,6 +108,68 @@ frappe.query_reports["Stock Ledger"] = {
 
 		return value;
 	},
+	after_datatable_render: function() {
+		let last_row = (frappe.query_report.data || []).slice(-1)[0];
+		set_stock_ledger_cursor(frappe.query_report, last_row && last_row.next_cursor);
+	},
+	onload: function(report) {
+		report.load_more_button = report.page.add_inner_button(__("Load More"), function() {
+			if (!report.stock_ledger_cursor) return;
+
+			frappe.call({
+				method: "erpnext.stock.report.stock_ledger.stock_ledger.get_stock_ledger_page",
+				args: {
+					filters: report.get_values(),
+					cursor: report.stock_ledger_cursor
+				},
+				freeze: true,
+				callback: function(r) {
+					if (!r.message) return;
+
+					report.data = report.data.concat(r.message.result);
+					report.datatable.refresh(report.data, report.columns);
+					set_stock_ledger_cursor(report, r.message.cursor);
+				}
+			});
+		});
+		report.load_more_button.hide();
+
+		report.page.add_inner_button(__("Export in Background"), function() {
+			frappe.prompt({
+				fieldname: "file_format_type",
+				label: __("File Format"),
+				fieldtype: "Select",
+				options: "CSV\nExcel",
+				default: "CSV",
+				reqd: 1
+			}, (values) => {
+				frappe.call({
+					method: "erpnext.stock.report.stock_ledger.stock_ledger.export_stock_ledger",
+					args: {
+						filters: report.get_values(),
+						file_format_type: values.file_format_type
+					}
+				});
+			}, __("Export Stock Ledger"), __("Export"));
+		});
+
+		frappe.realtime.off("stock_ledger_export_ready");
+		frappe.realtime.on("stock_ledger_export_ready", (data) => {
+			frappe.msgprint({
+				title: __("Stock Ledger Export"),
+				message: __("Your export is ready: {0}", [`<a href="${data.file_url}" target="_blank">${__("Download")}</a>`]),
+				indicator: "green"
+			});
+		});
+	},
 };
 
-erpnext.utils.add_inventory_dimensions('Stock Ledger', 10);
\ No newline at end of file
+erpnext.utils.add_inventory_dimensions('Stock Ledger', 10);
+
+function set_stock_ledger_cursor(report, cursor) {
+	// the cursor is computed by the server, it is missing once all the entries are loaded
+	report.stock_ledger_cursor = cursor || null;
+	if (report.load_more_button) {
+		report.load_more_button.toggle(!!report.stock_ledger_cursor);
+	}
+}
@@ -1,11 +1,13 @@
 # Copyright (c) 2015, Frappe Technologies Pvt. Ltd. and Contributors
 # License: GNU General Public License v3. See license.txt
 
+import copy
+import csv
 
 import frappe
 from frappe import _
 from frappe.query_builder.functions import CombineDatetime
-from frappe.utils import cint, flt
+from frappe.utils import cint, flt, get_datetime, get_files_path
 
 from erpnext.stock.doctype.inventory_dimension.inventory_dimension import get_inventory_dimensions
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
@@ -17,24 +19,53 @@ from erpnext.stock.utils import (
 )
 
 
+STOCK_LEDGER_PAGE_LENGTH = 500
+
+
 def execute(filters=None):
 	is_reposting_item_valuation_in_progress()
-	include_uom = filters.get("include_uom")
 	columns = get_columns(filters)
+
+	# the ledger is only paged when the view asks for it with Load in Pages, so that exports,
+	# prepared and auto email reports always get all the entries
+	page_length = STOCK_LEDGER_PAGE_LENGTH if filters.get("load_in_pages") else None
+	data, cursor = get_data(filters, columns, page_length=page_length)
+
+	message = None
+	if cursor:
+		# the view fetches the next page with the cursor handed over on the last row
+		data[-1]["next_cursor"] = cursor
+		message = _("Showing the first {0} entries, use Load More to see the next ones").format(
+			STOCK_LEDGER_PAGE_LENGTH
+		)
+
+	return columns, data, message
+
+
+def get_data(filters, columns, cursor=None, page_length=None):
+	"""Return the report rows and, when `page_length` is set and more entries remain,
+	the cursor to fetch the next page with. The cursor carries the keyset position
+	and the running balance, so that pages can be computed independently."""
+
+	include_uom = filters.get("include_uom")
 	items = get_items(filters)
-	sl_entries = get_stock_ledger_entries(filters, items)
+	sl_entries = get_stock_ledger_entries(filters, items, cursor, page_length)
+	has_more = page_length and len(sl_entries) == cint(page_length)
+	last_entry = sl_entries[-1] if sl_entries else None
+
 	item_details = get_item_details(items, sl_entries, include_uom)
-	opening_row = get_opening_balance(filters, columns, sl_entries)
 	precision = cint(frappe.db.get_single_value("System Settings", "float_precision"))
 
 	data = []
 	conversion_factors = []
-	if opening_row:
+	actual_qty = stock_value = 0
+
+	if cursor:
+		actual_qty = flt(cursor.get("qty_after_transaction"))
+		stock_value = flt(cursor.get("stock_value"))
+	elif opening_row := get_opening_balance(filters, columns, sl_entries):
 		data.append(opening_row)
 		conversion_factors.append(0)
-
-	actual_qty = stock_value = 0
-	if opening_row:
 		actual_qty = opening_row.get("qty_after_transaction")
 		stock_value = opening_row.get("stock_value")
 
@@ -73,7 +104,114 @@ def execute(filters=None):
 			conversion_factors.append(item_detail.conversion_factor)
 
 	update_included_uom_in_report(columns, data, include_uom, conversion_factors)
-	return columns, data
+
+	next_cursor = None
+	if has_more:
+		next_cursor = {
+			"date": str(last_entry.date),
+			"creation": str(last_entry.creation),
+			"qty_after_transaction": actual_qty,
+			"stock_value": stock_value,
+		}
+
+	return data, next_cursor
+
+
+@frappe.whitelist()
+def get_stock_ledger_page(filters, cursor=None, page_length=STOCK_LEDGER_PAGE_LENGTH):
+	"""Return one page of the Stock Ledger, pass the returned `cursor` to fetch the next one"""
+
+	validate_report_permission()
+	filters = frappe._dict(frappe.parse_json(filters))
+	cursor = frappe.parse_json(cursor) if cursor else None
+
+	is_reposting_item_valuation_in_progress()
+	columns = get_columns(filters)
+	data, cursor = get_data(filters, columns, cursor, cint(page_length) or STOCK_LEDGER_PAGE_LENGTH)
+
+	return {"columns": columns, "result": data, "cursor": cursor}
+
+
+def get_stock_ledger_pages(filters, page_length=STOCK_LEDGER_PAGE_LENGTH):
+	columns = get_columns(filters)
+	cursor = None
+
+	while True:
+		page_columns = copy.deepcopy(columns)
+		data, cursor = get_data(filters, page_columns, cursor, page_length)
+		yield page_columns, data
+
+		if not cursor:
+			break
+
+
+@frappe.whitelist()
+def export_stock_ledger(filters, file_format_type="CSV"):
+	validate_report_permission()
+	if file_format_type not in ("CSV", "Excel"):
+		frappe.throw(_("File format must be CSV or Excel"))
+
+	frappe.enqueue(
+		write_stock_ledger_export,
+		queue="long",
+		timeout=7200,
+		filters=frappe.parse_json(filters),
+		file_format_type=file_format_type,
+	)
+	frappe.msgprint(
+		_(
+			"The Stock Ledger is being exported in the background, you will be notified once it is ready."
+		),
+		alert=True,
+	)
+
+
+def write_stock_ledger_export(filters, file_format_type="CSV"):
+	"""Write the Stock Ledger page by page into a private file, so that the
+	rows are never held in memory all at once."""
+
+	filters = frappe._dict(filters)
+	extension = "xlsx" if file_format_type == "Excel" else "csv"
+	file_name = f"stock-ledger-{frappe.generate_hash(length=10)}.{extension}"
+	file_path = get_files_path(file_name, is_private=1)
+
+	if extension == "xlsx":
+		from openpyxl import Workbook
+
+		workbook = Workbook(write_only=True)
+		sheet = workbook.create_sheet(_("Stock Ledger"))
+		write_pages(filters, sheet.append)
+		workbook.save(file_path)
+	else:
+		with open(file_path, "w", newline="", encoding="utf-8") as f:
+			write_pages(filters, csv.writer(f).writerow)
+
+	file_doc = frappe.get_doc(
+		{
+			"doctype": "File",
+			"file_name": file_name,
+			"file_url": f"/private/files/{file_name}",
+			"is_private": 1,
+		}
+	).insert(ignore_permissions=True)
+
+	frappe.publish_realtime(
+		"stock_ledger_export_ready", {"file_url": file_doc.file_url}, user=frappe.session.user
+	)
+
+
+def write_pages(filters, write_row):
+	for idx, (columns, data) in enumerate(get_stock_ledger_pages(filters)):
+		if not idx:
+			write_row([column.get("label") for column in columns])
+
+		for row in data:
+			write_row([row.get(column.get("fieldname")) for column in columns])
+
+
+def validate_report_permission():
+	if not frappe.get_cached_doc("Report", "Stock Ledger").is_permitted():
+		frappe.throw(_("You are not permitted to access the Stock Ledger"), frappe.PermissionError)
 
 
 def update_available_serial_nos(available_serial_nos, sle):
@@ -277,8 +415,9 @@ def get_columns(filters):
 	return columns
 
 
-def get_stock_ledger_entries(filters, items):
+def get_stock_ledger_entries(filters, items, cursor=None, page_length=None):
 	sle = frappe.qb.DocType("Stock Ledger Entry")
+	posting_datetime = CombineDatetime(sle.posting_date, sle.posting_time)
 	query = (
 		frappe.qb.from_(sle)
 		.select(
@@ -300,16 +439,28 @@ def get_stock_ledger_entries(filters, items):
 			sle.batch_no,
 			sle.serial_no,
 			sle.project,
+			sle.creation,
 		)
 		.where(
 			(sle.docstatus < 2)
 			& (sle.is_cancelled == 0)
 			& (sle.posting_date[filters.from_date : filters.to_date])
 		)
-		.orderby(CombineDatetime(sle.posting_date, sle.posting_time))
+		.orderby(posting_datetime)
 		.orderby(sle.creation)
 	)
 
+	if cursor:
+		last_datetime = get_datetime(cursor.get("date"))
+		last_creation = get_datetime(cursor.get("creation"))
+		query = query.where(
+			(posting_datetime > last_datetime)
+			| ((posting_datetime == last_datetime) & (sle.creation > last_creation))
+		)
+
+	if page_length:
+		query = query.limit(cint(page_length))
+
 	inventory_dimension_fields = get_inventory_dimension_fields()
 	if inventory_dimension_fields:
 		for fieldname in inventory_dimension_fields:
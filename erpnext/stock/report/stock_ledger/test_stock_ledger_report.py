@@ -1,6 +1,8 @@
 # Copyright (c) 2022, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 
+from unittest.mock import patch
+
 import frappe
 from frappe.tests.utils import FrappeTestCase
 from frappe.utils import add_days, today
@@ -9,8 +11,16 @@ from erpnext.maintenance.doctype.maintenance_schedule.test_maintenance_schedule
 	make_serial_item_with_serial,
 )
 from erpnext.stock.doctype.delivery_note.test_delivery_note import create_delivery_note
+from erpnext.stock.doctype.item.test_item import make_item
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
-from erpnext.stock.report.stock_ledger.stock_ledger import execute
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.stock.doctype.warehouse.test_warehouse import create_warehouse
+from erpnext.stock.report.stock_ledger import stock_ledger
+from erpnext.stock.report.stock_ledger.stock_ledger import (
+	execute,
+	get_stock_ledger_page,
+	get_stock_ledger_pages,
+)
 
 
 class TestStockLedgerReeport(FrappeTestCase):
@@ -25,3 +35,60 @@ class TestStockLedgerReeport(FrappeTestCase):
 
 	def tearDown(self) -> None:
 		frappe.db.rollback()
+
+	def test_paginated_stock_ledger(self):
+		item_code = make_item().name
+		for qty in (10, 4, 6, 2, 8):
+			make_stock_entry(item_code=item_code, to_warehouse="_Test Warehouse - _TC", qty=qty, rate=100)
+
+		filters = frappe._dict(
+			company="_Test Company",
+			from_date=today(),
+			to_date=add_days(today(), 30),
+			item_code=item_code,
+			warehouse="_Test Warehouse - _TC",
+		)
+
+		_columns, data, _message = execute(filters)
+		pages = [page for _columns, page in get_stock_ledger_pages(filters, page_length=2)]
+
+		self.assertEqual(len(pages), 3)
+		self.assertEqual([row for page in pages for row in page], data)
+		self.assertEqual(pages[-1][-1].qty_after_transaction, 30)
+
+	def test_stock_ledger_without_item_returns_all_entries(self):
+		filters = self.make_entries_in_new_warehouse()
+
+		with patch.object(stock_ledger, "STOCK_LEDGER_PAGE_LENGTH", 2):
+			_columns, data, message = execute(filters)
+
+		self.assertEqual([row.actual_qty for row in data], [10, 4, 6])
+		self.assertIsNone(message)
+
+	def test_stock_ledger_loaded_in_pages(self):
+		filters = self.make_entries_in_new_warehouse()
+		filters.load_in_pages = 1
+
+		with patch.object(stock_ledger, "STOCK_LEDGER_PAGE_LENGTH", 2):
+			_columns, data, message = execute(filters)
+
+		self.assertEqual(len(data), 2)
+		self.assertTrue(message)
+
+		page = get_stock_ledger_page(frappe.as_json(filters), frappe.as_json(data[-1].next_cursor))
+
+		self.assertEqual([row.actual_qty for row in page["result"]], [6])
+		self.assertEqual(page["result"][0].qty_after_transaction, 6)
+		self.assertIsNone(page["cursor"])
+
+	def make_entries_in_new_warehouse(self):
+		warehouse = create_warehouse("_Test Stock Ledger Paging Warehouse")
+		for qty in (10, 4, 6):
+			make_stock_entry(item_code=make_item().name, to_warehouse=warehouse, qty=qty, rate=100)
+
+		return frappe._dict(
+			company="_Test Company",
+			from_date=today(),
+			to_date=add_days(today(), 30),
+			warehouse=warehouse,
+		)
@@ -4,6 +4,7 @@
 import copy
 import gzip
 import json
+from datetime import timedelta
 from typing import Optional, Set, Tuple
 
 import frappe
@@ -11,10 +12,22 @@ from frappe import _, scrub
 from frappe.model.meta import get_field_precision
 from frappe.query_builder import Case
 from frappe.query_builder.functions import CombineDatetime, Sum
-from frappe.utils import cint, flt, get_link_to_form, getdate, now, nowdate, nowtime, parse_json
+from frappe.utils import (
+	cint,
+	flt,
+	get_datetime,
+	get_link_to_form,
+	getdate,
+	now,
+	nowdate,
+	nowtime,
+)
 
 import erpnext
 from erpnext.stock.doctype.bin.bin import update_qty as update_bin_qty
+from erpnext.stock.doctype.daily_stock_movement.daily_stock_movement import (
+	update_daily_stock_movement,
+)
 from erpnext.stock.doctype.inventory_dimension.inventory_dimension import get_inventory_dimensions
 from erpnext.stock.doctype.serial_and_batch_bundle.serial_and_batch_bundle import (
 	get_available_batches,
@@ -31,6 +44,11 @@ from erpnext.stock.utils import (
 	get_valuation_method,
 )
 from erpnext.stock.valuation import FIFOValuation, LIFOValuation, round_off_if_near_zero
+from erpnext.utilities.submit_profiler import profile_stage
+
+
+REPOSTING_LOG_COMPACTION_INTERVAL = 1000
+BULK_SL_ENTRIES_THRESHOLD = 100
 
 
 class NegativeStockError(frappe.ValidationError):
@@ -41,6 +59,7 @@ class SerialNoExistsInFutureTransaction(frappe.ValidationError):
 	pass
 
 
+@profile_stage("make_sl_entries")
 def make_sl_entries(sl_entries, allow_negative_stock=False, via_landed_cost_voucher=False):
 	"""Create SL entries from SL entry dicts
 
@@ -63,6 +82,11 @@ def make_sl_entries(sl_entries, allow_negative_stock=False, via_landed_cost_vouc
 		args = get_args_for_future_sle(sl_entries[0])
 		future_sle_exists(args, sl_entries)
 
+		if not cancel and can_make_sl_entries_in_bulk(sl_entries, via_landed_cost_voucher):
+			make_sl_entries_in_bulk(sl_entries, allow_negative_stock, via_landed_cost_voucher)
+			return
+
+		stock_item_warehouses = {}
 		for sle in sl_entries:
 			if sle.serial_no and not via_landed_cost_voucher:
 				validate_serial_no(sle)
@@ -97,11 +121,18 @@ def make_sl_entries(sl_entries, allow_negative_stock=False, via_landed_cost_vouc
 				args.reserved_stock = flt(frappe.db.get_value("Bin", bin_name, "reserved_stock"))
 				repost_current_voucher(args, allow_negative_stock, via_landed_cost_voucher)
 				update_bin_qty(bin_name, args)
+
+				key = (args.get("item_code"), args.get("warehouse"))
+				posting_date = getdate(args.get("posting_date"))
+				stock_item_warehouses[key] = min(posting_date, stock_item_warehouses.get(key, posting_date))
 			else:
 				frappe.msgprint(
 					_("Item {0} ignored since it is not a stock item").format(args.get("item_code"))
 				)
 
+		for (item_code, warehouse), posting_date in stock_item_warehouses.items():
+			update_daily_stock_movement(item_code, warehouse, posting_date)
+
 
 def repost_current_voucher(args, allow_negative_stock=False, via_landed_cost_voucher=False):
 	if args.get("actual_qty") or args.get("voucher_type") == "Stock Reconciliation":
@@ -219,6 +250,184 @@ def make_entry(args, allow_negative_stock=False, via_landed_cost_voucher=False):
 	return sle
 
 
+def can_make_sl_entries_in_bulk(sl_entries, via_landed_cost_voucher=False):
+	"""Entries of a voucher can be made in bulk if there are enough of them
+	and none of them needs serial / batch or stock reconciliation handling"""
+	if via_landed_cost_voucher or len(sl_entries) < BULK_SL_ENTRIES_THRESHOLD:
+		return False
+
+	negative_stock_dimensions = [
+		d.fieldname for d in get_inventory_dimensions() if d.get("validate_negative_stock")
+	]
+
+	first_entry = sl_entries[0]
+	for sle in sl_entries:
+		if (
+			not sle.get("actual_qty")
+			or sle.get("voucher_type") == "Stock Reconciliation"
+			or sle.get("serial_no")
+			or sle.get("batch_no")
+			or sle.get("serial_and_batch_bundle")
+			or any(sle.get(fieldname) for fieldname in negative_stock_dimensions)
+		):
+			return False
+
+		# current timestamp reposting in bulk relies on a single posting time per voucher
+		for key in ("voucher_type", "voucher_no", "posting_date", "posting_time"):
+			if sle.get(key) != first_entry.get(key):
+				return False
+
+		item = frappe.get_cached_value(
+			"Item",
+			sle.get("item_code"),
+			["is_stock_item", "has_serial_no", "has_batch_no", "has_variants"],
+			as_dict=1,
+		)
+		if (
+			not item
+			or not item.is_stock_item
+			or item.has_serial_no
+			or item.has_batch_no
+			or item.has_variants
+		):
+			return False
+
+	return True
+
+
+def make_sl_entries_in_bulk(sl_entries, allow_negative_stock=False, via_landed_cost_voucher=False):
+	"""Insert SL entries with multi-row inserts and valuate them per item and warehouse.
+
+	Valuating an entry reprocesses every entry of its item and warehouse at the same
+	posting time, so valuating the last entry of each item and warehouse after all of
+	them are inserted gives the same result as making them one by one."""
+	sle_docs = make_sle_docs(sl_entries, allow_negative_stock, via_landed_cost_voucher)
+	insert_sle_docs(sle_docs)
+
+	sle_docs_by_item_warehouse = {}
+	for sle_doc in sle_docs:
+		key = (sle_doc.item_code, sle_doc.warehouse)
+		sle_docs_by_item_warehouse.setdefault(key, []).append(sle_doc)
+
+	bins = get_bins_for_item_warehouses(list(sle_docs_by_item_warehouse))
+	for (item_code, warehouse), docs in sle_docs_by_item_warehouse.items():
+		bin_details = bins[(item_code, warehouse)]
+		reserved_stock = flt(bin_details.reserved_stock)
+
+		args = docs[-1].as_dict()
+		args.reserved_stock = reserved_stock
+		update_entries_after(
+			{
+				"item_code": item_code,
+				"warehouse": warehouse,
+				"posting_date": args.posting_date,
+				"posting_time": args.posting_time,
+				"voucher_type": args.voucher_type,
+				"voucher_no": args.voucher_no,
+				"sle_id": args.name,
+				"creation": args.creation,
+				"reserved_stock": reserved_stock,
+			},
+			allow_negative_stock=allow_negative_stock,
+			via_landed_cost_voucher=via_landed_cost_voucher,
+		)
+
+		# future qty shifts and negative stock checks stay in row order
+		for sle_doc in docs:
+			row_args = sle_doc.as_dict()
+			row_args.reserved_stock = reserved_stock
+			update_qty_in_future_sle(row_args, allow_negative_stock)
+
+		update_bin_qty(bin_details.name, args)
+		update_daily_stock_movement(item_code, warehouse, getdate(args.posting_date))
+
+
+def make_sle_docs(sl_entries, allow_negative_stock=False, via_landed_cost_voucher=False):
+	"""Build SLE docs and validate them as a set.
+
+	Checks that depend on the item, warehouse and company run once for each of them,
+	links are validated once per distinct combination of link values."""
+	creation = get_datetime()
+	link_fields = [df.fieldname for df in frappe.get_meta("Stock Ledger Entry").get_link_fields()]
+
+	sle_docs = []
+	validated_docs = {}
+	validated_links = set()
+	for idx, sle in enumerate(sl_entries):
+		sle["doctype"] = "Stock Ledger Entry"
+		sle_doc = frappe.get_doc(sle)
+		sle_doc.allow_negative_stock = allow_negative_stock
+		sle_doc.via_landed_cost_voucher = via_landed_cost_voucher
+		sle_doc.to_rename = 1
+		sle_doc.autoname()
+
+		key = (sle_doc.item_code, sle_doc.warehouse, sle_doc.company)
+		if key not in validated_docs:
+			sle_doc.validate()
+			validated_docs[key] = sle_doc
+		else:
+			sle_doc.validate_mandatory()
+			sle_doc.scrub_posting_time()
+			sle_doc.fiscal_year = validated_docs[key].fiscal_year
+
+		links = tuple(sle_doc.get(fieldname) for fieldname in link_fields)
+		if links not in validated_links:
+			sle_doc._validate_links()
+			validated_links.add(links)
+
+		# keep the row order for entries processed against the current timestamp
+		row_creation = creation + timedelta(microseconds=idx)
+		sle_doc.update(
+			{
+				"docstatus": 1,
+				"owner": frappe.session.user,
+				"modified_by": frappe.session.user,
+				"creation": row_creation,
+				"modified": row_creation,
+			}
+		)
+		sle_docs.append(sle_doc)
+
+	if sle_docs:
+		sle_docs[0].check_stock_frozen_date()
+
+	return sle_docs
+
+
+def insert_sle_docs(sle_docs):
+	values = [sle_doc.get_valid_dict(convert_dates_to_str=True) for sle_doc in sle_docs]
+	fields = list(values[0])
+
+	frappe.db.bulk_insert(
+		"Stock Ledger Entry",
+		fields=fields,
+		values=[tuple(row.get(field) for field in fields) for row in values],
+	)
+
+
+def get_bins_for_item_warehouses(item_warehouses):
+	bin = frappe.qb.DocType("Bin")
+	bins = {}
+	for row in (
+		frappe.qb.from_(bin)
+		.select(bin.name, bin.item_code, bin.warehouse, bin.reserved_stock)
+		.where(
+			(bin.item_code.isin([item_code for item_code, warehouse in item_warehouses]))
+			& (bin.warehouse.isin([warehouse for item_code, warehouse in item_warehouses]))
+		)
+		.run(as_dict=True)
+	):
+		bins[(row.item_code, row.warehouse)] = row
+
+	for item_code, warehouse in item_warehouses:
+		if (item_code, warehouse) not in bins:
+			bins[(item_code, warehouse)] = frappe._dict(
+				{"name": get_or_make_bin(item_code, warehouse), "reserved_stock": 0.0}
+			)
+
+	return bins
+
+
 def repost_future_sle(
 	args=None,
 	voucher_type=None,
@@ -259,11 +468,19 @@ def repost_future_sle(
 			allow_negative_stock=allow_negative_stock,
 			via_landed_cost_voucher=via_landed_cost_voucher,
 		)
+		new_transactions = obj.affected_transactions - affected_transactions
 		affected_transactions.update(obj.affected_transactions)
 
-		distinct_item_warehouses[
-			(args[i].get("item_code"), args[i].get("warehouse"))
-		].reposting_status = True
+		item_warehouse = (args[i].get("item_code"), args[i].get("warehouse"))
+		distinct_item_warehouses[item_warehouse].reposting_status = True
+
+		changes = frappe._dict(
+			{
+				"args_idx": set(),
+				"item_warehouses": {item_warehouse} | obj.changed_item_warehouses,
+				"affected_transactions": new_transactions,
+			}
+		)
 
 		if obj.new_items_found:
 			for item_wh, data in distinct_item_warehouses.items():
@@ -272,38 +489,73 @@ def repost_future_sle(
 				):
 					data.args_idx = len(args)
 					args.append(data.sle)
+					changes.args_idx.add(data.args_idx)
+					changes.item_warehouses.add(item_wh)
 				elif data.sle_changed and not data.reposting_status:
 					args[data.args_idx] = data.sle
+					changes.args_idx.add(data.args_idx)
 
 				data.sle_changed = False
 		i += 1
 
 		if doc:
 			update_args_in_repost_item_valuation(
-				doc, i, args, distinct_item_warehouses, affected_transactions
+				doc, i, args, distinct_item_warehouses, affected_transactions, changes=changes
 			)
 
 
 def get_reposting_data(file_path) -> dict:
-	file_name = frappe.db.get_value(
+	"""Returns the reposting state replayed from the reposting log.
+
+	The log is a snapshot in the reposting data file, followed by the changes of every
+	item and warehouse reposted since, kept as Reposting Log Entry."""
+	file = frappe.db.get_value(
 		"File",
 		{
 			"file_url": file_path,
 			"attached_to_field": "reposting_data_file",
 		},
-		"name",
+		["name", "attached_to_name"],
+		as_dict=True,
 	)
 
-	if not file_name:
+	if not file:
 		return frappe._dict()
 
-	attached_file = frappe.get_doc("File", file_name)
+	attached_file = frappe.get_doc("File", file.name)
 
-	data = gzip.decompress(attached_file.get_content())
-	if data := json.loads(data.decode("utf-8")):
-		data = data
+	content = gzip.decompress(attached_file.get_content()).decode("utf-8")
+	data = frappe._dict()
+	apply_reposting_log_entry(data, json.loads(content))
+
+	for log_entry in frappe.get_all(
+		"Reposting Log Entry",
+		filters={"repost_item_valuation": file.attached_to_name},
+		pluck="log_entry",
+		order_by="name",
+	):
+		apply_reposting_log_entry(data, json.loads(log_entry))
 
-	return parse_json(data)
+	return data
+
+
+def apply_reposting_log_entry(data, entry):
+	if not entry.get("is_delta"):
+		data.clear()
+		data.update(entry)
+		return
+
+	args = data.setdefault("items_to_be_repost", [])
+	for idx, sle in sorted(entry["items_to_be_repost"].items(), key=lambda d: cint(d[0])):
+		idx = cint(idx)
+		if idx < len(args):
+			args[idx] = sle
+		else:
+			args.append(sle)
+
+	data.setdefault("distinct_item_and_warehouse", {}).update(entry["distinct_item_and_warehouse"])
+	data.setdefault("affected_transactions", []).extend(entry["affected_transactions"])
+	data.current_index = entry.get("current_index")
 
 
 def validate_item_warehouse(args):
@@ -314,22 +566,11 @@ def validate_item_warehouse(args):
 
 
 def update_args_in_repost_item_valuation(
-	doc, index, args, distinct_item_warehouses, affected_transactions
+	doc, index, args, distinct_item_warehouses, affected_transactions, changes=None
 ):
 	if not doc.items_to_be_repost:
-		file_name = ""
-		if doc.reposting_data_file:
-			file_name = get_reposting_file_name(doc.doctype, doc.name)
-			# frappe.delete_doc("File", file_name, ignore_permissions=True, delete_permanently=True)
-
-		doc.reposting_data_file = create_json_gz_file(
-			{
-				"items_to_be_repost": args,
-				"distinct_item_and_warehouse": {str(k): v for k, v in distinct_item_warehouses.items()},
-				"affected_transactions": affected_transactions,
-			},
-			doc,
-			file_name,
+		update_reposting_log(
+			doc, index, args, distinct_item_warehouses, affected_transactions, changes=changes
 		)
 
 		doc.db_set(
@@ -359,7 +600,6 @@ def update_args_in_repost_item_valuation(
 		"item_reposting_progress",
 		{
 			"name": doc.name,
-			"items_to_be_repost": json.dumps(args, default=str),
 			"current_index": index,
 			"total_reposting_count": len(args),
 		},
@@ -368,6 +608,60 @@ def update_args_in_repost_item_valuation(
 	)
 
 
+def update_reposting_log(
+	doc, index, args, distinct_item_warehouses, affected_transactions, changes=None
+):
+	"""Log the changes of the last reposted item and warehouse as a Reposting Log Entry.
+
+	The log is compacted into the reposting data file every
+	`REPOSTING_LOG_COMPACTION_INTERVAL` entries."""
+	log_entries = cint(doc.flags.reposting_log_entries)
+
+	if (
+		not doc.reposting_data_file
+		or changes is None
+		or log_entries >= REPOSTING_LOG_COMPACTION_INTERVAL
+	):
+		file_name = ""
+		if doc.reposting_data_file:
+			file_name = get_reposting_file_name(doc.doctype, doc.name)
+
+		doc.reposting_data_file = create_json_gz_file(
+			{
+				"current_index": index,
+				"items_to_be_repost": args,
+				"distinct_item_and_warehouse": {str(k): v for k, v in distinct_item_warehouses.items()},
+				"affected_transactions": affected_transactions,
+			},
+			doc,
+			file_name,
+		)
+		clear_reposting_log(doc.name)
+		doc.flags.reposting_log_entries = 0
+		return
+
+	entry = {
+		"is_delta": 1,
+		"current_index": index,
+		"items_to_be_repost": {idx: args[idx] for idx in changes.args_idx},
+		"distinct_item_and_warehouse": {
+			str(k): distinct_item_warehouses[k] for k in changes.item_warehouses
+		},
+		"affected_transactions": changes.affected_transactions,
+	}
+
+	log = frappe.new_doc("Reposting Log Entry")
+	log.repost_item_valuation = doc.name
+	log.log_entry = frappe.as_json(entry, indent=None)
+	log.db_insert()
+
+	doc.flags.reposting_log_entries = log_entries + 1
+
+
+def clear_reposting_log(repost_item_valuation):
+	frappe.db.delete("Reposting Log Entry", {"repost_item_valuation": repost_item_valuation})
+
+
 def get_reposting_file_name(dt, dn):
 	return frappe.db.get_value(
 		"File",
@@ -381,7 +675,7 @@ def get_reposting_file_name(dt, dn):
 
 
 def create_json_gz_file(data, doc, file_name=None) -> str:
-	encoded_content = frappe.safe_encode(frappe.as_json(data))
+	encoded_content = frappe.safe_encode(frappe.as_json(data, indent=None) + "\n")
 	compressed_content = gzip.compress(encoded_content)
 
 	if not file_name:
@@ -415,7 +709,7 @@ def get_items_to_be_repost(voucher_type=None, voucher_no=None, doc=None, reposti
 		reposting_data = get_reposting_data(doc.reposting_data_file)
 
 	if reposting_data and reposting_data.items_to_be_repost:
-		return reposting_data.items_to_be_repost
+		return [frappe._dict(d) for d in reposting_data.items_to_be_repost]
 
 	items_to_be_repost = []
 
@@ -439,7 +733,10 @@ def get_distinct_item_warehouse(args=None, doc=None, reposting_data=None):
 		reposting_data = get_reposting_data(doc.reposting_data_file)
 
 	if reposting_data and reposting_data.distinct_item_and_warehouse:
-		return reposting_data.distinct_item_and_warehouse
+		return {
+			frappe.safe_eval(k): frappe._dict(v)
+			for k, v in reposting_data.distinct_item_and_warehouse.items()
+		}
 
 	distinct_item_warehouses = {}
 
@@ -517,6 +814,7 @@ class update_entries_after(object):
 		self.valuation_method = get_valuation_method(self.item_code)
 
 		self.new_items_found = False
+		self.changed_item_warehouses = set()
 		self.distinct_item_warehouses = args.get("distinct_item_warehouses", frappe._dict())
 		self.affected_transactions: Set[Tuple[str, str]] = set()
 		self.reserved_stock = flt(self.args.reserved_stock)
@@ -588,6 +886,9 @@ class update_entries_after(object):
 				if sle.dependant_sle_voucher_detail_no:
 					entries_to_fix = self.get_dependent_entries_to_fix(entries_to_fix, sle)
 
+			for warehouse in self.data:
+				update_daily_stock_movement(self.item_code, warehouse, self.args.get("posting_date"))
+
 		if self.exceptions:
 			self.raise_exceptions()
 
@@ -653,6 +954,7 @@ class update_entries_after(object):
 	def update_distinct_item_warehouses(self, dependant_sle):
 		key = (dependant_sle.item_code, dependant_sle.warehouse)
 		val = frappe._dict({"sle": dependant_sle})
+		self.changed_item_warehouses.add(key)
 
 		if key not in self.distinct_item_warehouses:
 			self.distinct_item_warehouses[key] = val
@@ -3,7 +3,7 @@ import json
 import frappe
 from frappe.tests.utils import FrappeTestCase
 
-from erpnext.stock.utils import scan_barcode
+from erpnext.stock.utils import get_stock_balance, get_stock_balances, scan_barcode
 
 
 class StockTestMixin:
@@ -81,3 +81,34 @@ class TestStockUtilities(FrappeTestCase, StockTestMixin):
 		self.assertEqual(serial_scan["serial_no"], serial.name)
 		self.assertEqual(serial_scan["has_batch_no"], 0)
 		self.assertEqual(serial_scan["has_serial_no"], 1)
+
+	def test_stock_balances(self):
+		from frappe.utils import add_days, today
+
+		from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+
+		warehouses = ["_Test Warehouse - _TC", "Stores - _TC"]
+		items = [self.make_item(properties={"is_stock_item": 1}).name for i in range(2)]
+
+		for idx, item_code in enumerate(items):
+			make_stock_entry(
+				item_code=item_code,
+				target=warehouses[0],
+				qty=10,
+				rate=100 + idx,
+				posting_date=add_days(today(), -2),
+			)
+			make_stock_entry(item_code=item_code, target=warehouses[0], qty=5, rate=200)
+			make_stock_entry(
+				item_code=item_code, source=warehouses[0], qty=3, posting_date=add_days(today(), -1)
+			)
+
+		item_warehouses = [(item_code, warehouse) for item_code in items for warehouse in warehouses]
+		for posting_date in (add_days(today(), -3), add_days(today(), -1), today()):
+			balances = get_stock_balances(item_warehouses, posting_date, "23:59:59")
+			for item_code, warehouse in item_warehouses:
+				qty, valuation_rate = get_stock_balance(
+					item_code, warehouse, posting_date, "23:59:59", with_valuation_rate=True
+				)
+				balance = balances[(item_code, warehouse)]
+				self.assertEqual((balance.qty, balance.valuation_rate), (qty, valuation_rate))
@@ -140,6 +140,110 @@ def get_stock_balance(
 		return last_entry.qty_after_transaction if last_entry else 0.0
 
 
+def get_stock_balances(
+	item_warehouses, posting_date=None, posting_time=None, with_serial_no=False, chunk_size=500
+):
+	"""Returns stock balance quantity and valuation rate of many item-warehouse pairs
+	at given posting date or current date, keyed by (item_code, warehouse).
+
+	Same as calling `get_stock_balance` for each pair, but the last ledger entry of all
+	pairs is fetched with a window function, a few queries in total."""
+
+	if posting_date is None:
+		posting_date = nowdate()
+	if posting_time is None:
+		posting_time = nowtime()
+
+	item_warehouses = list(dict.fromkeys(tuple(d) for d in item_warehouses))
+	balances = {
+		key: frappe._dict({"qty": 0.0, "valuation_rate": 0.0, "serial_nos": None})
+		for key in item_warehouses
+	}
+
+	for i in range(0, len(item_warehouses), chunk_size):
+		chunk = item_warehouses[i : i + chunk_size]
+		args = {
+			"item_codes": list({item_code for item_code, warehouse in chunk}),
+			"warehouses": list({warehouse for item_code, warehouse in chunk}),
+			"posting_date": posting_date,
+			"posting_time": posting_time,
+		}
+
+		for row in get_last_sle_of_item_warehouses(args):
+			if (key := (row.item_code, row.warehouse)) in balances:
+				balances[key].update(
+					{
+						"qty": row.qty_after_transaction,
+						"valuation_rate": row.valuation_rate,
+						"serial_nos": "" if with_serial_no else None,
+					}
+				)
+
+		if with_serial_no:
+			for key, serial_nos in get_serial_nos_of_item_warehouses(args).items():
+				if key in balances and balances[key].serial_nos is not None:
+					balances[key].serial_nos = "\n".join(serial_nos)
+
+	return balances
+
+
+def get_last_sle_of_item_warehouses(args):
+	return frappe.db.sql(
+		"""
+		select item_code, warehouse, qty_after_transaction, valuation_rate
+		from (
+			select
+				item_code, warehouse, qty_after_transaction, valuation_rate,
+				row_number() over (
+					partition by item_code, warehouse
+					order by timestamp(posting_date, posting_time) desc, creation desc
+				) as row_no
+			from `tabStock Ledger Entry`
+			where
+				item_code in %(item_codes)s
+				and warehouse in %(warehouses)s
+				and is_cancelled = 0
+				and timestamp(posting_date, posting_time) <= timestamp(%(posting_date)s, %(posting_time)s)
+		) last_sle
+		where row_no = 1
+		""",
+		args,
+		as_dict=1,
+	)
+
+
+def get_serial_nos_of_item_warehouses(args):
+	"""Serial nos in stock per item-warehouse, replayed like `get_serial_nos_data_after_transactions`"""
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	stock_ledger_entries = (
+		frappe.qb.from_(sle)
+		.select(sle.item_code, sle.warehouse, sle.serial_no, sle.actual_qty)
+		.where(
+			(sle.item_code.isin(args["item_codes"]))
+			& (sle.warehouse.isin(args["warehouses"]))
+			& (
+				CombineDatetime(sle.posting_date, sle.posting_time)
+				< CombineDatetime(args["posting_date"], args["posting_time"])
+			)
+			& (sle.is_cancelled == 0)
+			& (IfNull(sle.serial_no, "") != "")
+		)
+		.orderby(sle.posting_date, sle.posting_time, sle.creation)
+		.run(as_dict=1)
+	)
+
+	serial_nos = {}
+	for stock_ledger_entry in stock_ledger_entries:
+		key = (stock_ledger_entry.item_code, stock_ledger_entry.warehouse)
+		changed_serial_no = get_serial_nos_data(stock_ledger_entry.serial_no)
+		if stock_ledger_entry.actual_qty > 0:
+			serial_nos.setdefault(key, set()).update(changed_serial_no)
+		else:
+			serial_nos.setdefault(key, set()).difference_update(changed_serial_no)
+
+	return serial_nos
+
+
 def get_serial_nos_data_after_transactions(args):
 
 	serial_nos = set()
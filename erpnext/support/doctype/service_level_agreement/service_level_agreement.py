@@ -2,7 +2,8 @@
 # For license information, please see license.txt
 
 
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
 
 import frappe
 from frappe import _
@@ -247,6 +248,7 @@ class ServiceLevelAgreement(Document):
 
 	def clear_cache(self):
 		get_sla_doctypes.clear_cache()
+		get_working_calendar.clear_cache()
 		return super().clear_cache()
 
 	def create_docfields(self, meta, service_level_agreement_fields):
@@ -637,53 +639,125 @@ def update_response_and_resolution_metrics(doc, apply_sla_for_resolution):
 
 
 def get_expected_time_for(parameter, service_level, start_date_time):
-	current_date_time = start_date_time
-	expected_time = current_date_time
-	start_time = end_time = None
-	expected_time_is_set = 0
-
 	allotted_seconds = get_allotted_seconds(parameter, service_level)
-	support_days = get_support_days(service_level)
-	holidays = get_holidays(service_level.get("holiday_list"))
-	weekdays = get_weekdays()
 
-	while not expected_time_is_set:
-		current_weekday = weekdays[current_date_time.weekday()]
+	if service_level.get("service_level_agreement"):
+		calendar = get_working_calendar(
+			service_level.get("service_level_agreement"), service_level.get("holiday_list")
+		)
+	else:
+		calendar = WorkingCalendar(
+			service_level.get("support_and_resolution"),
+			get_holidays(service_level.get("holiday_list")),
+		)
+
+	return calendar.get_expected_time(start_date_time, allotted_seconds)
 
-		if not is_holiday(current_date_time, holidays) and current_weekday in support_days:
-			if (
-				getdate(current_date_time) == getdate(start_date_time)
-				and get_time_in_timedelta(current_date_time.time()) > support_days[current_weekday].start_time
-			):
-				start_time = current_date_time - datetime(
-					current_date_time.year, current_date_time.month, current_date_time.day
-				)
-			else:
-				start_time = support_days[current_weekday].start_time
 
-			end_time = support_days[current_weekday].end_time
-			time_left_today = time_diff_in_seconds(end_time, start_time)
-			# no time left for support today
-			if time_left_today <= 0:
-				pass
+@redis_cache()
+def get_working_calendar(service_level_agreement, holiday_list):
+	sla = frappe.get_cached_doc("Service Level Agreement", service_level_agreement)
+	return WorkingCalendar(sla.support_and_resolution, get_holidays(holiday_list))
+
+
+class WorkingCalendar:
+	"""
+	Support hours of a Service Level Agreement, with holidays, laid out so that the support
+	seconds between any two dates is a closed-form sum and a deadline is a binary search
+	over days instead of a walk through them.
+	"""
+
+	def __init__(self, support_and_resolution, holidays):
+		weekdays = get_weekdays()
+
+		# support window per `date.weekday()`
+		self.windows = [None] * 7
+		for row in support_and_resolution:
+			self.windows[weekdays.index(row.get("workday"))] = (
+				to_timedelta(row.get("start_time")),
+				to_timedelta(row.get("end_time")),
+			)
+
+		self.day_seconds = [
+			max((window[1] - window[0]).total_seconds(), 0) if window else 0 for window in self.windows
+		]
+		self.week_seconds = sum(self.day_seconds)
+
+		self.holidays = sorted({getdate(holiday) for holiday in holidays})
+		self.holiday_set = set(self.holidays)
+
+		# cumulative support seconds lost to holidays, aligned with `self.holidays`
+		self.holiday_seconds = [0]
+		for holiday in self.holidays:
+			self.holiday_seconds.append(self.holiday_seconds[-1] + self.day_seconds[holiday.weekday()])
+
+	def get_support_seconds(self, from_date, to_date):
+		"""Returns the support seconds in the days from `from_date` up to, not including, `to_date`."""
+		days = (to_date - from_date).days
+		if days <= 0:
+			return 0
+
+		weeks, remaining_days = divmod(days, 7)
+		seconds = weeks * self.week_seconds
+		for day in range(remaining_days):
+			seconds += self.day_seconds[(from_date.weekday() + day) % 7]
+
+		seconds -= (
+			self.holiday_seconds[bisect_left(self.holidays, to_date)]
+			- self.holiday_seconds[bisect_left(self.holidays, from_date)]
+		)
+		return seconds
+
+	def get_expected_time(self, start_date_time, allotted_seconds):
+		if not allotted_seconds or not self.week_seconds:
+			return start_date_time
+
+		start_date = getdate(start_date_time)
+		window = self.windows[start_date.weekday()]
+
+		# support starts mid-day on the first day
+		if window and start_date not in self.holiday_set:
+			start_time, end_time = window
+			if get_time_in_timedelta(start_date_time.time()) > start_time:
+				start_time = start_date_time - datetime(start_date.year, start_date.month, start_date.day)
 
-			elif allotted_seconds:
+			time_left_today = (end_time - start_time).total_seconds()
+			if time_left_today > 0:
 				if time_left_today >= allotted_seconds:
-					expected_time = datetime.combine(getdate(current_date_time), get_time(start_time))
-					expected_time = add_to_date(expected_time, seconds=allotted_seconds)
-					expected_time_is_set = 1
-				else:
-					allotted_seconds = allotted_seconds - time_left_today
+					return self.get_time_within_day(start_date, start_time, end_time, allotted_seconds)
 
-		if not expected_time_is_set:
-			current_date_time = add_to_date(current_date_time, days=1)
+				allotted_seconds -= time_left_today
 
-	if end_time and allotted_seconds >= 86400:
-		current_date_time = datetime.combine(getdate(current_date_time), get_time(end_time))
-	else:
-		current_date_time = expected_time
+		# first day by which the full support days after the start day cover the allotted seconds
+		from_date = start_date + timedelta(days=1)
+		low, high = 0, self.get_max_days_for(from_date, allotted_seconds)
+		while low < high:
+			mid = (low + high) // 2
+			if self.get_support_seconds(from_date, from_date + timedelta(days=mid + 1)) >= allotted_seconds:
+				high = mid
+			else:
+				low = mid + 1
+
+		expected_date = from_date + timedelta(days=low)
+		allotted_seconds -= self.get_support_seconds(from_date, expected_date)
+		start_time, end_time = self.windows[expected_date.weekday()]
+
+		return self.get_time_within_day(expected_date, start_time, end_time, allotted_seconds)
 
-	return current_date_time
+	def get_max_days_for(self, from_date, allotted_seconds):
+		"""Upper bound of days to search, past the last holiday only full weeks count."""
+		days_with_holidays = 0
+		if self.holidays:
+			days_with_holidays = max((self.holidays[-1] - from_date).days + 1, 0)
+
+		return days_with_holidays + 7 * (int(allotted_seconds // self.week_seconds) + 2)
+
+	@staticmethod
+	def get_time_within_day(date, start_time, end_time, allotted_seconds):
+		if allotted_seconds >= 86400:
+			return datetime.combine(date, get_time(end_time))
+
+		return add_to_date(datetime.combine(date, get_time(start_time)), seconds=allotted_seconds)
 
 
 def get_allotted_seconds(parameter, service_level):
@@ -698,18 +772,6 @@ def get_allotted_seconds(parameter, service_level):
 	return allotted_seconds
 
 
-def get_support_days(service_level):
-	support_days = {}
-	for service in service_level.get("support_and_resolution"):
-		support_days[service.workday] = frappe._dict(
-			{
-				"start_time": service.start_time,
-				"end_time": service.end_time,
-			}
-		)
-	return support_days
-
-
 def set_resolution_time(doc):
 	start_date_time = get_datetime(doc.get("service_level_agreement_creation") or doc.creation)
 	if doc.meta.has_field("resolution_time"):
@@ -769,7 +831,11 @@ def get_response_and_resolution_duration(doc):
 	sla = frappe.get_doc("Service Level Agreement", doc.service_level_agreement)
 	priority = sla.get_service_level_agreement_priority(doc.priority)
 	priority.update(
-		{"support_and_resolution": sla.support_and_resolution, "holiday_list": sla.holiday_list}
+		{
+			"service_level_agreement": sla.name,
+			"support_and_resolution": sla.support_and_resolution,
+			"holiday_list": sla.holiday_list,
+		}
 	)
 	return priority
 
@@ -995,10 +1061,6 @@ def update_agreement_status(doc, apply_sla_for_resolution):
 				doc.agreement_status = "Failed"
 
 
-def is_holiday(date, holidays):
-	return getdate(date) in holidays
-
-
 def get_time_in_timedelta(time):
 	"""Converts datetime.time(10, 36, 55, 961454) to datetime.timedelta(seconds=38215)."""
 	import datetime
@@ -2,14 +2,17 @@
 # See license.txt
 
 import datetime
+import random
 import unittest
 
 import frappe
-from frappe.utils import flt
+from frappe.utils import add_to_date, flt, get_time, get_weekdays, getdate, time_diff_in_seconds
 
 from erpnext.support.doctype.issue_priority.test_issue_priority import make_priorities
 from erpnext.support.doctype.service_level_agreement.service_level_agreement import (
+	WorkingCalendar,
 	get_service_level_agreement_fields,
+	get_time_in_timedelta,
 )
 
 
@@ -361,11 +364,93 @@ class TestServiceLevelAgreement(unittest.TestCase):
 		applied_sla = frappe.db.get_value("Lead", lead.name, "service_level_agreement")
 		self.assertFalse(applied_sla)
 
+	def test_working_calendar_against_daily_walk(self):
+		rng = random.Random(42)
+		weekdays = get_weekdays()
+
+		for _ in range(500):
+			support_and_resolution = []
+			for workday in rng.sample(weekdays, rng.randint(1, 7)):
+				start = rng.choice([0, rng.randrange(0, 86340)])
+				end = rng.choice([86400, rng.randrange(start + 60, 86401)])
+				support_and_resolution.append(
+					frappe._dict(
+						workday=workday,
+						start_time=datetime.timedelta(seconds=start),
+						end_time=datetime.timedelta(seconds=end),
+					)
+				)
+
+			holidays = [
+				datetime.date(2024, 1, 1) + datetime.timedelta(days=rng.randrange(0, 400))
+				for _ in range(rng.randint(0, 60))
+			]
+			start_date_time = datetime.datetime(2024, 1, 1) + datetime.timedelta(
+				seconds=rng.randrange(0, 400 * 86400)
+			)
+			allotted_seconds = rng.choice(
+				[rng.randrange(1, 3 * 86400), rng.randrange(1, 40 * 86400), 86400, 8 * 3600]
+			)
+
+			self.assertEqual(
+				WorkingCalendar(support_and_resolution, holidays).get_expected_time(
+					start_date_time, allotted_seconds
+				),
+				get_expected_time_by_daily_walk(
+					allotted_seconds, support_and_resolution, holidays, start_date_time
+				),
+			)
+
 	def tearDown(self):
 		for d in frappe.get_all("Service Level Agreement"):
 			frappe.delete_doc("Service Level Agreement", d.name, force=1)
 
 
+def get_expected_time_by_daily_walk(
+	allotted_seconds, support_and_resolution, holidays, start_date_time
+):
+	"""Reference implementation walking one day at a time, as the deadline used to be computed."""
+	current_date_time = expected_time = start_date_time
+	start_time = end_time = None
+	expected_time_is_set = 0
+
+	support_days = {row.workday: row for row in support_and_resolution}
+	weekdays = get_weekdays()
+
+	while not expected_time_is_set:
+		current_weekday = weekdays[current_date_time.weekday()]
+
+		if getdate(current_date_time) not in holidays and current_weekday in support_days:
+			if (
+				getdate(current_date_time) == getdate(start_date_time)
+				and get_time_in_timedelta(current_date_time.time()) > support_days[current_weekday].start_time
+			):
+				start_time = current_date_time - datetime.datetime(
+					current_date_time.year, current_date_time.month, current_date_time.day
+				)
+			else:
+				start_time = support_days[current_weekday].start_time
+
+			end_time = support_days[current_weekday].end_time
+			time_left_today = time_diff_in_seconds(end_time, start_time)
+
+			if time_left_today > 0:
+				if time_left_today >= allotted_seconds:
+					expected_time = datetime.datetime.combine(getdate(current_date_time), get_time(start_time))
+					expected_time = add_to_date(expected_time, seconds=allotted_seconds)
+					expected_time_is_set = 1
+				else:
+					allotted_seconds = allotted_seconds - time_left_today
+
+		if not expected_time_is_set:
+			current_date_time = add_to_date(current_date_time, days=1)
+
+	if end_time and allotted_seconds >= 86400:
+		return datetime.datetime.combine(getdate(current_date_time), get_time(end_time))
+
+	return expected_time
+
+
 def get_service_level_agreement(
 	default_service_level_agreement=None, entity_type=None, entity=None, doctype="Issue"
 ):
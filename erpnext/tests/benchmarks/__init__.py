@@ -0,0 +1,101 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+"""Benchmarks of core transaction flows on synthetic companies.
+
+Run on a scratch site, e.g.
+
+	bench --site bench.localhost run-benchmarks --scale small --output results.json
+
+The dataset of a scale is generated and committed on the first run and reused
+afterwards. Changes made by the benchmarks themselves are rolled back."""
+
+import json
+import statistics
+import time
+
+import frappe
+from frappe.utils import now
+
+import erpnext
+from erpnext.tests.benchmarks.cases import BENCHMARKS
+from erpnext.tests.benchmarks.dataset import get_params, make_dataset
+
+
+def run(scale="small", benchmarks=None, repeat=3, output=None, seed=0, **overrides):
+	"""Time the benchmarks on the dataset of the scale and return the results as a dict,
+	also written to `output` as JSON if given"""
+	benchmarks = benchmarks or list(BENCHMARKS)
+	unknown = set(benchmarks) - set(BENCHMARKS)
+	if unknown:
+		frappe.throw(
+			f"Unknown benchmarks {', '.join(unknown)}, expected some of {', '.join(BENCHMARKS)}"
+		)
+
+	in_test = frappe.flags.in_test
+	# run reposts inline and keep the helpers from committing, like in tests
+	frappe.flags.in_test = True
+	try:
+		params = get_params(scale, **overrides)
+		dataset = make_dataset(params, seed=seed)
+		frappe.db.commit()
+
+		results = {
+			"scale": scale,
+			"params": {key: value for key, value in params.items() if key != "scale"},
+			"repeat": repeat,
+			"versions": {"frappe": frappe.__version__, "erpnext": erpnext.__version__},
+			"started_at": now(),
+			"benchmarks": {},
+		}
+		for name in benchmarks:
+			results["benchmarks"][name] = run_benchmark(BENCHMARKS[name], dataset, repeat)
+			frappe.db.rollback()
+	finally:
+		frappe.db.rollback()
+		frappe.flags.in_test = in_test
+
+	if output:
+		with open(output, "w") as f:
+			json.dump(results, f, indent=1, default=str)
+
+	return results
+
+
+def run_benchmark(case, dataset, repeat):
+	timings, sql_counts = [], []
+	for _ in range(repeat):
+		fn = case(dataset)
+		queries = QueryCounter()
+		start = time.perf_counter()
+		try:
+			fn()
+		finally:
+			timings.append(time.perf_counter() - start)
+			sql_counts.append(queries.stop())
+
+	return {
+		"min": round(min(timings), 6),
+		"median": round(statistics.median(timings), 6),
+		"max": round(max(timings), 6),
+		"timings": [round(t, 6) for t in timings],
+		"sql_count": round(statistics.median(sql_counts)),
+	}
+
+
+class QueryCounter:
+	"""Number of queries run through `frappe.db.sql` until stopped"""
+
+	def __init__(self):
+		self.count = 0
+		self.sql = frappe.db.sql
+
+		def sql(*args, **kwargs):
+			self.count += 1
+			return self.sql(*args, **kwargs)
+
+		frappe.db.sql = sql
+
+	def stop(self):
+		frappe.db.sql = self.sql
+		return self.count
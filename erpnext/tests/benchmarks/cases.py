@@ -0,0 +1,186 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+"""Benchmarked paths. Each case prepares its documents and returns the function to
+time, so that only the path itself is measured."""
+
+import frappe
+from frappe.core.doctype.report.report import get_report_module_dotted_path
+from frappe.utils import add_days
+
+from erpnext.accounts.doctype.pricing_rule.pricing_rule import apply_pricing_rule
+from erpnext.manufacturing.doctype.production_plan.production_plan import (
+	get_items_for_material_requests,
+)
+from erpnext.manufacturing.doctype.production_plan.test_production_plan import (
+	create_production_plan,
+)
+from erpnext.stock.doctype.repost_item_valuation.repost_item_valuation import repost
+from erpnext.stock.get_item_details import get_item_details
+from erpnext.tests.benchmarks.dataset import (
+	make_purchase_invoice_for,
+	make_receipt,
+	make_sales_invoice,
+)
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+	def decorator(fn):
+		BENCHMARKS[name] = fn
+		return fn
+
+	return decorator
+
+
+@benchmark("submit_stock_entry")
+def submit_stock_entry(dataset):
+	return make_receipt(dataset, dataset.to_date, do_not_submit=True).submit
+
+
+@benchmark("submit_sales_invoice")
+def submit_sales_invoice(dataset):
+	stock = {}
+	make_receipt(dataset, dataset.to_date, stock)
+	return make_sales_invoice(dataset, dataset.to_date, stock, do_not_submit=True).submit
+
+
+@benchmark("submit_purchase_invoice")
+def submit_purchase_invoice(dataset):
+	return make_purchase_invoice_for(dataset, dataset.to_date, do_not_submit=True).submit
+
+
+@benchmark("backdated_repost")
+def backdated_repost(dataset):
+	"""Repost of the whole history after a receipt at its start"""
+	frappe.flags.dont_execute_stock_reposts = True
+	try:
+		se = make_receipt(dataset, add_days(dataset.from_date, 1))
+	finally:
+		frappe.flags.dont_execute_stock_reposts = False
+
+	riv = frappe.get_last_doc(
+		"Repost Item Valuation", filters={"voucher_type": se.doctype, "voucher_no": se.name}
+	)
+	return lambda: repost(riv)
+
+
+@benchmark("get_item_details")
+def get_item_details_of_lines(dataset):
+	args = get_transaction_args(dataset)
+
+	def run():
+		for item_code in get_lines(dataset):
+			get_item_details({**args, "item_code": item_code, "qty": 1})
+
+	return run
+
+
+@benchmark("apply_pricing_rule")
+def apply_pricing_rules_of_lines(dataset):
+	args = get_transaction_args(dataset)
+	args["items"] = [
+		{"doctype": "Sales Invoice Item", "name": f"row-{i}", "item_code": item_code, "qty": 5}
+		for i, item_code in enumerate(get_lines(dataset))
+	]
+	return lambda: apply_pricing_rule(args)
+
+
+@benchmark("production_plan")
+def production_plan(dataset):
+	"""Sub-assemblies and raw materials of the multi-level BOM"""
+	pp = create_production_plan(
+		company=dataset.company,
+		customer=dataset.customers[0],
+		item_code=dataset.fg_item,
+		warehouse=dataset.warehouses[0],
+		planned_qty=10,
+		skip_getting_mr_items=True,
+		do_not_save=True,
+	)
+	pp.for_warehouse = dataset.warehouses[0]
+
+	def run():
+		pp.get_sub_assembly_items()
+		get_items_for_material_requests(pp.as_dict())
+
+	return run
+
+
+def report_benchmark(name, report_name, module, get_filters):
+	def case(dataset):
+		execute = frappe.get_attr(get_report_module_dotted_path(module, report_name) + ".execute")
+		filters = frappe._dict({"company": dataset.company, **get_filters(dataset)})
+		return lambda: execute(filters)
+
+	BENCHMARKS[name] = case
+
+
+def get_ageing_filters(dataset):
+	return {
+		"report_date": dataset.to_date,
+		"ageing_based_on": "Due Date",
+		"range1": 30,
+		"range2": 60,
+		"range3": 90,
+		"range4": 120,
+	}
+
+
+report_benchmark("accounts_receivable", "Accounts Receivable", "Accounts", get_ageing_filters)
+report_benchmark("accounts_payable", "Accounts Payable", "Accounts", get_ageing_filters)
+report_benchmark(
+	"general_ledger",
+	"General Ledger",
+	"Accounts",
+	lambda dataset: {
+		"from_date": dataset.from_date,
+		"to_date": dataset.to_date,
+		"group_by": "Group by Voucher (Consolidated)",
+	},
+)
+report_benchmark(
+	"stock_balance",
+	"Stock Balance",
+	"Stock",
+	lambda dataset: {"from_date": dataset.from_date, "to_date": dataset.to_date},
+)
+report_benchmark(
+	"stock_ageing",
+	"Stock Ageing",
+	"Stock",
+	lambda dataset: {"to_date": dataset.to_date, "range1": 30, "range2": 60, "range3": 90},
+)
+report_benchmark(
+	"gross_profit",
+	"Gross Profit",
+	"Accounts",
+	lambda dataset: {
+		"from_date": dataset.from_date,
+		"to_date": dataset.to_date,
+		"group_by": "Invoice",
+	},
+)
+
+
+def get_lines(dataset):
+	return dataset.items[: dataset.params.lines]
+
+
+def get_transaction_args(dataset):
+	company_currency = frappe.get_cached_value("Company", dataset.company, "default_currency")
+	return {
+		"doctype": "Sales Invoice",
+		"company": dataset.company,
+		"customer": dataset.customers[0],
+		"transaction_date": dataset.to_date,
+		"posting_date": dataset.to_date,
+		"currency": company_currency,
+		"conversion_rate": 1.0,
+		"price_list": frappe.db.get_single_value("Selling Settings", "selling_price_list"),
+		"price_list_currency": company_currency,
+		"plc_conversion_rate": 1.0,
+		"warehouse": dataset.warehouses[0],
+		"selling": 1,
+	}
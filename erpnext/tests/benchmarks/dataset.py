@@ -0,0 +1,400 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+"""Synthetic companies for benchmarks, built with the `make_*` test helpers.
+
+A dataset is one company with its items, warehouses, parties, a multi-level
+BOM and a history of stock entries, invoices and payments. Generation is
+idempotent, so a dataset committed once can be benchmarked again."""
+
+import random
+
+import frappe
+from frappe.utils import add_days, add_months, add_years, get_first_day, getdate, nowdate
+
+from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
+from erpnext.accounts.doctype.pricing_rule.test_pricing_rule import make_pricing_rule
+from erpnext.accounts.doctype.purchase_invoice.test_purchase_invoice import make_purchase_invoice
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+from erpnext.manufacturing.doctype.production_plan.test_production_plan import make_bom
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+
+SCALES = {
+	"tiny": {
+		"items": 5,
+		"warehouses": 2,
+		"customers": 3,
+		"suppliers": 2,
+		"bom_depth": 2,
+		"years": 1,
+		"vouchers_per_month": 2,
+		"pricing_rules": 5,
+		"lines": 5,
+	},
+	"small": {
+		"items": 50,
+		"warehouses": 5,
+		"customers": 20,
+		"suppliers": 10,
+		"bom_depth": 3,
+		"years": 1,
+		"vouchers_per_month": 20,
+		"pricing_rules": 20,
+		"lines": 20,
+	},
+	"medium": {
+		"items": 500,
+		"warehouses": 20,
+		"customers": 200,
+		"suppliers": 50,
+		"bom_depth": 4,
+		"years": 2,
+		"vouchers_per_month": 100,
+		"pricing_rules": 100,
+		"lines": 50,
+	},
+	"large": {
+		"items": 5000,
+		"warehouses": 50,
+		"customers": 2000,
+		"suppliers": 200,
+		"bom_depth": 5,
+		"years": 3,
+		"vouchers_per_month": 500,
+		"pricing_rules": 500,
+		"lines": 100,
+	},
+}
+
+RECEIPT_QTY = 100
+ITEM_RATE = 100
+
+
+def get_params(scale="small", **overrides):
+	if scale not in SCALES:
+		frappe.throw(f"Unknown benchmark scale {scale}, expected one of {', '.join(SCALES)}")
+
+	params = frappe._dict(SCALES[scale])
+	params.update({key: int(value) for key, value in overrides.items() if value is not None})
+	params.scale = scale
+	return params
+
+
+def make_dataset(params, seed=0):
+	"""Company of the scale with its masters and history, created if missing"""
+	dataset = make_company(params)
+	dataset.params = params
+	dataset.random = random.Random(seed)
+
+	dataset.warehouses = make_warehouses(dataset)
+	dataset.items = make_items(dataset)
+	dataset.customers = make_parties(dataset, "Customer", params.customers)
+	dataset.suppliers = make_parties(dataset, "Supplier", params.suppliers)
+	dataset.fg_item = make_boms(dataset)
+	make_pricing_rules(dataset)
+
+	dataset.to_date = getdate(nowdate())
+	dataset.from_date = get_first_day(add_years(dataset.to_date, -params.years))
+	if not frappe.db.exists("GL Entry", {"company": dataset.company}):
+		make_history(dataset)
+
+	return dataset
+
+
+def make_company(params):
+	abbr = f"_BM{params.scale[0].upper()}"
+	company_name = f"_Benchmark Company {params.scale.title()}"
+	if not frappe.db.exists("Company", company_name):
+		frappe.get_doc(
+			{
+				"doctype": "Company",
+				"company_name": company_name,
+				"abbr": abbr,
+				"country": "India",
+				"default_currency": "INR",
+				"create_chart_of_accounts_based_on": "Standard Template",
+				"chart_of_accounts": "Standard",
+			}
+		).insert()
+
+	company = frappe.get_cached_doc("Company", company_name)
+	return frappe._dict(
+		{
+			"company": company.name,
+			"abbr": company.abbr,
+			"cost_center": company.cost_center,
+			"debit_to": company.default_receivable_account,
+			"credit_to": company.default_payable_account,
+			"income_account": company.default_income_account,
+			"expense_account": company.default_expense_account,
+		}
+	)
+
+
+def make_warehouses(dataset):
+	warehouses = []
+	for i in range(dataset.params.warehouses):
+		warehouse_name = f"Benchmark Warehouse {i + 1:03d}"
+		name = f"{warehouse_name} - {dataset.abbr}"
+		if not frappe.db.exists("Warehouse", name):
+			frappe.get_doc(
+				{
+					"doctype": "Warehouse",
+					"warehouse_name": warehouse_name,
+					"parent_warehouse": f"All Warehouses - {dataset.abbr}",
+					"company": dataset.company,
+				}
+			).insert()
+		warehouses.append(name)
+
+	return warehouses
+
+
+def make_items(dataset):
+	items = []
+	for i in range(dataset.params.items):
+		item = make_item(
+			f"_BM-ITEM-{i + 1:05d}",
+			{"is_stock_item": 1, "valuation_rate": ITEM_RATE, "stock_uom": "Nos"},
+		)
+		make_item_price(item.name)
+		items.append(item.name)
+
+	return items
+
+
+def make_item_price(item_code):
+	price_list = frappe.db.get_single_value("Selling Settings", "selling_price_list")
+	if price_list and not frappe.db.exists(
+		"Item Price", {"item_code": item_code, "price_list": price_list}
+	):
+		frappe.get_doc(
+			{
+				"doctype": "Item Price",
+				"item_code": item_code,
+				"price_list": price_list,
+				"price_list_rate": ITEM_RATE * 1.5,
+			}
+		).insert()
+
+
+def make_parties(dataset, party_type, count):
+	group_field, group = (
+		("customer_group", frappe.db.get_value("Customer Group", {"is_group": 0}))
+		if party_type == "Customer"
+		else ("supplier_group", frappe.db.get_value("Supplier Group", {"is_group": 0}))
+	)
+
+	parties = []
+	for i in range(count):
+		name = f"_BM {party_type} {i + 1:05d}"
+		if not frappe.db.exists(party_type, name):
+			frappe.get_doc(
+				{
+					"doctype": party_type,
+					frappe.scrub(party_type) + "_name": name,
+					group_field: group,
+				}
+			).insert()
+		parties.append(name)
+
+	return parties
+
+
+def make_boms(dataset):
+	"""Chain of sub-assemblies `bom_depth` levels deep, each also using two raw materials"""
+	raw_materials = dataset.items[:2]
+	sub_assembly = None
+	for level in range(dataset.params.bom_depth, 0, -1):
+		item_code = f"_BM-SUB-ASSEMBLY-{level}" if level > 1 else "_BM-FINISHED-GOOD"
+		item = make_item(item_code, {"is_stock_item": 1, "valuation_rate": ITEM_RATE})
+		if not item.default_bom:
+			make_bom(
+				item=item.name,
+				raw_materials=raw_materials + ([sub_assembly] if sub_assembly else []),
+				company=dataset.company,
+				currency="INR",
+				rate=ITEM_RATE,
+			)
+		sub_assembly = item.name
+
+	return sub_assembly
+
+
+def make_pricing_rules(dataset):
+	for i in range(dataset.params.pricing_rules):
+		title = f"_BM Pricing Rule {dataset.abbr} {i + 1:05d}"
+		if not frappe.db.exists("Pricing Rule", {"title": title}):
+			make_pricing_rule(
+				title=title,
+				company=dataset.company,
+				apply_on="Item Code",
+				item_code=dataset.items[i % len(dataset.items)],
+				selling=1,
+				discount_percentage=i % 10 + 1,
+				min_qty=i % 5,
+			)
+
+
+def make_history(dataset):
+	"""Stock receipts, invoices and payments spread over every month of the history"""
+	stock = {}
+	month = dataset.from_date
+	while month <= dataset.to_date:
+		for i in range(dataset.params.vouchers_per_month):
+			# in posting order, so that generating the history does not repost
+			posting_date = min(
+				add_days(month, i * 28 // dataset.params.vouchers_per_month), dataset.to_date
+			)
+			voucher_type = ("receipt", "sales", "purchase", "receipt", "sales")[i % 5]
+			if voucher_type == "receipt" or not stock:
+				make_receipt(dataset, posting_date, stock)
+			elif voucher_type == "sales":
+				si = make_sales_invoice(dataset, posting_date, stock)
+				if i % 2:
+					make_payment(si)
+			else:
+				pi = make_purchase_invoice_for(dataset, posting_date)
+				if i % 2:
+					make_payment(pi)
+
+		month = add_months(month, 1)
+
+
+def get_lines(dataset):
+	return dataset.random.sample(dataset.items, min(dataset.params.lines, len(dataset.items)))
+
+
+def make_receipt(dataset, posting_date, stock=None, do_not_submit=False):
+	warehouse = dataset.random.choice(dataset.warehouses)
+	items = get_lines(dataset)
+	se = make_stock_entry(
+		item_code=items[0],
+		qty=RECEIPT_QTY,
+		to_warehouse=warehouse,
+		rate=ITEM_RATE,
+		company=dataset.company,
+		posting_date=posting_date,
+		do_not_save=1,
+	)
+	for item_code in items[1:]:
+		se.append(
+			"items",
+			{
+				"item_code": item_code,
+				"qty": RECEIPT_QTY,
+				"t_warehouse": warehouse,
+				"basic_rate": ITEM_RATE,
+				"conversion_factor": 1,
+				"cost_center": dataset.cost_center,
+				"expense_account": se.items[0].expense_account,
+			},
+		)
+
+	se.insert()
+	if not do_not_submit:
+		se.submit()
+
+	if stock is not None:
+		for item_code in items:
+			stock[(item_code, warehouse)] = stock.get((item_code, warehouse), 0) + RECEIPT_QTY
+
+	return se
+
+
+def make_sales_invoice(dataset, posting_date, stock, do_not_submit=False):
+	"""Invoice that delivers stock received earlier, one unit per line"""
+	in_stock = [pair for pair, qty in stock.items() if qty >= 1]
+	pairs = dataset.random.sample(in_stock, min(dataset.params.lines, len(in_stock)))
+	si = None
+	for item_code, warehouse in pairs:
+		row = {
+			"item_code": item_code,
+			"item_name": item_code,
+			"description": item_code,
+			"warehouse": warehouse,
+			"qty": 1,
+			"rate": ITEM_RATE * 1.5,
+			"income_account": dataset.income_account,
+			"expense_account": dataset.expense_account,
+			"cost_center": dataset.cost_center,
+		}
+		if not si:
+			si = create_sales_invoice(
+				**{key: value for key, value in row.items() if key != "item_code"},
+				item=item_code,
+				company=dataset.company,
+				customer=dataset.random.choice(dataset.customers),
+				debit_to=dataset.debit_to,
+				parent_cost_center=dataset.cost_center,
+				posting_date=posting_date,
+				update_stock=1,
+				naming_series="SINV-BM-.YY.-",
+				do_not_save=1,
+			)
+		else:
+			si.append("items", {**row, "uom": "Nos", "conversion_factor": 1})
+
+		stock[(item_code, warehouse)] -= 1
+
+	si.insert()
+	if not do_not_submit:
+		si.submit()
+
+	return si
+
+
+def make_purchase_invoice_for(dataset, posting_date, do_not_submit=False):
+	items = get_lines(dataset)
+	pi = make_purchase_invoice(
+		item_code=items[0],
+		qty=1,
+		rate=ITEM_RATE,
+		price_list_rate=ITEM_RATE,
+		uom="Nos",
+		company=dataset.company,
+		supplier=dataset.random.choice(dataset.suppliers),
+		warehouse=dataset.warehouses[0],
+		cost_center=dataset.cost_center,
+		posting_date=posting_date,
+		do_not_save=1,
+	)
+	pi.credit_to = dataset.credit_to
+	pi.supplier_warehouse = None
+	for item_code in items[1:]:
+		pi.append(
+			"items",
+			{
+				"item_code": item_code,
+				"qty": 1,
+				"rate": ITEM_RATE,
+				"price_list_rate": ITEM_RATE,
+				"stock_uom": "Nos",
+				"conversion_factor": 1,
+			},
+		)
+	for d in pi.items:
+		d.update(
+			{
+				"warehouse": dataset.warehouses[0],
+				"expense_account": dataset.expense_account,
+				"cost_center": dataset.cost_center,
+			}
+		)
+
+	pi.insert()
+	if not do_not_submit:
+		pi.submit()
+
+	return pi
+
+
+def make_payment(invoice):
+	pe = get_payment_entry(invoice.doctype, invoice.name)
+	pe.posting_date = invoice.posting_date
+	pe.reference_no = invoice.name
+	pe.reference_date = invoice.posting_date
+	pe.insert()
+	pe.submit()
+	return pe
@@ -0,0 +1,24 @@
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.tests.benchmarks import BENCHMARKS, run_benchmark
+from erpnext.tests.benchmarks.dataset import get_params, make_dataset
+
+
+class TestBenchmarks(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_benchmarks_run_on_tiny_dataset(self):
+		dataset = make_dataset(get_params("tiny", years=1))
+		self.assertEqual(len(dataset.items), 5)
+		self.assertTrue(frappe.db.exists("GL Entry", {"company": dataset.company}))
+		self.assertTrue(frappe.db.get_value("Item", dataset.fg_item, "default_bom"))
+
+		for name, case in BENCHMARKS.items():
+			result = run_benchmark(case, dataset, repeat=1)
+			self.assertEqual(len(result["timings"]), 1, name)
+			self.assertGreater(result["sql_count"], 0, name)
+
+	def test_unknown_scale(self):
+		self.assertRaises(frappe.ValidationError, get_params, "huge")
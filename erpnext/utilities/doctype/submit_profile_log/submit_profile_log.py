@@ -0,0 +1,37 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder import DocType, Interval
+from frappe.query_builder.functions import Now
+
+
+class SubmitProfileLog(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		action: DF.Literal["Submit", "Cancel"]
+		line_count: DF.Int
+		reference_doctype: DF.Link | None
+		reference_name: DF.DynamicLink | None
+		sql_count: DF.Int
+		sql_time: DF.Float
+		stages: DF.Code | None
+		wall_time: DF.Float
+	# end: auto-generated types
+
+	@staticmethod
+	def clear_old_logs(days=None):
+		days = days or 30
+		table = DocType("Submit Profile Log")
+		frappe.db.delete(table, filters=(table.modified < (Now() - Interval(days=days))))
+
+
+def on_doctype_update():
+	frappe.db.add_index("Submit Profile Log", ["reference_doctype", "creation"])
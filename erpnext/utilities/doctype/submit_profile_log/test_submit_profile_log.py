@@ -0,0 +1,105 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import json
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.utilities.submit_profiler import get_profile
+
+
+class TestSubmitProfileLog(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_submit_and_cancel_are_profiled(self):
+		item_code = make_item("_Test Submit Profile Item", {"is_stock_item": 1}).name
+		sql = frappe.db.sql
+
+		with patch("erpnext.utilities.submit_profiler.get_sample_rate", return_value=1):
+			se = make_stock_entry(
+				item_code=item_code, target="_Test Warehouse - _TC", qty=5, basic_rate=100
+			)
+			se.cancel()
+
+		# queries are no longer counted once the profile is saved
+		self.assertEqual(frappe.db.sql, sql)
+
+		logs = frappe.get_all(
+			"Submit Profile Log",
+			filters={"reference_doctype": "Stock Entry", "reference_name": se.name},
+			fields=["action", "line_count", "sql_count", "stages"],
+			order_by="action desc",
+		)
+		self.assertEqual([d.action for d in logs], ["Submit", "Cancel"])
+
+		submit_log = logs[0]
+		self.assertEqual(submit_log.line_count, 1)
+		self.assertGreater(submit_log.sql_count, 0)
+
+		stages = json.loads(submit_log.stages)
+		for stage in ("AccountsController.validate", "make_sl_entries"):
+			self.assertIn(stage, stages)
+			self.assertLessEqual(stages[stage]["sql_count"], submit_log.sql_count)
+
+	def test_nested_submits_are_part_of_the_profile(self):
+		item_code = make_item(
+			"_Test Submit Profile Batch Item",
+			{
+				"is_stock_item": 1,
+				"has_batch_no": 1,
+				"create_new_batch": 1,
+				"batch_number_series": "SPL-BATCH-.#####",
+			},
+		).name
+
+		# the Serial and Batch Bundle is submitted during the Stock Entry's submit
+		with patch("erpnext.utilities.submit_profiler.get_sample_rate", return_value=1):
+			se = make_stock_entry(
+				item_code=item_code, target="_Test Warehouse - _TC", qty=5, basic_rate=100
+			)
+
+		bundle = se.items[0].serial_and_batch_bundle
+		self.assertTrue(bundle)
+		self.assertTrue(
+			frappe.db.exists(
+				"Submit Profile Log", {"reference_doctype": "Stock Entry", "reference_name": se.name}
+			)
+		)
+		self.assertFalse(
+			frappe.db.exists(
+				"Submit Profile Log",
+				{"reference_doctype": "Serial and Batch Bundle", "reference_name": bundle},
+			)
+		)
+
+	def test_profile_of_failed_submit_is_dropped(self):
+		item_code = make_item("_Test Submit Profile Item", {"is_stock_item": 1}).name
+		sql = frappe.db.sql
+
+		se = make_stock_entry(
+			item_code=item_code, target="_Test Warehouse - _TC", qty=5, basic_rate=100, do_not_submit=True
+		)
+		with patch("erpnext.utilities.submit_profiler.get_sample_rate", return_value=1), patch.object(
+			type(se), "on_submit", side_effect=frappe.ValidationError
+		):
+			self.assertRaises(frappe.ValidationError, se.submit)
+			self.assertIsNotNone(get_profile())
+
+		frappe.db.rollback()
+		self.assertIsNone(get_profile())
+		self.assertEqual(frappe.db.sql, sql)
+
+	def test_submit_is_not_profiled_without_sample_rate(self):
+		item_code = make_item("_Test Submit Profile Item", {"is_stock_item": 1}).name
+		se = make_stock_entry(item_code=item_code, target="_Test Warehouse - _TC", qty=5, basic_rate=100)
+
+		self.assertFalse(
+			frappe.db.exists(
+				"Submit Profile Log", {"reference_doctype": "Stock Entry", "reference_name": se.name}
+			)
+		)
@@ -0,0 +1,33 @@
+// Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+// For license information, please see license.txt
+
+frappe.query_reports["Submit Profile Summary"] = {
+	filters: [
+		{
+			fieldname: "from_date",
+			label: __("From Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.add_days(frappe.datetime.now_date(), -7),
+			reqd: 1,
+		},
+		{
+			fieldname: "to_date",
+			label: __("To Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.now_date(),
+			reqd: 1,
+		},
+		{
+			fieldname: "reference_doctype",
+			label: __("Document Type"),
+			fieldtype: "Link",
+			options: "DocType",
+		},
+		{
+			fieldname: "action",
+			label: __("Action"),
+			fieldtype: "Select",
+			options: "\nSubmit\nCancel",
+		},
+	],
+};
@@ -0,0 +1,129 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import json
+
+import frappe
+from frappe import _
+from frappe.utils import add_days, flt
+
+from erpnext.utilities.submit_profiler import get_line_count_range
+
+TOTAL_STAGE = "Total"
+
+
+def execute(filters=None):
+	filters = frappe._dict(filters or {})
+	return get_columns(), get_data(filters)
+
+
+def get_columns():
+	return [
+		{
+			"label": _("Document Type"),
+			"fieldname": "reference_doctype",
+			"fieldtype": "Link",
+			"options": "DocType",
+			"width": 150,
+		},
+		{"label": _("Action"), "fieldname": "action", "fieldtype": "Data", "width": 80},
+		{"label": _("Line Count"), "fieldname": "line_count_range", "fieldtype": "Data", "width": 100},
+		{"label": _("Stage"), "fieldname": "stage", "fieldtype": "Data", "width": 240},
+		{"label": _("Documents"), "fieldname": "documents", "fieldtype": "Int", "width": 100},
+		{"label": _("Calls"), "fieldname": "calls", "fieldtype": "Int", "width": 80},
+		{
+			"label": _("Avg Wall Time (s)"),
+			"fieldname": "avg_wall_time",
+			"fieldtype": "Float",
+			"width": 140,
+			"precision": 4,
+		},
+		{
+			"label": _("Max Wall Time (s)"),
+			"fieldname": "max_wall_time",
+			"fieldtype": "Float",
+			"width": 140,
+			"precision": 4,
+		},
+		{
+			"label": _("Avg SQL Count"),
+			"fieldname": "avg_sql_count",
+			"fieldtype": "Float",
+			"width": 120,
+			"precision": 1,
+		},
+		{
+			"label": _("Avg SQL Time (s)"),
+			"fieldname": "avg_sql_time",
+			"fieldtype": "Float",
+			"width": 140,
+			"precision": 4,
+		},
+	]
+
+
+def get_data(filters):
+	conditions = {"creation": ["between", (filters.from_date, add_days(filters.to_date, 1))]}
+	if filters.reference_doctype:
+		conditions["reference_doctype"] = filters.reference_doctype
+	if filters.action:
+		conditions["action"] = filters.action
+
+	groups = {}
+	for log in frappe.get_all(
+		"Submit Profile Log",
+		filters=conditions,
+		fields=[
+			"reference_doctype",
+			"action",
+			"line_count",
+			"wall_time",
+			"sql_count",
+			"sql_time",
+			"stages",
+		],
+	):
+		stages = json.loads(log.stages or "{}")
+		stages[TOTAL_STAGE] = {
+			"calls": 1,
+			"wall_time": log.wall_time,
+			"sql_count": log.sql_count,
+			"sql_time": log.sql_time,
+		}
+
+		line_count_range = get_line_count_range(log.line_count)
+		for stage, stats in stages.items():
+			row = groups.setdefault(
+				(log.reference_doctype, log.action, line_count_range, stage),
+				frappe._dict(
+					{
+						"reference_doctype": log.reference_doctype,
+						"action": log.action,
+						"line_count_range": line_count_range,
+						"stage": stage,
+						"documents": 0,
+						"calls": 0,
+						"wall_time": 0.0,
+						"max_wall_time": 0.0,
+						"sql_count": 0,
+						"sql_time": 0.0,
+					}
+				),
+			)
+			row.documents += 1
+			row.calls += stats.get("calls", 1)
+			row.wall_time += flt(stats.get("wall_time"))
+			row.max_wall_time = max(row.max_wall_time, flt(stats.get("wall_time")))
+			row.sql_count += stats.get("sql_count", 0)
+			row.sql_time += flt(stats.get("sql_time"))
+
+	data = []
+	for row in groups.values():
+		row.avg_wall_time = row.wall_time / row.documents
+		row.avg_sql_count = row.sql_count / row.documents
+		row.avg_sql_time = row.sql_time / row.documents
+		data.append(row)
+
+	# slowest stages first within each group of documents
+	data.sort(key=lambda d: (d.reference_doctype, d.action, d.line_count_range, -d.avg_wall_time))
+	return data
@@ -0,0 +1,185 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: GNU General Public License v3. See license.txt
+
+"""Opt-in timings of the stages of document submit and cancel.
+
+A sample of submits and cancels is profiled when the site config has
+`submit_profiler_sample_rate` (0 to 1) set, e.g.
+
+	bench --site mysite set-config submit_profiler_sample_rate 0.01
+
+For every stage decorated with `profile_stage` the wall time, number of SQL
+queries and SQL time are recorded. Stages are inclusive, so a stage called
+from another one counts towards both. Documents submitted while another one
+is, like the Serial and Batch Bundles of a stock voucher, are part of the
+outer profile. Profiles are saved as Submit Profile Log and logged to the
+`erpnext.submit_profiler` logger."""
+
+import json
+import random
+import time
+from functools import wraps
+
+import frappe
+from frappe.utils import cint, flt
+
+PROFILED_ACTIONS = ("submit", "cancel")
+
+
+class SubmitProfile:
+	def __init__(self, doc, action):
+		self.doc = doc
+		self.action = action
+		self.line_count = get_line_count(doc)
+		self.stages = {}
+		self.sql_count = 0
+		self.sql_time = 0.0
+		self.start = time.perf_counter()
+		self.sql = None
+
+	def patch_sql(self):
+		"""Count and time queries by wrapping `frappe.db.sql`, like the recorder does"""
+		self.sql = frappe.db.sql
+
+		def sql(*args, **kwargs):
+			start = time.perf_counter()
+			try:
+				return self.sql(*args, **kwargs)
+			finally:
+				self.sql_count += 1
+				self.sql_time += time.perf_counter() - start
+
+		frappe.db.sql = sql
+
+	def unpatch_sql(self):
+		if self.sql:
+			frappe.db.sql = self.sql
+			self.sql = None
+
+	def add_stage(self, stage, wall_time, sql_count, sql_time):
+		stats = self.stages.setdefault(
+			stage, {"calls": 0, "wall_time": 0.0, "sql_count": 0, "sql_time": 0.0}
+		)
+		stats["calls"] += 1
+		stats["wall_time"] += wall_time
+		stats["sql_count"] += sql_count
+		stats["sql_time"] += sql_time
+
+	def as_dict(self):
+		return {
+			"reference_doctype": self.doc.doctype,
+			"reference_name": self.doc.name,
+			"action": self.action.title(),
+			"line_count": self.line_count,
+			"wall_time": flt(time.perf_counter() - self.start, 6),
+			"sql_count": self.sql_count,
+			"sql_time": flt(self.sql_time, 6),
+			"stages": {
+				stage: {
+					**stats,
+					"wall_time": flt(stats["wall_time"], 6),
+					"sql_time": flt(stats["sql_time"], 6),
+				}
+				for stage, stats in self.stages.items()
+			},
+		}
+
+
+def get_line_count(doc):
+	for table in ("items", "accounts", "references"):
+		if doc.get(table):
+			return len(doc.get(table))
+
+	return 0
+
+
+def get_sample_rate():
+	return flt(frappe.conf.get("submit_profiler_sample_rate"))
+
+
+def get_profile():
+	return getattr(frappe.local, "submit_profile", None)
+
+
+def start_profile(doc, method=None):
+	"""Hooked to before_validate and before_cancel of all doctypes"""
+	action = doc.get("_action")
+	if action not in PROFILED_ACTIONS or not doc.meta.is_submittable:
+		return
+
+	# documents submitted by the profiled one are part of its profile
+	if get_profile():
+		return
+
+	sample_rate = get_sample_rate()
+	if not sample_rate or random.random() >= sample_rate:
+		return
+
+	profile = SubmitProfile(doc, action)
+	profile.patch_sql()
+	frappe.local.submit_profile = profile
+
+	# a failed submit is rolled back, and its profile is dropped with it
+	frappe.db.after_rollback.add(stop_profile)
+
+
+def finish_profile(doc, method=None):
+	"""Hooked to on_submit and on_cancel of all doctypes, after the controller methods"""
+	profile = get_profile()
+	if not profile or profile.doc is not doc:
+		return
+
+	stop_profile()
+	save_profile(profile.as_dict())
+
+
+def stop_profile():
+	profile = get_profile()
+	if profile:
+		profile.unpatch_sql()
+		frappe.local.submit_profile = None
+
+
+def save_profile(profile):
+	frappe.logger("erpnext.submit_profiler").info(profile)
+
+	log = frappe.new_doc("Submit Profile Log")
+	log.update({**profile, "stages": json.dumps(profile["stages"])})
+	log.flags.ignore_permissions = True
+	log.db_insert()
+
+
+def profile_stage(stage):
+	"""Record the time and queries of the decorated function while a submit is profiled"""
+
+	def decorator(fn):
+		@wraps(fn)
+		def wrapper(*args, **kwargs):
+			profile = get_profile()
+			if not profile:
+				return fn(*args, **kwargs)
+
+			start, sql_count, sql_time = time.perf_counter(), profile.sql_count, profile.sql_time
+			try:
+				return fn(*args, **kwargs)
+			finally:
+				profile.add_stage(
+					stage,
+					time.perf_counter() - start,
+					profile.sql_count - sql_count,
+					profile.sql_time - sql_time,
+				)
+
+		return wrapper
+
+	return decorator
+
+
+def get_line_count_range(line_count):
+	"""Bucket of similar sized documents, for comparing stage costs"""
+	line_count = cint(line_count)
+	for upper_limit in (10, 100, 1000):
+		if line_count <= upper_limit:
+			return f"<= {upper_limit}"
+
+	return "> 1000"